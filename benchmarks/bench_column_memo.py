@@ -0,0 +1,87 @@
+'''
+Benchmark for the memoized validation of low-cardinality columns.
+
+Validates the same rows, drawn from a skewed (Zipf-like) distribution of a few
+hundred distinct values per column, with the table's row validator with and without
+`Column(..., memo_size=...)`, and prints the memos' hit rates.
+
+Run it from the repository root:
+
+    python benchmarks/bench_column_memo.py [--rows 1000000] [--memo-size 256]
+'''
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.table import Column, Table  # noqa: E402
+from pysqlquery.table.base import TableMeta  # noqa: E402
+from pysqlquery.types import Boolean, Char, Date, Decimal, String  # noqa: E402
+
+COLUMNS = {
+    'status': String(10),
+    'country': Char(2),
+    'day': Date(),
+    'price': Decimal(10, 2),
+    'active': Boolean(),
+}
+
+
+def build_table(memo_size: int | None) -> Table:
+    clsdict = {name: Column(sql_type, memo_size=memo_size) for name, sql_type in COLUMNS.items()}
+
+    return TableMeta(f'TbMemo{memo_size}', (Table,), clsdict)(test=True)
+
+
+def build_rows(qty: int) -> list[tuple]:
+    rng = random.Random(0)
+    statuses = [f'status_{i}' for i in range(20)]
+    countries = [chr(65 + i // 26) + chr(65 + i % 26) for i in range(200)]
+    days = [f'2024-{month:02}-{day:02}' for month in range(1, 13) for day in range(1, 32)]
+    prices = [round(rng.uniform(0, 100), 2) for _ in range(300)]
+    weights = [1 / (rank + 1) for rank in range(372)]
+
+    def draw(values: list) -> list:
+        return rng.choices(values, weights[: len(values)], k=qty)
+
+    return list(
+        zip(draw(statuses), draw(countries), draw(days), draw(prices), draw([True, False]))
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Column memo benchmark.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows to validate')
+    parser.add_argument('--memo-size', type=int, default=256, help='memo size of each column')
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    plain_table = build_table(None)
+    memo_table = build_table(args.memo_size)
+
+    timings = {}
+
+    for label, table in (('without memo', plain_table), ('with memo', memo_table)):
+        start = time.perf_counter()
+        result = table.validate_rows(rows)
+        timings[label] = time.perf_counter() - start
+
+    assert result == plain_table.validate_rows(rows)
+
+    print(f'{args.rows} rows, memo_size={args.memo_size}')
+
+    for label, elapsed in timings.items():
+        speedup = timings['without memo'] / elapsed
+        print(f'{label:<13} {elapsed:>8.3f}s ({speedup:.1f}x)')
+
+    for column in memo_table.columns:
+        info = column.memo_info
+        print(f'{column.name:<8} hit rate {info.hits / (info.hits + info.misses):.1%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+'''
+Benchmark for streaming the validation of CSV files.
+
+Writes a gzip compressed CSV file with `--rows` rows to a temporary directory, then
+validates it with `Table.validate_csv`, printing the throughput and the peak of memory
+allocated while validating (which doesn't grow with the file's size).
+
+Run it from the repository root:
+
+    python benchmarks/bench_csv_validation.py [--rows 1000000]
+'''
+
+import argparse
+import csv
+import gzip
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from bench_row_validator import TbBench, build_rows  # noqa: E402
+
+
+def to_csv_field(value: object) -> object:
+    if value is None:
+        return ''
+
+    return int(value) if isinstance(value, bool) else value
+
+
+def write_csv(path: Path, table: TbBench, qty_rows: int) -> None:
+    with gzip.open(path, 'wt', encoding='UTF-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(column.name for column in table.columns)
+
+        for start in range(0, qty_rows, 100_000):
+            rows = build_rows(min(100_000, qty_rows - start))
+            writer.writerows([to_csv_field(value) for value in row] for row in rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='CSV validation benchmark.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows in the CSV file')
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'bench.csv.gz'
+        write_csv(path, table, args.rows)
+
+        start = time.perf_counter()
+        qty_errors = sum(1 for _ in table.validate_csv(path))
+        elapsed = time.perf_counter() - start
+
+        # Measured on a second run, as tracing the allocations slows the validation down.
+        tracemalloc.start()
+        sum(1 for _ in table.validate_csv(path))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f'{args.rows} rows ({path.stat().st_size / 1e6:.1f} MB compressed)')
+        print(f'errors:      {qty_errors}')
+        print(f'time:        {elapsed:.3f}s ({args.rows / elapsed:,.0f} rows/s)')
+        print(f'peak memory: {peak / 1e6:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
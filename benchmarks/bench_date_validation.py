@@ -0,0 +1,67 @@
+'''
+Benchmark for the validation of dates and times.
+
+For 1 million values of each type it compares `datetime.strptime` (the previous
+implementation of `validate_value`), the compiled `validate_value` and
+`validate_values` on a NumPy string array.
+
+Run it from the repository root:
+
+    python benchmarks/bench_date_validation.py
+'''
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.types import Date, DateTime, Time  # noqa: E402
+
+VALUES = 1_000_000
+
+
+def strptime_matches(value: str, pattern: str) -> bool:
+    try:
+        datetime.strptime(value, pattern)
+    except (TypeError, ValueError):
+        return False
+
+    return True
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    start = datetime(1990, 1, 1)
+    seconds = rng.integers(0, 40 * 365 * 86400, VALUES).tolist()
+
+    print(f'{VALUES} values each')
+    print(f'{"type":<10} {"strptime":>10} {"compiled":>10} {"numpy":>10} {"speedup":>8}')
+
+    for sql_type in (Date(), DateTime(), Time()):
+        pattern = sql_type.pattern
+        values = [(start + timedelta(seconds=second)).strftime(pattern) for second in seconds]
+        array = np.array(values)
+
+        strptime_time = timed(lambda: [strptime_matches(value, pattern) for value in values])
+        compiled_time = timed(lambda: sql_type.validate_values(values))
+        numpy_time = timed(lambda: sql_type.validate_values(array))
+
+        print(
+            f'{str(sql_type):<10} {strptime_time:>9.3f}s {compiled_time:>9.3f}s '
+            f'{numpy_time:>9.3f}s {strptime_time / numpy_time:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
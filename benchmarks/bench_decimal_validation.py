@@ -0,0 +1,76 @@
+'''
+Benchmark for the precision and scale checks of the decimal SQL types.
+
+Compares the previous string based `validate_value` (counting the characters of
+`str(value)`) with the arithmetic one, value by value and on a NumPy array, on
+10 million floats by default.
+
+Run it from the repository root:
+
+    python benchmarks/bench_decimal_validation.py [--values 10000000]
+'''
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.types import Decimal  # noqa: E402
+
+
+def legacy_validate_value(value: float | int, precision: int, scale: int | None) -> bool:
+    # The string based implementation replaced by the arithmetic one.
+    if not isinstance(value, (int, float)):
+        return False
+
+    number_str = str(value)
+
+    if len(number_str.replace('.', '')) > precision:
+        return False
+
+    if scale:
+        pos_decimal_sep = number_str.find('.')
+
+        if pos_decimal_sep == -1:
+            return True
+
+        return len(number_str) - pos_decimal_sep - 1 <= scale
+
+    return True
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Decimal validation benchmark.')
+    parser.add_argument('--values', type=int, default=10_000_000, help='values to validate')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    array = np.round(rng.uniform(-1e6, 1e6, args.values), rng.integers(0, 4))
+    values = array.tolist()
+    decimal_type = Decimal(10, 2)
+    precision, scale = decimal_type.precision, decimal_type.scale
+    validate_value = decimal_type.validate_value
+
+    legacy_time = timed(lambda: [legacy_validate_value(v, precision, scale) for v in values])
+    scalar_time = timed(lambda: [validate_value(value) for value in values])
+    numpy_time = timed(lambda: decimal_type.validate_values(array))
+
+    print(f'{args.values} values, {decimal_type}')
+    print(f'legacy str:      {legacy_time:>8.3f}s')
+    print(f'arithmetic:      {scalar_time:>8.3f}s ({legacy_time / scalar_time:.1f}x)')
+    print(f'numpy:           {numpy_time:>8.3f}s ({legacy_time / numpy_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+'''
+Microbenchmark for SQL identifier validation.
+
+Compares an inline `re.search` call (the previous validation) with the shared,
+memoized `is_valid_identifier` on names that repeat like in generated schemas.
+
+Run it from the repository root:
+
+    python benchmarks/bench_identifier.py
+'''
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.utils.identifier import is_valid_identifier  # noqa: E402
+
+NAMES = ['id', 'created_at', 'updated_at', 'name', 'email', 'id_customer', 'status'] * 1_000
+NUMBER = 20
+
+
+def inline_re_search() -> None:
+    for name in NAMES:
+        isinstance(name, str) and re.search(r'^[a-zA-Z][a-zA-Z0-9_]*$', name)
+
+
+def shared_validator() -> None:
+    for name in NAMES:
+        is_valid_identifier(name)
+
+
+def main() -> None:
+    inline_time = min(timeit.repeat(inline_re_search, number=NUMBER, repeat=3))
+    shared_time = min(timeit.repeat(shared_validator, number=NUMBER, repeat=3))
+
+    print(f'{len(NAMES)} names x {NUMBER}')
+    print(f're.search:           {inline_time:.4f}s')
+    print(f'is_valid_identifier: {shared_time:.4f}s')
+    print(f'speedup:             {inline_time / shared_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
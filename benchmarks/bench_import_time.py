@@ -0,0 +1,101 @@
+'''
+Import time benchmark for the `pysqlquery` package.
+
+Runs each import statement in a new interpreter with `python -X importtime` and
+reports the time spent importing the modules that the statement loads (the modules
+already loaded by the interpreter startup are discounted), keeping the best of
+`--repeat` runs.
+
+Pass `--budget-ms` to exit with an error when any statement is slower than the
+budget, e.g. in CI to catch import time regressions.
+
+Run it from the repository root:
+
+    python benchmarks/bench_import_time.py
+'''
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1] / 'src'
+
+STATEMENTS = (
+    'import pysqlquery',
+    'from pysqlquery.types import Integer',
+    'from pysqlquery import Column, Integer, String',
+    'from pysqlquery import Table',
+    'from pysqlquery.constraints import ForeignKeyConstraint',
+)
+
+
+def run_importtime(statement: str) -> list[tuple[str, int, int]]:
+    '''
+    Returns the (module, cumulative microseconds, nesting level) of each import done
+    by a new interpreter that runs `statement`.
+    '''
+
+    code = f'import sys; sys.path.insert(0, {str(SRC_PATH)!r}); {statement}'
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        _, cumulative, module = line.removeprefix('import time:').split('|')
+        level = (len(module) - len(module.lstrip())) // 2
+        imports.append((module.strip(), int(cumulative), level))
+
+    return imports
+
+
+def measure(statement: str, startup_modules: set[str]) -> float:
+    '''
+    Returns the milliseconds spent importing the modules loaded by `statement`.
+    '''
+
+    return (
+        sum(
+            cumulative
+            for module, cumulative, level in run_importtime(statement)
+            if level == 0 and module not in startup_modules
+        )
+        / 1000
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Import time benchmark for pysqlquery.')
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each statement')
+    parser.add_argument(
+        '--budget-ms', type=float, default=None, help='fail if a statement is slower than it'
+    )
+    args = parser.parse_args()
+
+    startup_modules = {module for module, _, _ in run_importtime('pass')}
+    over_budget = False
+
+    for statement in STATEMENTS:
+        best = min(measure(statement, startup_modules) for _ in range(args.repeat))
+        status = ''
+
+        if args.budget_ms is not None and best > args.budget_ms:
+            status = '  over budget'
+            over_budget = True
+
+        print(f'{statement:<56} {best:>8.2f}ms{status}')
+
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+'''
+Benchmark for streaming multi-row INSERT statements.
+
+Renders `--rows` generated rows with `Table.insert_many`, limiting each statement to
+`--max-rows` rows and `--max-bytes` bytes, and prints the quantity of statements, the
+throughput and the peak of memory allocated while rendering (which depends on the
+size of a statement, not on the quantity of rows).
+
+Run it from the repository root:
+
+    python benchmarks/bench_insert_many.py [--rows 1000000] [--max-rows 1000] [--max-bytes 1048576]
+'''
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from bench_row_validator import TbBench, build_rows  # noqa: E402
+
+
+def generate_valid_rows(table: TbBench, qty_rows: int) -> Iterator[tuple[Any, ...]]:
+    rows = [row for row in build_rows(10_000) if table.validate_row(row)]
+
+    for i in range(qty_rows):
+        yield rows[i % len(rows)]
+
+
+def render(table: TbBench, qty_rows: int, max_rows: int, max_bytes: int) -> tuple[int, int]:
+    qty_statements = 0
+    qty_bytes = 0
+
+    for statement in table.insert_many(
+        generate_valid_rows(table, qty_rows), max_rows=max_rows, max_bytes=max_bytes
+    ):
+        qty_statements += 1
+        qty_bytes += len(statement)
+
+    return qty_statements, qty_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Multi-row INSERT benchmark.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows to insert')
+    parser.add_argument('--max-rows', type=int, default=1000, help='maximum rows per statement')
+    parser.add_argument(
+        '--max-bytes', type=int, default=1024 * 1024, help='maximum statement size'
+    )
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+
+    start = time.perf_counter()
+    qty_statements, qty_bytes = render(table, args.rows, args.max_rows, args.max_bytes)
+    elapsed = time.perf_counter() - start
+
+    # Measured on a second run, as tracing the allocations slows the rendering down.
+    tracemalloc.start()
+    render(table, args.rows, args.max_rows, args.max_bytes)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{args.rows} rows, {qty_statements} statements ({qty_bytes / 1e6:.1f} MB)')
+    print(f'time:        {elapsed:.3f}s ({args.rows / elapsed:,.0f} rows/s)')
+    print(f'peak memory: {peak / 1e6:.1f} MB')
+
+
+if __name__ == '__main__':
+    main()
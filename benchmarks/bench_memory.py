@@ -0,0 +1,50 @@
+'''
+Memory benchmark for columns, SQL types and constraints.
+
+Uses `tracemalloc` to measure the memory allocated by many `Column` objects
+(with their SQL type and unnamed FOREIGN KEY) and by named constraints.
+
+Run it from the repository root:
+
+    python benchmarks/bench_memory.py
+'''
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery import Column, ForeignKey, Integer, String  # noqa: E402
+from pysqlquery.constraints import ForeignKeyConstraint, UniqueConstraint  # noqa: E402
+
+OBJECTS = 100_000
+
+
+def measure(label: str, factory) -> None:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    objects = [factory(i) for i in range(OBJECTS)]
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = after - before
+    print(f'{label:<32} {total / 2**20:>8.1f} MiB {total / len(objects):>8.0f} B/object')
+
+
+def main() -> None:
+    print(f'{OBJECTS} objects each')
+    measure('Column(Integer)', lambda i: Column(Integer))
+    measure('Column(String(50))', lambda i: Column(String(50)))
+    measure('Column(Integer, ForeignKey)', lambda i: Column(Integer, ForeignKey('t_other', 'id')))
+    measure('UniqueConstraint', lambda i: UniqueConstraint('un_table_col', 'col'))
+    measure(
+        'ForeignKeyConstraint',
+        lambda i: ForeignKeyConstraint('fk_table_other', 'id_other', 't_other', 'id'),
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+'''
+Benchmark for validating rows in a pool of processes.
+
+Validates the same rows with `Table.validate_rows` in this process and with an
+increasing number of workers, showing the speedup of each one.
+
+Run it from the repository root:
+
+    python benchmarks/bench_parallel_validation.py [--rows 2000000] [--workers 1 2 4 8]
+'''
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from bench_row_validator import TbBench, build_rows  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Parallel validation benchmark.')
+    parser.add_argument('--rows', type=int, default=2_000_000, help='rows to validate')
+    parser.add_argument(
+        '--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='worker counts to test'
+    )
+    parser.add_argument('--chunk-size', type=int, default=None, help='rows per process task')
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+    rows = build_rows(args.rows)
+    expected = None
+    baseline = None
+
+    print(f'{args.rows} rows, {len(table.columns)} columns, {os.cpu_count()} CPUs')
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        result = table.validate_rows(rows, workers=workers, chunk_size=args.chunk_size)
+        elapsed = time.perf_counter() - start
+
+        expected = result if expected is None else expected
+        assert result == expected
+        baseline = baseline or elapsed
+
+        print(f'{workers:>3} workers: {elapsed:>8.3f}s ({baseline / elapsed:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+'''
+Benchmark for rendering values as SQL literals.
+
+Compares, on the columns of the same rows:
+
+- `repr`, the former rendering of DEFAULT values (which isn't valid SQL for every value)
+- the generic renderer of `SQLType`, which checks each value's type
+- `SQLType.render_literals` of each column's SQL type, with its type's fast paths
+
+Run it from the repository root:
+
+    python benchmarks/bench_render_literal.py [--rows 1000000]
+'''
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from bench_row_validator import TbBench, build_rows  # noqa: E402
+
+from pysqlquery.types.base import SQLType  # noqa: E402
+from pysqlquery.utils.dialect import DIALECTS  # noqa: E402
+
+
+def timed(render_column: Callable[[int, list[Any]], list[str]], columns: list[list]) -> float:
+    start = time.perf_counter()
+
+    for i, values in enumerate(columns):
+        render_column(i, values)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='SQL literal rendering benchmark.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows to render')
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+    columns = [list(values) for values in zip(*build_rows(args.rows))]
+    data_types = [column.data_type for column in table.columns]
+    render_any = SQLType._get_literal_renderer(data_types[0], DIALECTS['ansi'])
+
+    repr_time = timed(lambda i, values: [repr(value) for value in values], columns)
+    generic_time = timed(
+        lambda i, values: ['NULL' if value is None else render_any(value) for value in values],
+        columns,
+    )
+    typed_time = timed(lambda i, values: data_types[i].render_literals(values), columns)
+
+    qty_values = args.rows * len(columns)
+
+    print(f'{args.rows} rows, {len(columns)} columns')
+    print(f'repr:            {repr_time:>8.3f}s ({qty_values / repr_time:,.0f} values/s)')
+    print(f'generic:         {generic_time:>8.3f}s ({qty_values / generic_time:,.0f} values/s)')
+    print(f'render_literals: {typed_time:>8.3f}s ({qty_values / typed_time:,.0f} values/s)')
+
+
+if __name__ == '__main__':
+    main()
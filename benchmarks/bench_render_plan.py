@@ -0,0 +1,72 @@
+'''
+Benchmark for table instantiation and rendering on wide tables.
+
+For tables with 10, 100 and 1000 columns it measures:
+
+- instantiating the table class (validating and wiring its named constraints)
+- rendering a new instance, which reuses the class's precompiled render plan
+- rebuilding the render plan from scratch (the cost paid once per table class)
+
+Run it from the repository root:
+
+    python benchmarks/bench_render_plan.py
+'''
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery import Column, ForeignKey, Integer, String, Table  # noqa: E402
+from pysqlquery.constraints import PrimaryKeyConstraint, UniqueConstraint  # noqa: E402
+from pysqlquery.table.base import RenderPlan, TableMeta  # noqa: E402
+
+COLUMN_COUNTS = (10, 100, 1000)
+NUMBER = 200
+
+
+def build_table_class(qty_columns: int) -> type[Table]:
+    clsdict = {'id': Column(Integer, auto_increment='mysql')}
+    constraints = [PrimaryKeyConstraint('pk_bench', 'id')]
+
+    for i in range(1, qty_columns):
+        if i % 10 == 0:
+            clsdict[f'col_{i}'] = Column(Integer, ForeignKey('t_other', 'id'))
+        else:
+            clsdict[f'col_{i}'] = Column(String(50), nullable=i % 2 == 0)
+
+        if i % 25 == 0:
+            constraints.append(UniqueConstraint(f'un_bench_col_{i}', f'col_{i}'))
+
+    clsdict['__constraints__'] = constraints
+
+    return TableMeta(f'TbBench{qty_columns}', (Table,), clsdict)
+
+
+def main() -> None:
+    print(f'{"columns":>8} {"instantiate":>14} {"render":>14} {"plan rebuild":>14}')
+
+    for qty_columns in COLUMN_COUNTS:
+        table_cls = build_table_class(qty_columns)
+        table = table_cls(test=True)
+
+        def instantiate() -> None:
+            table_cls(test=True)
+
+        def render() -> None:
+            str(table_cls(test=True))
+
+        def rebuild_plan() -> None:
+            RenderPlan(table.tablename, table.columns, table.named_constraints).render(False)
+
+        results = [
+            min(timeit.repeat(function, number=NUMBER, repeat=3)) / NUMBER * 1e6
+            for function in (instantiate, render, rebuild_plan)
+        ]
+
+        print(f'{qty_columns:>8}' + ''.join(f'{result:>12.1f}us' for result in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+'''
+Benchmark for validating rows against a table's columns.
+
+Compares, on the same rows:
+
+- a Python loop over `table.columns` calling `validate_value` and checking `nullable`
+- a validator written by hand for the table
+- the validator compiled by `Table.compile_validator`
+
+Run it from the repository root:
+
+    python benchmarks/bench_row_validator.py [--rows 1000000]
+'''
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.table import Column, Table  # noqa: E402
+from pysqlquery.types import (  # noqa: E402
+    Boolean,
+    Char,
+    Date,
+    Decimal,
+    Integer,
+    String,
+)
+
+
+class TbBench(Table):
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50))
+    country = Column(Char(2))
+    price = Column(Decimal(10, 2))
+    birth = Column(Date, nullable=True)
+    active = Column(Boolean)
+
+
+PRICE_TYPE = Decimal(10, 2)
+BIRTH_TYPE = Date()
+
+
+def validate_with_loop(table: Table, row: Sequence[Any]) -> int:
+    errors = 0
+
+    for i, (column, value) in enumerate(zip(table.columns, row)):
+        if value is None:
+            if not column.nullable:
+                errors |= 1 << i
+        elif not column.data_type.validate_value(value):
+            errors |= 1 << i
+
+    return errors
+
+
+def validate_by_hand(row: Sequence[Any]) -> int:
+    id_, name, country, price, birth, active = row
+    errors = 0
+
+    if not (isinstance(id_, int)):
+        errors |= 1
+    if not (isinstance(name, str) and len(name) <= 50):
+        errors |= 2
+    if not (isinstance(country, str) and len(country) <= 2):
+        errors |= 4
+    if not (price is not None and PRICE_TYPE.validate_value(price)):
+        errors |= 8
+    if not (birth is None or BIRTH_TYPE.validate_value(birth)):
+        errors |= 16
+    if not (active is True or active is False):
+        errors |= 32
+
+    return errors
+
+
+def build_rows(qty: int) -> list[tuple]:
+    rng = random.Random(0)
+
+    return [
+        (
+            i,
+            f'customer {i}',
+            rng.choice(['BR', 'US', 'PT', 'USA']),
+            round(rng.uniform(0, 10_000), rng.choice([1, 2, 3])),
+            rng.choice([None, '1990-05-17', '2001-02-29']),
+            rng.random() < 0.5,
+        )
+        for i in range(qty)
+    ]
+
+
+def timed(validate_row: Callable[[Sequence[Any]], int], rows: list[tuple]) -> float:
+    start = time.perf_counter()
+
+    for row in rows:
+        validate_row(row)
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Row validator benchmark.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows to validate')
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+    rows = build_rows(args.rows)
+    compiled = table.compile_validator()
+
+    assert all(compiled(row) == validate_with_loop(table, row) for row in rows[:10_000])
+
+    loop_time = timed(lambda row: validate_with_loop(table, row), rows)
+    hand_time = timed(validate_by_hand, rows)
+    compiled_time = timed(compiled, rows)
+
+    print(f'{args.rows} rows, {len(table.columns)} columns')
+    print(f'loop over columns: {loop_time:>8.3f}s')
+    print(f'hand-written:      {hand_time:>8.3f}s ({loop_time / hand_time:.1f}x)')
+    print(f'compiled:          {compiled_time:>8.3f}s ({loop_time / compiled_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
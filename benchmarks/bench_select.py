@@ -0,0 +1,57 @@
+'''
+Benchmark for building and compiling SELECT queries.
+
+Builds `--queries` queries with the same structure and different values, as a hot
+request path does, and compiles them with and without the query cache (resized to 0).
+
+Run it from the repository root:
+
+    python benchmarks/bench_select.py [--queries 200000]
+'''
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from bench_row_validator import TbBench  # noqa: E402
+
+from pysqlquery.table.select import Select  # noqa: E402
+
+
+def build_and_compile(table: TbBench, qty_queries: int) -> float:
+    start = time.perf_counter()
+
+    for i in range(qty_queries):
+        table.select('id', 'name', 'price').where(
+            TbBench.country.in_(['BR', 'US', 'PT']),
+            TbBench.price.between(i, i + 100) | TbBench.birth.is_null(),
+        ).order_by('-price', 'id').limit(50, i).compile()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='SELECT query compilation benchmark.')
+    parser.add_argument('--queries', type=int, default=200_000, help='queries to compile')
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+    maxsize = Select.cache.maxsize
+
+    cached_time = build_and_compile(table, args.queries)
+    info = Select.cache.info
+
+    Select.cache.resize(0)
+    uncached_time = build_and_compile(table, args.queries)
+    Select.cache.resize(maxsize)
+
+    print(f'{args.queries} queries ({info.hits} cache hits, {info.misses} misses)')
+    print(f'cached:   {cached_time:.3f}s ({args.queries / cached_time:,.0f} queries/s)')
+    print(f'uncached: {uncached_time:.3f}s ({args.queries / uncached_time:,.0f} queries/s)')
+
+
+if __name__ == '__main__':
+    main()
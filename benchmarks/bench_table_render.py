@@ -0,0 +1,65 @@
+'''
+Benchmark for repeated `str(table)` renders.
+
+Compares rebuilding the CREATE TABLE query from scratch on every call with the
+caches used by `Table.__str__`.
+
+Run it from the repository root:
+
+    python benchmarks/bench_table_render.py
+'''
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery import Column, ForeignKey, Integer, String, Table  # noqa: E402
+from pysqlquery.constraints import UniqueConstraint  # noqa: E402
+from pysqlquery.table.base import RenderPlan, TableMeta  # noqa: E402
+
+TABLES = 1_000
+RENDERS = 10
+
+
+def build_tables(qty_tables: int) -> list[Table]:
+    tables = []
+
+    for i in range(qty_tables):
+        clsdict = {
+            '__tablename__': f't_bench_{i}',
+            'id': Column(Integer, primary_key=True, auto_increment='mysql'),
+            'name': Column(String(50)),
+            'email': Column(String(255)),
+            'id_parent': Column(Integer, ForeignKey('t_parent', 'id')),
+            '__constraints__': [UniqueConstraint(f'un_bench_{i}_email', 'email')],
+        }
+        table_cls = TableMeta(f'TbBench{i}', (Table,), clsdict)
+        tables.append(table_cls(test=True))
+
+    return tables
+
+
+def main() -> None:
+    tables = build_tables(TABLES)
+
+    def uncached() -> None:
+        for table in tables:
+            RenderPlan(table.tablename, table.columns, table.named_constraints).render(False)
+
+    def cached() -> None:
+        for table in tables:
+            str(table)
+
+    uncached_time = min(timeit.repeat(uncached, number=RENDERS, repeat=3))
+    cached_time = min(timeit.repeat(cached, number=RENDERS, repeat=3))
+
+    print(f'{TABLES} tables x {RENDERS} renders')
+    print(f'uncached: {uncached_time:.4f}s')
+    print(f'cached:   {cached_time:.4f}s')
+    print(f'speedup:  {uncached_time / cached_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+'''
+Benchmark for bulk validation with `validate_values`.
+
+For 1 million values of each type it compares validating value by value with
+`validate_value`, validating a list with `validate_values` and validating a NumPy
+array with `validate_values` (the vectorized path).
+
+Run it from the repository root:
+
+    python benchmarks/bench_validate_values.py
+'''
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.types import Bit, Char, Decimal, Double, Integer, String  # noqa: E402
+
+VALUES = 1_000_000
+
+
+def build_cases(rng: np.random.Generator) -> list[tuple[str, object, np.ndarray]]:
+    words = np.array(['', 'a', 'abc', 'abcdefgh', 'abcdefghijklmnop'])
+
+    return [
+        ('Integer(6)', Integer(6), rng.integers(-(10**7), 10**7, VALUES)),
+        ('Bit()', Bit(), rng.integers(0, 3, VALUES)),
+        ('Decimal(8, 2)', Decimal(8, 2), np.round(rng.uniform(-1e6, 1e6, VALUES), 3)),
+        ('Double(10, 4)', Double(10, 4), rng.uniform(-1e6, 1e6, VALUES)),
+        ('String(10)', String(10), rng.choice(words, VALUES)),
+        ('Char(3)', Char(3), rng.choice(words, VALUES)),
+    ]
+
+
+def timed(function) -> float:
+    start = time.perf_counter()
+    function()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print(f'{VALUES} values each')
+    print(f'{"type":<16} {"validate_value":>15} {"list":>10} {"numpy":>10} {"speedup":>8}')
+
+    for label, sql_type, array in build_cases(rng):
+        values = array.tolist()
+        validate_value = sql_type.validate_value
+
+        loop_time = timed(lambda: [validate_value(value) for value in values])
+        list_time = timed(lambda: sql_type.validate_values(values))
+        numpy_time = timed(lambda: sql_type.validate_values(array))
+
+        print(
+            f'{label:<16} {loop_time:>14.3f}s {list_time:>9.3f}s {numpy_time:>9.3f}s '
+            f'{loop_time / numpy_time:>7.1f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
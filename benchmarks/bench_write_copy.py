@@ -0,0 +1,49 @@
+'''
+Benchmark for writing the data files of bulk loaders.
+
+Writes `--rows` generated rows with `Table.write_copy` in each format to a temporary
+file and prints the throughput of each one.
+
+Run it from the repository root:
+
+    python benchmarks/bench_write_copy.py [--rows 1000000]
+'''
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from bench_insert_many import generate_valid_rows  # noqa: E402
+from bench_row_validator import TbBench  # noqa: E402
+from pysqlquery.table.base import COPY_FORMATS  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='COPY / LOAD DATA file benchmark.')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='rows to write')
+    args = parser.parse_args()
+
+    table = TbBench(test=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.txt')
+
+        for format in COPY_FORMATS:
+            start = time.perf_counter()
+            table.write_copy(generate_valid_rows(table, args.rows), path, format=format)
+            elapsed = time.perf_counter() - start
+            size = os.path.getsize(path)
+
+            print(
+                f'{format:<13} {elapsed:.3f}s ({args.rows / elapsed:,.0f} rows/s, '
+                f'{size / 1e6:.1f} MB)'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+'''
+Compares two JSON result files written by `run.py`.
+
+For each phase it prints the best time per operation of both runs and the speedup of
+the second run over the first one (above 1.00x is faster).
+
+Run it from the repository root:
+
+    python benchmarks/compare.py before.json after.json
+'''
+
+import argparse
+import json
+from pathlib import Path
+
+
+def load_results(path: Path) -> dict[str, dict[str, float]]:
+    return json.loads(path.read_text(encoding='UTF-8'))['results']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compares two benchmark runs.')
+    parser.add_argument('before', type=Path, help='JSON results of the baseline run')
+    parser.add_argument('after', type=Path, help='JSON results of the new run')
+    args = parser.parse_args()
+
+    before, after = load_results(args.before), load_results(args.after)
+
+    print(f'{"phase":<32} {"before":>12} {"after":>12} {"speedup":>8}')
+
+    for phase, result in after.items():
+        if phase not in before:
+            print(f'{phase:<32} {"-":>12} {result["per_op_us"]:>10.2f}us {"-":>8}')
+            continue
+
+        before_us, after_us = before[phase]['per_op_us'], result['per_op_us']
+
+        print(
+            f'{phase:<32} {before_us:>10.2f}us {after_us:>10.2f}us {before_us / after_us:>7.2f}x'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+'''
+Benchmark suite for the schema definition, rendering and validation hot paths.
+
+Generates a synthetic schema (see `schema.py`) and times each phase separately:
+
+- `column_init` - `Column.__init__`
+- `table_meta` - `TableMeta` class creation
+- `table_init_first` - the first `Table.__init__` of a class (validation and wiring of
+  the named constraints)
+- `table_init` - the following `Table.__init__` calls (validation only)
+- `str_table_first` - the first `str(table)` of a class (builds its render plan)
+- `str_table` - `str(table)` on a new instance of an already rendered class
+- `create_query_all_tables` - rendering the whole registry
+- `save_all_tables` - writing the whole registry to a file
+- `validate_value.<type>` - `validate_value` of each concrete SQL type
+
+Every phase runs on a fresh schema `--repeat` times. The results are written as JSON,
+so runs can be compared over time with `compare.py`.
+
+Run it from the repository root:
+
+    python benchmarks/run.py --tables 200 --columns 20 --constraints 3 --output before.json
+'''
+
+import argparse
+import json
+import platform
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from schema import build_clsdict, build_columns, build_schema, build_table_class
+
+from pysqlquery.table import Table
+from pysqlquery.types import (
+    Bit,
+    Boolean,
+    Char,
+    Date,
+    DateTime,
+    Decimal,
+    Double,
+    Float,
+    Integer,
+    Real,
+    String,
+    Time,
+)
+
+VALIDATE_VALUE_SAMPLES = {
+    'Bit': (Bit(), [0, 1, 2, 'a']),
+    'Boolean': (Boolean(), [True, False, 1, 'a']),
+    'Char': (Char(10), ['abc', 'abcdefghij', 'abcdefghijk', 10]),
+    'Date': (Date(), ['2024-01-31', '2024-02-30', '31/01/2024', 20240131]),
+    'DateTime': (DateTime(), ['2024-01-31 12:30:00', '2024-01-31 25:00:00', '2024-01-31']),
+    'Decimal': (Decimal(10, 2), [1234.56, 12345678.9, 123456789.123, 'a']),
+    'Double': (Double(10, 2), [1234.56, 12345678.9, 123456789.123, 'a']),
+    'Float': (Float(10, 2), [1234.56, 12345678.9, 123456789.123, 'a']),
+    'Integer': (Integer(8), [42, -12345678, 123456789, 4.5]),
+    'Real': (Real(10, 2), [1234.56, 12345678.9, 123456789.123, 'a']),
+    'String': (String(255), ['abc', 'a' * 255, 'a' * 256, 10]),
+    'Time': (Time(), ['12:30:00', '24:00:00', '12:30', 1230]),
+}
+
+
+def measure(
+    run: Callable[[Any], None], ops: int, repeat: int, setup: Callable[[], Any] = lambda: None
+) -> dict[str, float]:
+    '''
+    Times `run(setup())` `repeat` times, calling `setup` outside of the timed region.
+    '''
+
+    timings = []
+
+    for _ in range(repeat):
+        state = setup()
+
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+
+    return {
+        'ops': ops,
+        'best_s': best,
+        'mean_s': statistics.fmean(timings),
+        'per_op_us': best / ops * 1e6,
+    }
+
+
+def instantiate(table_classes: list[type[Table]]) -> list[Table]:
+    return [table_cls(test=True) for table_cls in table_classes]
+
+
+def render(tables: list[Table]) -> None:
+    for table in tables:
+        str(table)
+
+
+def register(table_classes: list[type[Table]]) -> None:
+    Table._tables[:] = instantiate(table_classes)
+
+
+def bench_schema(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    qty_tables, qty_columns, qty_constraints = args.tables, args.columns, args.constraints
+    repeat = args.repeat
+
+    def new_schema() -> list[type[Table]]:
+        return build_schema(qty_tables, qty_columns, qty_constraints)
+
+    def new_clsdicts() -> list[dict]:
+        return [build_clsdict(i, qty_columns, qty_constraints) for i in range(qty_tables)]
+
+    def new_wired_schema() -> list[type[Table]]:
+        table_classes = new_schema()
+        instantiate(table_classes)
+
+        return table_classes
+
+    def new_rendered_schema() -> list[type[Table]]:
+        table_classes = new_schema()
+        render(instantiate(table_classes))
+
+        return table_classes
+
+    def new_registry() -> None:
+        register(new_schema())
+
+    results = {
+        'column_init': measure(
+            lambda _: [build_columns(i, qty_columns) for i in range(qty_tables)],
+            qty_tables * qty_columns,
+            repeat,
+        ),
+        'table_meta': measure(
+            lambda clsdicts: [build_table_class(i, d) for i, d in enumerate(clsdicts)],
+            qty_tables,
+            repeat,
+            new_clsdicts,
+        ),
+        'table_init_first': measure(instantiate, qty_tables, repeat, new_schema),
+        'table_init': measure(instantiate, qty_tables, repeat, new_wired_schema),
+        'str_table_first': measure(render, qty_tables, repeat, lambda: instantiate(new_schema())),
+        'str_table': measure(
+            render, qty_tables, repeat, lambda: instantiate(new_rendered_schema())
+        ),
+        'create_query_all_tables': measure(
+            lambda _: Table.create_query_all_tables, qty_tables, repeat, new_registry
+        ),
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'tables.sql'
+        results['save_all_tables'] = measure(
+            lambda _: Table.save_all_tables(path), qty_tables, repeat, new_registry
+        )
+
+    return results
+
+
+def bench_validate_value(args: argparse.Namespace) -> dict[str, dict[str, float]]:
+    results = {}
+
+    for type_name, (sql_type, samples) in VALIDATE_VALUE_SAMPLES.items():
+        validate_value = sql_type.validate_value
+        values = samples * (args.values // len(samples))
+
+        def run(_, validate_value=validate_value, values=values) -> None:
+            for value in values:
+                validate_value(value)
+
+        results[f'validate_value.{type_name}'] = measure(run, len(values), args.repeat)
+
+    return results
+
+
+def get_metadata(args: argparse.Namespace) -> dict[str, Any]:
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'parameters': {
+            'tables': args.tables,
+            'columns': args.columns,
+            'constraints': args.constraints,
+            'values': args.values,
+            'repeat': args.repeat,
+        },
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--tables', type=int, default=100, help='tables in the schema')
+    parser.add_argument('--columns', type=int, default=20, help='columns per table')
+    parser.add_argument(
+        '--constraints', type=int, default=3, help='named constraints per table (0 for none)'
+    )
+    parser.add_argument(
+        '--values', type=int, default=10_000, help='values validated per SQL type'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='repetitions of each phase')
+    parser.add_argument(
+        '--output', type=Path, default=None, help='JSON file for the results (default stdout)'
+    )
+
+    args = parser.parse_args(argv)
+
+    for name in ('tables', 'columns', 'values', 'repeat'):
+        if getattr(args, name) < 1:
+            parser.error(f'--{name} must be a positive integer')
+
+    if args.constraints < 0:
+        parser.error('--constraints must not be negative')
+
+    return args
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    registry = Table._tables[:]
+
+    try:
+        results = {**bench_schema(args), **bench_validate_value(args)}
+    finally:
+        Table._tables[:] = registry
+
+    report = json.dumps({'metadata': get_metadata(args), 'results': results}, indent=2)
+
+    if args.output is None:
+        print(report)
+    else:
+        args.output.write_text(report + '\n', encoding='UTF-8')
+
+
+if __name__ == '__main__':
+    main()
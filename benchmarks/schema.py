@@ -0,0 +1,121 @@
+'''
+Synthetic schema generator for the benchmarks.
+
+Builds `tables` table classes with `columns` columns and up to `constraints` named
+constraints each. Column types cycle through the concrete SQL types, every table but
+the first has a FOREIGN KEY to the previous one, and the named constraints are a
+PRIMARY KEY plus UNIQUE constraints on the following columns.
+'''
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from pysqlquery.constraints import (  # noqa: E402
+    ForeignKey,
+    PrimaryKeyConstraint,
+    UniqueConstraint,
+)
+from pysqlquery.constraints.base.named_constraint import NamedConstraint  # noqa: E402
+from pysqlquery.table import Column, Table  # noqa: E402
+from pysqlquery.table.base import TableMeta  # noqa: E402
+from pysqlquery.types import (  # noqa: E402
+    Char,
+    Date,
+    DateTime,
+    Decimal,
+    Double,
+    Integer,
+    String,
+    Time,
+)
+
+COLUMN_TYPES = (
+    String(255),
+    Integer,
+    Decimal(10, 2),
+    Date,
+    Char(2),
+    DateTime,
+    Double(12, 4),
+    Time,
+)
+
+
+def get_table_name(table_index: int) -> str:
+    return f't_bench_{table_index}'
+
+
+def build_columns(table_index: int, qty_columns: int) -> dict[str, Column]:
+    '''
+    Returns the columns of the synthetic table `table_index`, by attribute name.
+
+    The first column is the `id` and, except for the first table, the second one is a
+    FOREIGN KEY to the previous table.
+    '''
+
+    columns = {'id': Column(Integer, auto_increment='mysql')}
+
+    if table_index and qty_columns > 1:
+        columns['id_parent'] = Column(
+            Integer, ForeignKey(get_table_name(table_index - 1), 'id'), nullable=True
+        )
+
+    for i in range(len(columns), qty_columns):
+        data_type = COLUMN_TYPES[i % len(COLUMN_TYPES)]
+        columns[f'col_{i}'] = Column(data_type, nullable=i % 3 == 0)
+
+    return columns
+
+
+def build_constraints(
+    table_index: int, column_names: list[str], qty_constraints: int
+) -> list[NamedConstraint] | None:
+    '''
+    Returns up to `qty_constraints` named constraints for the synthetic table
+    `table_index`: a PRIMARY KEY on `id` and UNIQUE constraints on the other columns.
+    '''
+
+    if not qty_constraints:
+        return None
+
+    table_name = get_table_name(table_index)
+    constraints = [PrimaryKeyConstraint(f'pk_{table_name}', 'id')]
+
+    for column_name in column_names[1 : qty_constraints]:
+        constraints.append(UniqueConstraint(f'un_{table_name}_{column_name}', column_name))
+
+    return constraints
+
+
+def build_clsdict(table_index: int, qty_columns: int, qty_constraints: int) -> dict:
+    '''
+    Returns the class namespace of the synthetic table `table_index`.
+
+    Columns can be bound to a single table class, so each namespace must be used by
+    one `TableMeta` call only.
+    '''
+
+    clsdict = build_columns(table_index, qty_columns)
+    constraints = build_constraints(table_index, list(clsdict), qty_constraints)
+
+    clsdict['__tablename__'] = get_table_name(table_index)
+    clsdict['__constraints__'] = constraints
+
+    return clsdict
+
+
+def build_table_class(table_index: int, clsdict: dict) -> type[Table]:
+    return TableMeta(f'TbBench{table_index}', (Table,), clsdict)
+
+
+def build_schema(qty_tables: int, qty_columns: int, qty_constraints: int) -> list[type[Table]]:
+    '''
+    Returns `qty_tables` synthetic table classes.
+    '''
+
+    return [
+        build_table_class(i, build_clsdict(i, qty_columns, qty_constraints))
+        for i in range(qty_tables)
+    ]
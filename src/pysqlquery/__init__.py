@@ -11,6 +11,37 @@ Github link https://github.com/Alberto-Frigatto/PySQLQuery
 PyPi link https://pypi.org/project/pysqlquery/
 '''
 
-from .constraints import ForeignKey
-from .table import Column, Table
-from .types import Char, Date, DateTime, Float, Integer, String
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .constraints import ForeignKey
+    from .table import Column, Table
+    from .types import Char, Date, DateTime, Float, Integer, String
+
+__all__ = [
+    'ForeignKey',
+    'Column',
+    'Table',
+    'Char',
+    'Date',
+    'DateTime',
+    'Float',
+    'Integer',
+    'String',
+]
+
+_LAZY_ATTRS = {
+    'ForeignKey': '.constraints',
+    'Column': '.table',
+    'Table': '.table',
+    'Char': '.types',
+    'Date': '.types',
+    'DateTime': '.types',
+    'Float': '.types',
+    'Integer': '.types',
+    'String': '.types',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
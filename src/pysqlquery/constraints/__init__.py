@@ -9,9 +9,26 @@ There are these classes:
 - `UniqueConstraint` - for named UNIQUE constraint
 '''
 
-from .unnamed import ForeignKey
-from .named import (
-    ForeignKeyConstraint,
-    PrimaryKeyConstraint,
-    UniqueConstraint
-)
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .named import ForeignKeyConstraint, PrimaryKeyConstraint, UniqueConstraint
+    from .unnamed import ForeignKey
+
+__all__ = [
+    'ForeignKey',
+    'ForeignKeyConstraint',
+    'PrimaryKeyConstraint',
+    'UniqueConstraint',
+]
+
+_LAZY_ATTRS = {
+    'ForeignKey': '.unnamed',
+    'ForeignKeyConstraint': '.named',
+    'PrimaryKeyConstraint': '.named',
+    'UniqueConstraint': '.named',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
@@ -15,6 +15,8 @@ class Constraint(metaclass=ABCMeta):
     This class must be inherited by abstract one.
     '''
 
+    __slots__ = ()
+
     @abstractmethod
     def __str__(self) -> str:
         '''
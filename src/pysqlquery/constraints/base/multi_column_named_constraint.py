@@ -2,9 +2,9 @@
 Defines the abstract base class for constructing multi column named SQL constraint classes.
 '''
 
-import re
 from abc import ABCMeta
 
+from ...utils.identifier import is_valid_identifier
 from ..exceptions.multi_column_named_constraint import InvalidColumnType
 from ..exceptions.named_constraint import InvalidColumnName
 from .named_constraint import NamedConstraint
@@ -21,6 +21,8 @@ class MultiColumnNamedConstraint(NamedConstraint, metaclass=ABCMeta):
     This class must be inherited by concrete or another abstract one.
     '''
 
+    __slots__ = ('_column',)
+
     def __init__(self, name: str, column: str | list[str]) -> None:
         '''
         Parameters
@@ -58,9 +60,7 @@ class MultiColumnNamedConstraint(NamedConstraint, metaclass=ABCMeta):
         return isinstance(column, (str, list))
 
     def _is_column_name_valid(self, column_name: str) -> bool:
-        return isinstance(column_name, str) and bool(
-            re.search(r'^[a-zA-Z_][a-zA-Z0-9_]*$', column_name)
-        )
+        return is_valid_identifier(column_name, allow_leading_underscore=True)
 
     def _handle_column(self, column: str | list[str]) -> str | list[str]:
         if isinstance(column, str):
@@ -2,9 +2,9 @@
 Defines the abstract base class for constructing named SQL constraint classes.
 '''
 
-import re
 from abc import ABCMeta
 
+from ...utils.identifier import is_valid_identifier
 from ..exceptions.named_constraint import InvalidConstraintName
 from .constraint import Constraint
 
@@ -19,6 +19,8 @@ class NamedConstraint(Constraint, metaclass=ABCMeta):
     This class must be inherited by abstract one.
     '''
 
+    __slots__ = ('_name',)
+
     def __init__(self, name: str) -> None:
         '''
         Parameters
@@ -40,7 +42,7 @@ class NamedConstraint(Constraint, metaclass=ABCMeta):
             raise InvalidConstraintName(name)
 
     def _is_name_valid(self, name: str) -> bool:
-        return isinstance(name, str) and re.search(r'^[a-zA-Z][a-zA-Z0-9_]*$', name)
+        return is_valid_identifier(name)
 
     @property
     def name(self) -> str:
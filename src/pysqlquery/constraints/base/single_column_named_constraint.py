@@ -2,9 +2,9 @@
 Defines the abstract base class for constructing single column named SQL constraint classes.
 '''
 
-import re
 from abc import ABCMeta
 
+from ...utils.identifier import is_valid_identifier
 from ..exceptions.named_constraint import InvalidColumnName
 from .named_constraint import NamedConstraint
 
@@ -20,6 +20,8 @@ class SingleColumnNamedConstraint(NamedConstraint, metaclass=ABCMeta):
     This class must be inherited by concrete or another abstract one.
     '''
 
+    __slots__ = ('_column',)
+
     def __init__(self, name: str, column: str) -> None:
         '''
         Parameters
@@ -43,7 +45,7 @@ class SingleColumnNamedConstraint(NamedConstraint, metaclass=ABCMeta):
             raise InvalidColumnName(super().name, column_name)
 
     def _is_column_name_valid(self, column_name: str) -> bool:
-        return isinstance(column_name, str) and re.search(r'^[a-zA-Z][a-zA-Z0-9_]*$', column_name)
+        return is_valid_identifier(column_name)
 
     @property
     def column(self) -> str:
@@ -2,9 +2,9 @@
 Defines the abstract base class for constructing unnamed SQL constraint classes.
 '''
 
-import re
 from abc import ABCMeta
 
+from ...utils.identifier import is_valid_identifier
 from ..exceptions.unnamed_constraint import InvalidAddedColumnName
 from .constraint import Constraint
 
@@ -20,6 +20,8 @@ class UnnamedConstraint(Constraint, metaclass=ABCMeta):
     This class must be inherited by concrete or another abstract one.
     '''
 
+    __slots__ = ('_column_name',)
+
     def __init__(self) -> None:
         super().__init__()
         self._column_name: str = None
@@ -40,7 +42,7 @@ class UnnamedConstraint(Constraint, metaclass=ABCMeta):
             raise InvalidAddedColumnName(column_name)
 
     def _is_column_name_valid(self, column_name: str) -> bool:
-        return isinstance(column_name, str) and re.search(r'^[a-zA-Z][a-zA-Z0-9_]*$', column_name)
+        return is_valid_identifier(column_name)
 
     @property
     def column(self) -> str:
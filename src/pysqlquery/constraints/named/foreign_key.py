@@ -2,9 +2,9 @@
 Defines the ForeignKeyConstraint class for constructing named FOREIGN KEY SQL constraint.
 '''
 
-import re
 from typing import Literal
 
+from ...utils.identifier import is_valid_identifier
 from ..base import MultiColumnNamedConstraint
 from ..exceptions.named_foreign_key import (
     InvalidOnDeleteClause,
@@ -28,6 +28,8 @@ class ForeignKeyConstraint(MultiColumnNamedConstraint):
     specific to the named FOREIGN KEY constraint.
     '''
 
+    __slots__ = ('_ref_table', '_ref_column', '_on_delete', '_on_update')
+
     def __init__(
         self,
         name: str,
@@ -126,7 +128,7 @@ class ForeignKeyConstraint(MultiColumnNamedConstraint):
             raise InvalidRefTable(super().name, ref_table)
 
     def _is_ref_table_valid(self, ref_table: str) -> bool:
-        return isinstance(ref_table, str) and re.search(r'^[a-zA-Z_][a-zA-Z0-9_]*$', ref_table)
+        return is_valid_identifier(ref_table, allow_leading_underscore=True)
 
     def _validate_ref_column(self, ref_column: str | list[str]) -> None:
         if not super()._is_column_of_a_allowed_type(ref_column):
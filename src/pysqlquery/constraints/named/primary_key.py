@@ -15,6 +15,8 @@ class PrimaryKeyConstraint(MultiColumnNamedConstraint):
     specific to the named PRIMARY KEY constraint.
     '''
 
+    __slots__ = ()
+
     def __init__(self, name: str, column: str | list[str]) -> None:
         '''
         Parameters
@@ -15,6 +15,8 @@ class UniqueConstraint(SingleColumnNamedConstraint):
     specific to the named UNIQUE constraint.
     '''
 
+    __slots__ = ()
+
     def __init__(self, name: str, column: str) -> None:
         '''
         Parameters
@@ -2,9 +2,9 @@
 Defines the ForeignKey class for constructing unnamed FOREIGN KEY SQL constraint.
 '''
 
-import re
 from typing import Literal
 
+from ...utils.identifier import is_valid_identifier
 from ..base import UnnamedConstraint
 from ..exceptions.unnamed_foreign_key import (
     InvalidOnDeleteClause,
@@ -25,6 +25,8 @@ class ForeignKey(UnnamedConstraint):
     specific to the unnamed FOREIGN KEY constraint.
     '''
 
+    __slots__ = ('_ref_table', '_ref_column', '_on_delete', '_on_update')
+
     def __init__(
         self,
         ref_table: str,
@@ -87,14 +89,14 @@ class ForeignKey(UnnamedConstraint):
             raise InvalidRefTable(ref_table)
 
     def _is_ref_table_valid(self, ref_table: str) -> bool:
-        return isinstance(ref_table, str) and re.search(r'^[a-zA-Z_][a-zA-Z0-9_]*$', ref_table)
+        return is_valid_identifier(ref_table, allow_leading_underscore=True)
 
     def _validate_ref_column(self, ref_column: str) -> None:
         if not self._is_ref_column_valid(ref_column):
             raise InvalidRefColumn(self._ref_table, ref_column)
 
     def _is_ref_column_valid(self, ref_column: str) -> bool:
-        return isinstance(ref_column, str) and re.search(r'^[a-zA-Z_][a-zA-Z0-9_]*$', ref_column)
+        return is_valid_identifier(ref_column, allow_leading_underscore=True)
 
     def _validate_on_delete(self, on_delete: str | None) -> None:
         if not self._is_on_clause_valid(on_delete):
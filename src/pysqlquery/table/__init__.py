@@ -5,7 +5,32 @@ There are these classes:
 
 - `Table` - Represents SQL tables
 - `Column` - Represents SQL table's columns
+- `Select` - Represents SELECT queries of SQL tables
+- `Condition` - Represents conditions of WHERE clauses
 '''
 
-from .column import Column
-from .table import Table
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .column import Column
+    from .condition import Condition
+    from .select import Select
+    from .table import Table
+
+__all__ = [
+    'Column',
+    'Condition',
+    'Select',
+    'Table',
+]
+
+_LAZY_ATTRS = {
+    'Column': '.column',
+    'Condition': '.condition',
+    'Select': '.select',
+    'Table': '.table',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
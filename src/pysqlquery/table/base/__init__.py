@@ -1 +1,8 @@
+from .copy_format import COPY_FORMATS, CopyFormat
+from .csv_error import CsvError
+from .error_bitmap import ErrorBitmap
+from .error_report import ErrorCode, ErrorReport, ValidationError
+from .query_cache import QueryCache
+from .render_plan import RenderPlan
+from .row_validator import RowValidator, compile_row_validator
 from .table_meta import TableMeta
@@ -0,0 +1,185 @@
+'''
+Defines the CopyFormat classes for writing the data files of bulk loaders (COPY, LOAD DATA).
+'''
+
+import re
+from abc import ABCMeta, abstractmethod
+from typing import Any, Callable
+
+from ...types import Boolean
+from ...types.base.sql_type import SQLType
+
+
+class CopyFormat(metaclass=ABCMeta):
+    '''
+    Abstract class for the file formats of bulk loaders: how each value is written as
+    a field and the statement that loads the file.
+
+    The characters that must be escaped are found by a precompiled regular expression,
+    so the fields without them (most of them) are written as they are.
+    '''
+
+    NAME: str
+    DELIMITER: str
+    NULL: str
+    TRUE: str
+    '''The field of true values of `Boolean` columns.'''
+    FALSE: str
+    '''The field of false values of `Boolean` columns.'''
+    SPECIAL_CHARS: re.Pattern
+    ESCAPES: dict[str, str] = {}
+    NEEDS_PATH: bool = False
+    '''If the statement can't load the file without its path (from the client's input).'''
+
+    def get_value_formatter(self, data_type: SQLType) -> Callable[[Any], str]:
+        '''
+        Parameters
+        ----------
+        data_type : SQLType
+            The SQL type of a column.
+
+        Returns
+        -------
+        Callable[[Any], str]
+            The function that writes each value of the column as a field, escaped as the
+            loader expects. Bools are written as `TRUE` and `FALSE` in `Boolean` columns
+            and as `1` and `0` in the others (like bits).
+        '''
+
+        null = self.NULL
+        true, false = (self.TRUE, self.FALSE) if isinstance(data_type, Boolean) else ('1', '0')
+        search_special_char = self.SPECIAL_CHARS.search
+        escape_text = self._escape_text
+
+        def format_value(value: Any) -> str:
+            if value is None:
+                return null
+
+            if type(value) is str:
+                text = value
+            elif value is True or value is False:
+                return true if value else false
+            else:
+                text = str(value)
+
+            if search_special_char(text) is None:
+                return text
+
+            return escape_text(text)
+
+        return format_value
+
+    def _escape_text(self, text: str) -> str:
+        escapes = self.ESCAPES
+
+        return self.SPECIAL_CHARS.sub(lambda match: escapes[match.group()], text)
+
+    @abstractmethod
+    def render_statement(
+        self, table: str, columns: list[str], path: str | None, encoding: str
+    ) -> str:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        columns : list[str]
+            The names of the columns, in the order of the fields.
+        path : str | None
+            The file's path (None if the file is sent by the client without a path).
+        encoding : str
+            The file's encoding.
+
+        Returns
+        -------
+        str
+            The statement that loads the file.
+        '''
+
+    def _quote(self, text: str) -> str:
+        return "'" + text.replace("'", "''") + "'"
+
+
+class PgTextFormat(CopyFormat):
+    '''
+    The text format of PostgreSQL's COPY: tab delimited fields, `\\N` for NULL and
+    backslash escapes for backslashes, tabs and line breaks.
+    '''
+
+    NAME = 'pg_text'
+    DELIMITER = '\t'
+    NULL = '\\N'
+    TRUE = 't'
+    FALSE = 'f'
+    SPECIAL_CHARS = re.compile(r'[\\\t\n\r]')
+    ESCAPES = {'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'}
+    FORMAT_OPTION = 'text'
+
+    def render_statement(
+        self, table: str, columns: list[str], path: str | None, encoding: str
+    ) -> str:
+        source = 'STDIN' if path is None else self._quote(path)
+
+        return (
+            f'COPY {table} ({", ".join(columns)}) FROM {source} '
+            f'WITH (FORMAT {self.FORMAT_OPTION}, ENCODING {self._quote(encoding)})'
+        )
+
+
+class PgCsvFormat(PgTextFormat):
+    '''
+    The CSV format of PostgreSQL's COPY: comma delimited fields, unquoted empty fields
+    for NULL and quoted fields (with their quotes doubled) for the texts with quotes,
+    commas or line breaks and for empty texts.
+    '''
+
+    NAME = 'pg_csv'
+    DELIMITER = ','
+    NULL = ''
+    # Empty texts are quoted to tell them from NULL, and a line with only `\.` is the
+    # end of data marker.
+    SPECIAL_CHARS = re.compile(r'[",\n\r]|^$|^\\\.$')
+    FORMAT_OPTION = 'csv'
+
+    def _escape_text(self, text: str) -> str:
+        return '"' + text.replace('"', '""') + '"'
+
+
+class MySqlInfileFormat(CopyFormat):
+    '''
+    The default format of MySQL's LOAD DATA: tab delimited fields, `\\N` for NULL and
+    backslash escapes for backslashes, tabs, line breaks and NUL characters.
+    '''
+
+    NAME = 'mysql_infile'
+    DELIMITER = '\t'
+    NULL = '\\N'
+    TRUE = '1'
+    FALSE = '0'
+    SPECIAL_CHARS = re.compile(r'[\\\t\n\r\0]')
+    ESCAPES = {'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r', '\0': '\\0'}
+    NEEDS_PATH = True
+
+    def render_statement(
+        self, table: str, columns: list[str], path: str | None, encoding: str
+    ) -> str:
+        # MySQL's utf8 charset only has the characters of up to 3 bytes.
+        charset = encoding.replace('-', '').replace('_', '').lower()
+        charset = 'utf8mb4' if charset == 'utf8' else charset
+
+        return (
+            f'LOAD DATA LOCAL INFILE {self._quote(path)} INTO TABLE {table} '
+            f"CHARACTER SET {charset} FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+            f"LINES TERMINATED BY '\\n' ({', '.join(columns)})"
+        )
+
+    def _quote(self, text: str) -> str:
+        # Backslashes are escape characters in MySQL's strings (like Windows' paths).
+        return super()._quote(text.replace('\\', '\\\\'))
+
+
+COPY_FORMATS = {
+    copy_format.NAME: copy_format
+    for copy_format in (PgTextFormat(), PgCsvFormat(), MySqlInfileFormat())
+}
+'''The supported formats by name.'''
@@ -0,0 +1,20 @@
+'''
+Defines the CsvError class for reporting the invalid fields of CSV files.
+'''
+
+from typing import NamedTuple
+
+
+class CsvError(NamedTuple):
+    '''
+    An invalid field, or an invalid record, of a CSV file validated against a table.
+    '''
+
+    line: int
+    '''The line where the record ends (records with quoted line breaks take many lines).'''
+
+    column: str | None
+    '''The name of the field's column, or None if the record has a wrong number of fields.'''
+
+    value: str | None
+    '''The field's text, or None if the record has a wrong number of fields.'''
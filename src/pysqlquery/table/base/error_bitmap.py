@@ -0,0 +1,247 @@
+'''
+Defines the ErrorBitmap class for reporting the invalid values of column-oriented data.
+'''
+
+from typing import TYPE_CHECKING, Sequence
+
+from ...utils.numpy_support import import_numpy
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class ErrorBitmap:
+    '''
+    Holds which values of column-oriented data are invalid, one bit per value.
+
+    Each row takes `row_size` bytes of the bitmap, in which the bit `1 << i` (little
+    endian) is set when the value of the i-th column is invalid. So the errors of a row
+    are a bitmask in the same format of the ones returned by the row validators (see
+    `Table.compile_validator`).
+
+    The summary counts are computed when the bitmap is built, so they don't need to
+    scan it.
+    '''
+
+    def __init__(
+        self,
+        columns: list[str],
+        qty_rows: int,
+        bitmap: bytes,
+        error_counts: list[int],
+        qty_invalid_rows: int,
+    ) -> None:
+        '''
+        Parameters
+        ----------
+        columns : list[str]
+            The names of the columns, in the order of their bits.
+        qty_rows : int
+            The quantity of rows.
+        bitmap : bytes
+            The rows' errors, with `(len(columns) + 7) // 8` bytes per row.
+        error_counts : list[int]
+            The quantity of invalid values of each column.
+        qty_invalid_rows : int
+            The quantity of rows with at least one invalid value.
+
+        Returns
+        -------
+        None
+        '''
+
+        self._columns: list[str] = columns
+        self._qty_rows: int = qty_rows
+        self._bitmap: bytes = bitmap
+        self._row_size: int = (len(columns) + 7) // 8
+        self._error_counts: list[int] = error_counts
+        self._qty_invalid_rows: int = qty_invalid_rows
+
+    @classmethod
+    def from_masks(
+        cls,
+        columns: list[str],
+        qty_rows: int,
+        masks: 'Sequence[Sequence[bool] | numpy.ndarray | None]',
+    ) -> 'ErrorBitmap':
+        '''
+        Builds the bitmap from a validity mask per column.
+
+        Parameters
+        ----------
+        columns : list[str]
+            The names of the columns.
+        qty_rows : int
+            The quantity of rows.
+        masks : Sequence[Sequence[bool] | numpy.ndarray | None]
+            The validity mask of each column (True for each valid value), or None for
+            the columns that weren't validated.
+
+        Returns
+        -------
+        ErrorBitmap
+            The bitmap with the invalid values of the masks.
+        '''
+
+        if import_numpy() is not None and columns:
+            return cls._from_masks_with_numpy(columns, qty_rows, masks)
+
+        return cls._from_masks_with_python(columns, qty_rows, masks)
+
+    @classmethod
+    def _from_masks_with_numpy(
+        cls,
+        columns: list[str],
+        qty_rows: int,
+        masks: 'Sequence[Sequence[bool] | numpy.ndarray | None]',
+    ) -> 'ErrorBitmap':
+        numpy = import_numpy()
+
+        errors = numpy.zeros((qty_rows, len(columns)), dtype=bool)
+
+        for i, mask in enumerate(masks):
+            if mask is not None:
+                errors[:, i] = ~numpy.asarray(mask, dtype=bool).reshape(-1)
+
+        return cls(
+            columns,
+            qty_rows,
+            numpy.packbits(errors, axis=1, bitorder='little').tobytes(),
+            errors.sum(axis=0).tolist(),
+            int(errors.any(axis=1).sum()),
+        )
+
+    @classmethod
+    def _from_masks_with_python(
+        cls,
+        columns: list[str],
+        qty_rows: int,
+        masks: 'Sequence[Sequence[bool] | numpy.ndarray | None]',
+    ) -> 'ErrorBitmap':
+        row_errors = [0] * qty_rows
+        error_counts = [0] * len(columns)
+
+        for i, mask in enumerate(masks):
+            if mask is None:
+                continue
+
+            bit = 1 << i
+
+            for row, is_valid in enumerate(mask):
+                if not is_valid:
+                    row_errors[row] |= bit
+                    error_counts[i] += 1
+
+        row_size = (len(columns) + 7) // 8
+
+        return cls(
+            columns,
+            qty_rows,
+            b''.join(errors.to_bytes(row_size, 'little') for errors in row_errors),
+            error_counts,
+            sum(1 for errors in row_errors if errors),
+        )
+
+    def row_errors(self, row: int) -> int:
+        '''
+        Parameters
+        ----------
+        row : int
+            The row's index.
+
+        Returns
+        -------
+        int
+            The bitmask of the row's invalid columns (0 for a valid row).
+        '''
+
+        if not 0 <= row < self._qty_rows:
+            raise IndexError(f'row index out of range: {row}')
+
+        start = row * self._row_size
+
+        return int.from_bytes(self._bitmap[start : start + self._row_size], 'little')
+
+    def is_row_valid(self, row: int) -> bool:
+        '''
+        Parameters
+        ----------
+        row : int
+            The row's index.
+
+        Returns
+        -------
+        bool
+            True if every value of the row is valid, False otherwise.
+        '''
+
+        return not self.row_errors(row)
+
+    def invalid_columns(self, row: int) -> list[str]:
+        '''
+        Parameters
+        ----------
+        row : int
+            The row's index.
+
+        Returns
+        -------
+        list[str]
+            The names of the row's columns with invalid values.
+        '''
+
+        errors = self.row_errors(row)
+
+        return [column for i, column in enumerate(self._columns) if errors >> i & 1]
+
+    def invalid_rows(self) -> list[int]:
+        '''
+        Returns
+        -------
+        list[int]
+            The indexes of the rows with at least one invalid value, in order.
+        '''
+
+        if not self._qty_invalid_rows:
+            return []
+
+        numpy = import_numpy()
+
+        if numpy is not None:
+            rows = numpy.frombuffer(self._bitmap, dtype=numpy.uint8).reshape(
+                self._qty_rows, self._row_size
+            )
+
+            return numpy.flatnonzero(rows.any(axis=1)).tolist()
+
+        row_size = self._row_size
+
+        return [
+            row
+            for row in range(self._qty_rows)
+            if any(self._bitmap[row * row_size : (row + 1) * row_size])
+        ]
+
+    @property
+    def columns(self) -> list[str]:
+        return self._columns
+
+    @property
+    def qty_rows(self) -> int:
+        return self._qty_rows
+
+    @property
+    def qty_invalid_rows(self) -> int:
+        return self._qty_invalid_rows
+
+    @property
+    def error_counts(self) -> dict[str, int]:
+        return dict(zip(self._columns, self._error_counts))
+
+    @property
+    def bitmap(self) -> bytes:
+        return self._bitmap
+
+    @property
+    def row_size(self) -> int:
+        return self._row_size
@@ -0,0 +1,277 @@
+'''
+Defines the ErrorReport class for collecting the invalid values of bulk validations.
+'''
+
+from array import array
+from enum import IntEnum
+from typing import Any, Iterator, NamedTuple, Sequence
+
+from ..column import Column
+from ..exceptions.table import InvalidRows
+
+
+class ErrorCode(IntEnum):
+    '''
+    The kinds of errors of an `ErrorReport`.
+    '''
+
+    INVALID_VALUE = 1
+    NULL_VALUE = 2
+    WRONG_VALUE_COUNT = 3
+
+
+class ValidationError(NamedTuple):
+    '''
+    An error of an `ErrorReport`.
+    '''
+
+    row: int
+    '''The row's index.'''
+
+    column: str | None
+    '''The column's name, or None for `WRONG_VALUE_COUNT` errors.'''
+
+    code: ErrorCode
+    '''The kind of error.'''
+
+    value: Any
+    '''The invalid value, or the quantity of values for `WRONG_VALUE_COUNT` errors.'''
+
+
+class ErrorReport:
+    '''
+    Collects the errors of a bulk validation compactly, formatting their messages only
+    when they're read.
+
+    Each error is a (row, column, error code) entry in typed arrays plus a reference to
+    the invalid value, so recording millions of errors doesn't build any exception or
+    message.
+    '''
+
+    MESSAGES = {
+        ErrorCode.INVALID_VALUE: (
+            'Row {row}: the value {value!r} of the {column} column isn\'t a valid {data_type} data'
+        ),
+        ErrorCode.NULL_VALUE: 'Row {row}: the {column} column can\'t be NULL',
+        ErrorCode.WRONG_VALUE_COUNT: (
+            'Row {row}: {value} values were passed, but the {table} table has {qty_columns} columns'
+        ),
+    }
+
+    def __init__(self, table: str, columns: list[Column]) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        columns : list[Column]
+            The validated columns, in the order of the rows' values.
+
+        Returns
+        -------
+        None
+        '''
+
+        self._table: str = table
+        self._columns: list[Column] = columns
+        self._rows: array = array('q')
+        self._column_indexes: array = array('i')
+        self._codes: array = array('B')
+        self._values: list[Any] = []
+
+    def add(self, row: int, column_index: int, code: ErrorCode, value: Any) -> None:
+        '''
+        Records an error.
+
+        Parameters
+        ----------
+        row : int
+            The row's index.
+        column_index : int
+            The index of the column (-1 for `WRONG_VALUE_COUNT` errors).
+        code : ErrorCode
+            The kind of error.
+        value : Any
+            The invalid value (the quantity of values for `WRONG_VALUE_COUNT` errors).
+
+        Returns
+        -------
+        None
+        '''
+
+        self._rows.append(row)
+        self._column_indexes.append(column_index)
+        self._codes.append(code)
+        self._values.append(value)
+
+    def add_row_errors(self, row: int, values: Sequence[Any], errors: int) -> None:
+        '''
+        Records the errors of a row from the bitmask returned by a row validator (see
+        `Table.compile_validator`).
+
+        Parameters
+        ----------
+        row : int
+            The row's index.
+        values : Sequence[Any]
+            The row's values.
+        errors : int
+            The bitmask of the row's invalid columns.
+
+        Returns
+        -------
+        None
+        '''
+
+        self.add_invalid_values(row, errors, self.get_invalid_values(values, errors))
+
+    def get_invalid_values(self, values: Sequence[Any], errors: int) -> tuple | int:
+        '''
+        Parameters
+        ----------
+        values : Sequence[Any]
+            The row's values.
+        errors : int
+            The bitmask of the row's invalid columns.
+
+        Returns
+        -------
+        tuple | int
+            The row's invalid values, in the order of their columns, or the quantity of
+            values if the row doesn't have a value per column. It's all that
+            `add_invalid_values` needs, so it's what is kept of the invalid rows (and
+            sent back by the worker processes of `Table.validate_rows`).
+        '''
+
+        if len(values) != len(self._columns):
+            return len(values)
+
+        return tuple(values[i] for i in _iter_bits(errors))
+
+    def add_invalid_values(self, row: int, errors: int, values: tuple | int) -> None:
+        '''
+        Records the errors of a row from the bitmask of its invalid columns and the
+        invalid values returned by `get_invalid_values`.
+
+        Parameters
+        ----------
+        row : int
+            The row's index.
+        errors : int
+            The bitmask of the row's invalid columns.
+        values : tuple | int
+            The row's invalid values, or the quantity of values of a row that doesn't
+            have a value per column.
+
+        Returns
+        -------
+        None
+        '''
+
+        if isinstance(values, int):
+            self.add(row, -1, ErrorCode.WRONG_VALUE_COUNT, values)
+            return
+
+        for i, value in zip(_iter_bits(errors), values):
+            code = ErrorCode.NULL_VALUE if value is None else ErrorCode.INVALID_VALUE
+            self.add(row, i, code, value)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator[ValidationError]:
+        for i in range(len(self._codes)):
+            yield self[i]
+
+    def __getitem__(self, index: int) -> ValidationError:
+        column_index = self._column_indexes[index]
+
+        return ValidationError(
+            self._rows[index],
+            self._columns[column_index].name if column_index >= 0 else None,
+            ErrorCode(self._codes[index]),
+            self._values[index],
+        )
+
+    def message(self, index: int) -> str:
+        '''
+        Parameters
+        ----------
+        index : int
+            The error's index.
+
+        Returns
+        -------
+        str
+            The error's message.
+        '''
+
+        row, column, code, value = self[index]
+        column_index = self._column_indexes[index]
+
+        return self.MESSAGES[code].format(
+            row=row,
+            column=column,
+            value=value,
+            data_type=self._columns[column_index].data_type if column_index >= 0 else None,
+            table=self._table,
+            qty_columns=len(self._columns),
+        )
+
+    def messages(self) -> Iterator[str]:
+        '''
+        Returns
+        -------
+        Iterator[str]
+            A generator with the message of each error, formatted as it's consumed.
+        '''
+
+        for i in range(len(self._codes)):
+            yield self.message(i)
+
+    def invalid_rows(self) -> list[int]:
+        '''
+        Returns
+        -------
+        list[int]
+            The indexes of the rows with errors, in the order they were recorded.
+        '''
+
+        return list(dict.fromkeys(self._rows))
+
+    def raise_for_errors(self) -> None:
+        '''
+        Raises `InvalidRows`, with the first error's message, if there's any error.
+        '''
+
+        if self._codes:
+            raise InvalidRows(self._table, len(self._codes), self.message(0))
+
+    @property
+    def error_counts(self) -> dict[str, int]:
+        counts = dict.fromkeys((column.name for column in self._columns), 0)
+
+        for column_index in self._column_indexes:
+            if column_index >= 0:
+                counts[self._columns[column_index].name] += 1
+
+        return counts
+
+    @property
+    def rows(self) -> array:
+        return self._rows
+
+    @property
+    def column_indexes(self) -> array:
+        return self._column_indexes
+
+    @property
+    def codes(self) -> array:
+        return self._codes
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    # The indexes of the set bits of the mask, from the lowest one.
+    while mask:
+        yield (mask & -mask).bit_length() - 1
+        mask &= mask - 1
@@ -0,0 +1,114 @@
+'''
+Defines the QueryCache class for reusing the compiled SQL of queries with the same structure.
+'''
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Hashable
+
+from ..exceptions.table import InvalidQueryCacheSize
+
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+
+class QueryCache:
+    '''
+    A bounded cache of compiled queries by their structure, which discards the least
+    recently used query when it's full.
+
+    The compiled queries don't depend on the bound values, so the queries built again
+    and again with the same structure are compiled once.
+    '''
+
+    __slots__ = ('_compile', '_cached_compile')
+
+    def __init__(self, compile: Callable[[Hashable], tuple], maxsize: int | None) -> None:
+        '''
+        Parameters
+        ----------
+        compile : Callable[[Hashable], tuple]
+            Compiles the query of a structure.
+        maxsize : int | None
+            The maximum quantity of cached queries (None for no maximum and 0 for no
+            caching).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        InvalidQueryCacheSize
+            If the maximum size isn't a non-negative int or None.
+        '''
+
+        self._validate_maxsize(maxsize)
+
+        self._compile = compile
+        self._cached_compile = lru_cache(maxsize=maxsize)(compile)
+
+    def _validate_maxsize(self, maxsize: int | None) -> None:
+        if not self._is_maxsize_valid(maxsize):
+            raise InvalidQueryCacheSize(maxsize)
+
+    def _is_maxsize_valid(self, maxsize: Any) -> bool:
+        return maxsize is None or (
+            isinstance(maxsize, int) and not isinstance(maxsize, bool) and maxsize >= 0
+        )
+
+    def get(self, key: Hashable) -> tuple:
+        '''
+        Parameters
+        ----------
+        key : Hashable
+            The query's structure.
+
+        Returns
+        -------
+        tuple
+            The compiled query, compiled only if it isn't cached.
+        '''
+
+        return self._cached_compile(key)
+
+    def resize(self, maxsize: int | None) -> None:
+        '''
+        Changes the maximum quantity of cached queries, discarding the cached ones and
+        resetting the statistics.
+
+        Parameters
+        ----------
+        maxsize : int | None
+            The maximum quantity of cached queries (None for no maximum and 0 for no
+            caching).
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        InvalidQueryCacheSize
+            If the maximum size isn't a non-negative int or None.
+        '''
+
+        self._validate_maxsize(maxsize)
+
+        self._cached_compile = lru_cache(maxsize=maxsize)(self._compile)
+
+    def clear(self) -> None:
+        '''
+        Discards the cached queries and resets the statistics.
+        '''
+
+        self._cached_compile.cache_clear()
+
+    @property
+    def info(self) -> '_CacheInfo':
+        '''The statistics (hits, misses, maxsize and currsize) of the cache.'''
+
+        return self._cached_compile.cache_info()
+
+    @property
+    def maxsize(self) -> int | None:
+        return self._cached_compile.cache_info().maxsize
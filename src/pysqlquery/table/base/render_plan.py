@@ -0,0 +1,112 @@
+'''
+Defines the RenderPlan class for precompiling the SQL query of table classes.
+'''
+
+from ...constraints.base.named_constraint import NamedConstraint
+from ..column import Column
+
+
+class RenderPlan:
+    '''
+    Holds the precompiled parts of a table class's CREATE TABLE query.
+
+    A plan is built once per table class (and rebuilt when a named constraint changes
+    its columns), so rendering a table instance only stitches the plan's parts together
+    with the parts that change between instances, like the IF NOT EXISTS clause.
+    '''
+
+    CREATE_TABLE_HEADER = 'CREATE TABLE '
+    CREATE_TABLE_IF_NOT_EXISTS_HEADER = 'CREATE TABLE IF NOT EXISTS '
+
+    def __init__(
+        self, name: str, columns: list[Column], constraints: list[NamedConstraint] | None
+    ) -> None:
+        '''
+        Parameters
+        ----------
+        name : str
+            The table's name.
+        columns : list[Column]
+            The table's columns.
+        constraints : list[NamedConstraint] | None
+            The table's named constraints.
+
+        Returns
+        -------
+        None
+        '''
+
+        self._columns_section: str = ',\n\t'.join(str(column) for column in columns)
+        self._constraints_section: str = self._build_constraints_section(columns)
+        self._alter_tables_section: str = self._build_alter_tables_section(name, constraints)
+
+        constraints_separator = ',\n\n\t' if self._constraints_section else ''
+
+        self._body: str = (
+            f'{name} (\n\t{self._columns_section}{constraints_separator}'
+            f'{self._constraints_section}\n);{self._alter_tables_section}'
+        )
+
+    def _build_constraints_section(self, columns: list[Column]) -> str:
+        unnamed_pk_columns = [
+            column.name
+            for column in columns
+            if column.primary_key and not column.is_primary_key_named()
+        ]
+        unnamed_fk_consts = [
+            str(column.foreign_key)
+            for column in columns
+            if column.foreign_key and not column.is_foreign_key_named()
+        ]
+
+        unnamed_consts = []
+
+        if unnamed_pk_columns:
+            unnamed_consts.append(f'PRIMARY KEY ({", ".join(unnamed_pk_columns)})')
+
+        unnamed_consts.extend(unnamed_fk_consts)
+
+        return ',\n\t'.join(unnamed_consts)
+
+    def _build_alter_tables_section(
+        self, name: str, constraints: list[NamedConstraint] | None
+    ) -> str:
+        if constraints is None:
+            return ''
+
+        return ''.join(
+            f'\n\nALTER TABLE {name}\n\tADD {constraint};' for constraint in constraints
+        )
+
+    def render(self, create_if_not_exists: bool) -> str:
+        '''
+        Parameters
+        ----------
+        create_if_not_exists : bool
+            If the query must receive the IF NOT EXISTS clause.
+
+        Returns
+        -------
+        str
+            The table's CREATE TABLE query.
+        '''
+
+        header = (
+            self.CREATE_TABLE_IF_NOT_EXISTS_HEADER
+            if create_if_not_exists
+            else self.CREATE_TABLE_HEADER
+        )
+
+        return header + self._body
+
+    @property
+    def columns_section(self) -> str:
+        return self._columns_section
+
+    @property
+    def constraints_section(self) -> str:
+        return self._constraints_section
+
+    @property
+    def alter_tables_section(self) -> str:
+        return self._alter_tables_section
@@ -0,0 +1,129 @@
+'''
+Defines the function for compiling the row validators of table classes.
+'''
+
+import linecache
+from typing import Any, Callable, Sequence
+
+from ...types.base.sql_type import SQLType
+from ..column import Column
+
+RowValidator = Callable[[Sequence[Any]], int]
+
+
+def compile_row_validator(name: str, columns: list[Column]) -> RowValidator:
+    '''
+    Generates and compiles a function that validates rows against the columns.
+
+    The function receives a row (a sequence with one value per column, in the columns'
+    order) and returns the bitmask of its invalid columns: the bit `1 << i` is set when
+    the value of the i-th column is invalid, so 0 means a valid row. A row with a
+    wrong quantity of values has all the bits set.
+
+    Each column's check is written in the function's source, with the column's
+    nullability and the SQL type's bounds (like lengths and precisions) as constants,
+    so validating a row doesn't look up any column, SQL type or attribute.
+
+    Parameters
+    ----------
+    name : str
+        The table's name.
+    columns : list[Column]
+        The table's columns.
+
+    Returns
+    -------
+    RowValidator
+        The compiled function.
+    '''
+
+    namespace = {}
+    values = [f'v{i}' for i in range(len(columns))]
+    all_columns_mask = (1 << len(columns)) - 1
+
+    lines = [
+        'def validate_row(row):',
+        f'    if len(row) != {len(columns)}:',
+        f'        return {all_columns_mask}',
+    ]
+
+    if values:
+        unpacked_values = ', '.join(values) + (',' if len(values) == 1 else '')
+        lines.append(f'    {unpacked_values} = row')
+
+    lines.append('    errors = 0')
+
+    for i, (column, value) in enumerate(zip(columns, values)):
+        if column.memo_size is not None:
+            lines.extend(_get_memoized_value_check_lines(column, value, i, namespace))
+            lines.append(f'        errors |= {1 << i}')
+            continue
+
+        check = _get_value_check(column.data_type, value, i, namespace)
+
+        if column.nullable:
+            check = f'{value} is None or ({check})'
+        else:
+            check = f'{value} is not None and ({check})'
+
+        lines.append(f'    if not ({check}):')
+        lines.append(f'        errors |= {1 << i}')
+
+    lines.append('    return errors')
+
+    source = '\n'.join(lines) + '\n'
+    filename = f'<row validator of {name}>'
+
+    exec(compile(source, filename, 'exec'), namespace)
+
+    # Registers the source, so tracebacks and `inspect` can show the generated code.
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    validate_row = namespace['validate_row']
+    validate_row.__qualname__ = f'{name}.validate_row'
+
+    return validate_row
+
+
+def _get_value_check(
+    data_type: SQLType, value: str, index: int, namespace: dict[str, Any]
+) -> str:
+    sql_type = f'sql_type_{index}'
+    validate_value = f'validate_value_{index}'
+    namespace[sql_type] = data_type
+    namespace[validate_value] = data_type.validate_value
+    inline_check = None
+
+    # The inline check replaces `validate_value` only if both are defined by the same
+    # class, otherwise a subclass could have changed `validate_value`.
+    if _get_defining_class(data_type, '_get_inline_check') is _get_defining_class(
+        data_type, 'validate_value'
+    ):
+        inline_check = data_type._get_inline_check(value, sql_type)
+
+    return inline_check or f'{validate_value}({value})'
+
+
+def _get_memoized_value_check_lines(
+    column: Column, value: str, index: int, namespace: dict[str, Any]
+) -> list[str]:
+    # Same as `Column.validate_value`, without the call.
+    memoized_validate_value = f'memoized_validate_value_{index}'
+    validate_value = f'validate_value_{index}'
+    namespace[memoized_validate_value] = column._memoized_validate_value
+    namespace[validate_value] = column.data_type.validate_value
+
+    return [
+        f'    if {value} is None:',
+        f'        valid = {column.nullable}',
+        '    else:',
+        '        try:',
+        f'            valid = {memoized_validate_value}({value})',
+        '        except TypeError:',
+        f'            valid = {validate_value}({value})',
+        '    if not valid:',
+    ]
+
+
+def _get_defining_class(data_type: SQLType, attribute: str) -> type:
+    return next(cls for cls in type(data_type).__mro__ if attribute in vars(cls))
@@ -13,4 +13,16 @@ class TableMeta(type):
     def __new__(mcs, name: str, bases: tuple, clsdict: dict):
         columns = [val for val in clsdict.values() if isinstance(val, Column)]
         clsdict['_columns'] = columns
-        return super().__new__(mcs, name, bases, clsdict)
+        clsdict['_columns_version'] = 0
+        clsdict['_named_constraints_wired'] = False
+        clsdict['_render_plan'] = None
+        clsdict['_render_plan_version'] = None
+        clsdict['_row_validator'] = None
+        clsdict['_row_validator_version'] = None
+        clsdict['_statement_templates'] = {}
+        clsdict['_statement_templates_version'] = None
+
+        cls = super().__new__(mcs, name, bases, clsdict)
+        cls._columns_by_name = {column.name: column for column in columns}
+
+        return cls
@@ -2,23 +2,40 @@
 Defines the Column class for constructing SQL table columns.
 '''
 
-from typing import Any, Literal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Literal
 
 from ..constraints import ForeignKey, ForeignKeyConstraint
 from ..types.base.sql_num_type import SQLNumType
 from ..types.base.sql_type import SQLType
+from ..utils.numpy_support import import_numpy, is_numpy_array
+from .condition import Condition
 from .exceptions.column import (
     ColumnAlreadyHasNamedForeignKeyConstraint,
     ColumnAlreadyHasNamedUniqueConstraint,
+    EmptyInValues,
     InvalidAutoIncrement,
     InvalidDefaultValue,
     InvalidForeignKey,
+    InvalidMemoSize,
     InvalidNullable,
     InvalidPrimaryKey,
     InvalidSQLType,
     InvalidUnique,
 )
 
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+    import numpy
+
+ALLOWED_KINDS_OF_AUTO_INCREMENT: dict[str, str] = {
+    'mssql': 'IDENTITY(1, 1)',
+    'mysql': 'AUTO_INCREMENT',
+    'sqlite': 'AUTO INCREMENT',
+    'postgre': 'SERIAL',
+}
+
 
 class Column:
     '''
@@ -29,6 +46,24 @@ class Column:
     If named constraints are passed in a table, they can modifying table's columns.
     '''
 
+    __slots__ = (
+        '_data_type',
+        '_unnamed_foreign_key',
+        '_unnamed_primary_key',
+        '_auto_increment',
+        '_nullable',
+        '_unnamed_unique',
+        '_default',
+        '_unnamed_constraints_repr',
+        '_name',
+        '_table',
+        '_named_primary_key',
+        '_named_foreign_key',
+        '_named_unique',
+        '_memo_size',
+        '_memoized_validate_value',
+    )
+
     def __init__(
         self,
         data_type: SQLType,
@@ -39,6 +74,7 @@ class Column:
         nullable: bool = False,
         unique: bool = False,
         default: Any = None,
+        memo_size: int | None = None,
     ) -> None:
         '''
         Parameters
@@ -57,6 +93,10 @@ class Column:
             If the column is unique.
         default : Any
             The column's default value (must satisfying the column's data type).
+        memo_size : int | None
+            If passed, the column memoizes the validation results of up to this many
+            hashable values (the least recently used ones are discarded). It speeds up
+            the validation of columns with few distinct values, like status codes.
 
         Returns
         -------
@@ -79,6 +119,7 @@ class Column:
         ...     id = Column(Integer(6), primary_key=True, auto_increment='mysql')
         ...     name = Column(String(50), unique=True)
         ...     price = Column(Float(7, 2), default=1)
+        ...     country = Column(Char(2), memo_size=1024)
 
         When `NamedConstraint` is passed for table, it can modifying this column.
 
@@ -100,13 +141,6 @@ class Column:
         self._validate_primary_key(primary_key)
         self._unnamed_primary_key: bool = primary_key
 
-        self._allowed_kinds_of_auto_increment: dict[str, str] = {
-            'mssql': 'IDENTITY(1, 1)',
-            'mysql': 'AUTO_INCREMENT',
-            'sqlite': 'AUTO INCREMENT',
-            'postgre': 'SERIAL',
-        }
-
         self._validate_auto_increment(auto_increment)
         self._auto_increment: str = (
             self._handle_auto_increment(auto_increment) if auto_increment is not None else None
@@ -121,8 +155,15 @@ class Column:
         self._validate_default_value(default)
         self._default: Any = default
 
+        self._validate_memo_size(memo_size)
+        self._memo_size: int | None = memo_size
+        self._memoized_validate_value: Callable[[Any], bool] | None = (
+            self._memoize_validate_value(memo_size) if memo_size is not None else None
+        )
+
         self._unnamed_constraints_repr: tuple[str | None] = None
         self._name: str = None
+        self._table: type | None = None
 
         self._named_primary_key: bool = False
         self._named_foreign_key: ForeignKeyConstraint | None = None
@@ -162,7 +203,7 @@ class Column:
         return (
             auto_increment is None
             or isinstance(auto_increment, str)
-            and auto_increment.lower() in self._allowed_kinds_of_auto_increment
+            and auto_increment.lower() in ALLOWED_KINDS_OF_AUTO_INCREMENT
         )
 
     def _validate_nullable(self, nullable: bool) -> None:
@@ -180,15 +221,32 @@ class Column:
     def _is_default_value_valid(self, default_value: Any) -> bool:
         return default_value is None or self._data_type.validate_value(default_value)
 
+    def _validate_memo_size(self, memo_size: int | None) -> None:
+        if not self._is_memo_size_valid(memo_size):
+            raise InvalidMemoSize(memo_size)
+
+    def _is_memo_size_valid(self, memo_size: int | None) -> bool:
+        return memo_size is None or (
+            isinstance(memo_size, int) and not isinstance(memo_size, bool) and memo_size > 0
+        )
+
+    def _memoize_validate_value(self, memo_size: int) -> Callable[[Any], bool]:
+        # typed=True, so equal values of different types (like True, 1 and 1.0) have
+        # their own results.
+        return lru_cache(maxsize=memo_size, typed=True)(self._data_type.validate_value)
+
     def _handle_data_type(self, data_type: SQLType) -> SQLType:
         return data_type() if isinstance(data_type, type) else data_type
 
     def _handle_auto_increment(self, auto_increment: str) -> str:
-        return self._allowed_kinds_of_auto_increment[auto_increment]
+        return ALLOWED_KINDS_OF_AUTO_INCREMENT[auto_increment]
 
     def __set_name__(self, owner, name: str) -> None:
         self._name = name.strip().lower()
 
+        if hasattr(owner, '_columns_version'):
+            self._table = owner
+
         if self._unnamed_foreign_key is not None:
             self._unnamed_foreign_key.add_column_name(name)
 
@@ -243,7 +301,10 @@ class Column:
         return 'UNIQUE' if not self._unnamed_primary_key and self._unnamed_unique else None
 
     def _get_default_value_constraint_repr(self) -> str | None:
-        return f'DEFAULT {self._default!r}' if self._default is not None else None
+        if self._default is None:
+            return None
+
+        return f'DEFAULT {self._data_type.render_literal(self._default)}'
 
     def define_primary_key_from_named_constraint(self) -> None:
         '''
@@ -257,6 +318,7 @@ class Column:
         self._named_primary_key = True
         self._set_constraints_repr()
         self._unnamed_unique = True
+        self._notify_table_of_changes()
 
     def define_foreign_key_from_named_constraint(self, fk_const: ForeignKeyConstraint) -> None:
         '''
@@ -270,6 +332,7 @@ class Column:
             raise ColumnAlreadyHasNamedForeignKeyConstraint(self._name)
 
         self._named_foreign_key = fk_const
+        self._notify_table_of_changes()
 
     def define_unique_from_named_constraint(self) -> None:
         '''
@@ -283,6 +346,226 @@ class Column:
             raise ColumnAlreadyHasNamedUniqueConstraint(self._name)
 
         self._named_unique = True
+        self._notify_table_of_changes()
+
+    def validate_value(self, value: Any) -> bool:
+        '''
+        Validates a value of this column: it must be valid for the column's data type,
+        or None if the column is nullable.
+
+        Parameters
+        ----------
+        value : Any
+            The value to be validated.
+
+        Returns
+        -------
+        bool
+            True if the value is valid for the column, False otherwise.
+
+        Examples
+        --------
+        >>> Column(String(3), nullable=True).validate_value(None)
+        True
+        >>> Column(String(3), memo_size=100).validate_value('abcd')
+        False
+        '''
+
+        if value is None:
+            return self._nullable
+
+        if self._memoized_validate_value is None:
+            return self._data_type.validate_value(value)
+
+        try:
+            return self._memoized_validate_value(value)
+        except TypeError:
+            # Unhashable values can't be memoized.
+            return self._data_type.validate_value(value)
+
+    def validate_values(self, values: Iterable[Any]) -> 'list[bool] | numpy.ndarray':
+        '''
+        Validates many values of this column at once: each value must be valid for the
+        column's data type (see `SQLType.validate_values`), or None if the column is
+        nullable.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            The values to be validated. It can be any iterable, a NumPy array or a
+            memoryview.
+
+        Returns
+        -------
+        list[bool] | numpy.ndarray
+            A boolean mask with True for each valid value, like the one returned by
+            `SQLType.validate_values`.
+
+        Examples
+        --------
+        >>> Column(String(3), nullable=True).validate_values(['abc', None, 'abcd'])
+        [True, True, False]
+        >>> Column(String(3)).validate_values(numpy.array(['abc', None], dtype=object))
+        array([ True, False])
+        '''
+
+        if isinstance(values, memoryview):
+            # Memoryviews can't have None values.
+            return self._data_type.validate_values(values)
+
+        if is_numpy_array(values):
+            return self._apply_nullable_to_array(values, self._data_type.validate_values(values))
+
+        values = values if isinstance(values, (list, tuple)) else list(values)
+
+        if self._memoized_validate_value is not None:
+            return list(map(self.validate_value, values))
+
+        valid = self._data_type.validate_values(values)
+
+        if self._nullable:
+            return [is_valid or value is None for value, is_valid in zip(values, valid)]
+
+        return [is_valid and value is not None for value, is_valid in zip(values, valid)]
+
+    def _apply_nullable_to_array(
+        self, array: 'numpy.ndarray', valid: 'numpy.ndarray'
+    ) -> 'numpy.ndarray':
+        # Only object arrays can have None values.
+        if array.dtype.kind != 'O':
+            return valid
+
+        numpy = import_numpy()
+
+        is_null = numpy.fromiter(
+            (value is None for value in array.ravel().tolist()), dtype=bool, count=array.size
+        ).reshape(array.shape)
+
+        return valid | is_null if self._nullable else valid & ~is_null
+
+    def clear_memo(self) -> None:
+        '''
+        Discards the memoized validation results and resets the memo's statistics.
+        '''
+
+        if self._memoized_validate_value is not None:
+            self._memoized_validate_value.cache_clear()
+
+    def eq(self, value: Any) -> Condition:
+        '''
+        Creates the condition `column = value` (or `column IS NULL`, if value is None).
+
+        Parameters
+        ----------
+        value : Any
+            The value, bound as a parameter.
+
+        Returns
+        -------
+        Condition
+            The condition.
+
+        Examples
+        --------
+        >>> my_table.select().where(MyTable.name.eq('Ann')).compile()
+        ('SELECT id, name FROM MYTABLE WHERE name = ?', ('Ann',))
+        '''
+
+        if value is None:
+            return self.is_null()
+
+        return self._compare('=', value)
+
+    def ne(self, value: Any) -> Condition:
+        '''
+        Creates the condition `column <> value` (or `column IS NOT NULL`, if value is None).
+        '''
+
+        if value is None:
+            return self.is_not_null()
+
+        return self._compare('<>', value)
+
+    def lt(self, value: Any) -> Condition:
+        '''
+        Creates the condition `column < value`.
+        '''
+
+        return self._compare('<', value)
+
+    def le(self, value: Any) -> Condition:
+        '''
+        Creates the condition `column <= value`.
+        '''
+
+        return self._compare('<=', value)
+
+    def gt(self, value: Any) -> Condition:
+        '''
+        Creates the condition `column > value`.
+        '''
+
+        return self._compare('>', value)
+
+    def ge(self, value: Any) -> Condition:
+        '''
+        Creates the condition `column >= value`.
+        '''
+
+        return self._compare('>=', value)
+
+    def like(self, pattern: str) -> Condition:
+        '''
+        Creates the condition `column LIKE pattern`.
+        '''
+
+        return self._compare('LIKE', pattern)
+
+    def between(self, low: Any, high: Any) -> Condition:
+        '''
+        Creates the condition `column BETWEEN low AND high`.
+        '''
+
+        return Condition(('BETWEEN', self._name), (low, high), (self,))
+
+    def in_(self, values: Iterable[Any]) -> Condition:
+        '''
+        Creates the condition `column IN (values)`, with a placeholder for each value (so
+        its structure depends on the quantity of values).
+
+        Raises
+        ------
+        EmptyInValues
+            If there are no values.
+        '''
+
+        values = tuple(values)
+
+        if not values:
+            raise EmptyInValues(self._name)
+
+        return Condition(('IN', self._name, len(values)), values, (self,))
+
+    def is_null(self) -> Condition:
+        '''
+        Creates the condition `column IS NULL`.
+        '''
+
+        return Condition(('IS NULL', self._name), (), (self,))
+
+    def is_not_null(self) -> Condition:
+        '''
+        Creates the condition `column IS NOT NULL`.
+        '''
+
+        return Condition(('IS NOT NULL', self._name), (), (self,))
+
+    def _compare(self, operator: str, value: Any) -> Condition:
+        return Condition((operator, self._name), (value,), (self,))
+
+    def _notify_table_of_changes(self) -> None:
+        if self._table is not None:
+            self._table._columns_version += 1
 
     def is_primary_key_named(self) -> bool:
         '''
@@ -337,3 +620,14 @@ class Column:
     @property
     def default(self) -> Any:
         return self._default
+
+    @property
+    def memo_size(self) -> int | None:
+        return self._memo_size
+
+    @property
+    def memo_info(self) -> '_CacheInfo | None':
+        if self._memoized_validate_value is None:
+            return None
+
+        return self._memoized_validate_value.cache_info()
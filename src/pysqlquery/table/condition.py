@@ -0,0 +1,138 @@
+'''
+Defines the Condition class for constructing the WHERE clauses of SELECT queries.
+'''
+
+from typing import TYPE_CHECKING, Callable, Hashable
+
+if TYPE_CHECKING:
+    from .column import Column
+
+
+class Condition:
+    '''
+    Represents a condition of a WHERE clause, with its structure apart from its values.
+
+    The structure is a hashable key, equal for the conditions that differ only in their
+    values, so the SQL of a query is compiled once per structure (see `Select`). The
+    values are bound as parameters, in the order of their placeholders.
+
+    Conditions are created by the comparison methods of `Column` (`eq`, `lt`, `in_`...)
+    and combined with the `&` (AND), `|` (OR) and `~` (NOT) operators.
+    '''
+
+    __slots__ = ('_key', '_params', '_columns')
+
+    def __init__(self, key: Hashable, params: tuple, columns: tuple['Column', ...]) -> None:
+        '''
+        Parameters
+        ----------
+        key : Hashable
+            The condition's structure: the operator followed by the column's name (and
+            the quantity of values of IN) or by the keys of the combined conditions.
+        params : tuple
+            The condition's values, in the order of their placeholders.
+        columns : tuple[Column, ...]
+            The condition's columns.
+
+        Returns
+        -------
+        None
+
+        Examples
+        --------
+        >>> condition = MyTable.id.gt(10) & MyTable.name.in_(['Ann', 'Bob'])
+        >>> condition.key
+        ('AND', (('>', 'id'), ('IN', 'name', 2)))
+        >>> condition.params
+        (10, 'Ann', 'Bob')
+        '''
+
+        self._key = key
+        self._params = params
+        self._columns = columns
+
+    def __and__(self, other: 'Condition') -> 'Condition':
+        return self._combine('AND', other)
+
+    def __or__(self, other: 'Condition') -> 'Condition':
+        return self._combine('OR', other)
+
+    def __invert__(self) -> 'Condition':
+        return Condition(('NOT', self._key), self._params, self._columns)
+
+    def _combine(self, operator: str, other: 'Condition') -> 'Condition':
+        if not isinstance(other, Condition):
+            return NotImplemented
+
+        # Chains of the same operator are flattened, so `a & b & c` has a single AND.
+        keys = (
+            *self._get_operands(operator),
+            *other._get_operands(operator),
+        )
+
+        return Condition(
+            (operator, keys), self._params + other._params, self._columns + other._columns
+        )
+
+    def _get_operands(self, operator: str) -> tuple[Hashable, ...]:
+        if self._key[0] == operator:
+            return self._key[1]
+
+        return (self._key,)
+
+    def __repr__(self) -> str:
+        return f'Condition({render_condition(self._key, lambda: "?")!r}, {self._params!r})'
+
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    @property
+    def params(self) -> tuple:
+        return self._params
+
+    @property
+    def columns(self) -> tuple['Column', ...]:
+        return self._columns
+
+
+def render_condition(key: Hashable, next_placeholder: Callable[[], str]) -> str:
+    '''
+    Parameters
+    ----------
+    key : Hashable
+        The structure of a condition (see `Condition.key`).
+    next_placeholder : Callable[[], str]
+        Returns the placeholder of the next value.
+
+    Returns
+    -------
+    str
+        The condition's SQL, with the placeholders of its values.
+    '''
+
+    operator = key[0]
+
+    if operator in ('AND', 'OR'):
+        return f' {operator} '.join(
+            f'({render_condition(operand, next_placeholder)})'
+            if operand[0] in ('AND', 'OR')
+            else render_condition(operand, next_placeholder)
+            for operand in key[1]
+        )
+
+    if operator == 'NOT':
+        return f'NOT ({render_condition(key[1], next_placeholder)})'
+
+    column = key[1]
+
+    if operator in ('IS NULL', 'IS NOT NULL'):
+        return f'{column} {operator}'
+
+    if operator == 'IN':
+        return f'{column} IN ({", ".join(next_placeholder() for _ in range(key[2]))})'
+
+    if operator == 'BETWEEN':
+        return f'{column} BETWEEN {next_placeholder()} AND {next_placeholder()}'
+
+    return f'{column} {operator} {next_placeholder()}'
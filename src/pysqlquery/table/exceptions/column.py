@@ -174,6 +174,28 @@ class InvalidDefaultValue(ColumnException):
         super().__init__(self.MESSAGE.format(value=value, data_type=data_type))
 
 
+
+class InvalidMemoSize(ColumnException):
+    '''
+    Exception raised for an invalid memo size value.
+    '''
+
+    MESSAGE = 'Invalid memo_size parameter, it must be a positive int or None: {value!r}'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid memo size.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
 class ColumnAlreadyHasNamedForeignKeyConstraint(ColumnException):
     '''
     Exception raised for when column already own named foreign key constraint.
@@ -216,3 +238,25 @@ class ColumnAlreadyHasNamedUniqueConstraint(ColumnException):
         '''
 
         super().__init__(self.MESSAGE.format(column=column))
+
+
+class EmptyInValues(ColumnException):
+    '''
+    Exception raised for when an IN condition is created without values.
+    '''
+
+    MESSAGE = 'The IN condition of the {column} column must have at least one value'
+
+    def __init__(self, column: str) -> None:
+        '''
+        Parameters
+        ----------
+        column : str
+            The column's name.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(column=column))
@@ -3,7 +3,7 @@ Defines the base exception classes for SQL table.
 '''
 
 from abc import ABCMeta
-from typing import Any
+from typing import Any, Iterable
 
 
 class TableException(Exception, metaclass=ABCMeta):
@@ -155,3 +155,431 @@ class InvalidCreateIfNotExistsValue(TableException):
         '''
 
         super().__init__(self.MESSAGE.format(table=table, value=value))
+
+
+class InvalidWorkersValue(TableException):
+    '''
+    Exception raised for an invalid workers value.
+    '''
+
+    MESSAGE = 'The workers parameter must be a positive int or None, but {value!r} was passed'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid workers value.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class InvalidChunkSizeValue(TableException):
+    '''
+    Exception raised for an invalid chunk size value.
+    '''
+
+    MESSAGE = 'The chunk_size parameter must be a positive int or None, but {value!r} was passed'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid chunk size value.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class InvalidMaxRowsValue(TableException):
+    '''
+    Exception raised for an invalid maximum of rows per statement.
+    '''
+
+    MESSAGE = 'The max_rows parameter must be a positive int or None, but {value!r} was passed'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid maximum of rows.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class InvalidMaxBytesValue(TableException):
+    '''
+    Exception raised for an invalid maximum size of statements.
+    '''
+
+    MESSAGE = 'The max_bytes parameter must be a positive int or None, but {value!r} was passed'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid maximum size.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class RowTooLarge(TableException):
+    '''
+    Exception raised for when a single row doesn't fit in a statement of the maximum size.
+    '''
+
+    MESSAGE = (
+        'The row {row} of {table} table takes a {size} bytes statement, '
+        'but the maximum is {max_bytes} bytes'
+    )
+
+    def __init__(self, table: str, row: int, size: int, max_bytes: int) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        row : int
+            The row's index.
+        size : int
+            The size of the statement with only the row.
+        max_bytes : int
+            The maximum size of the statements.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(
+            self.MESSAGE.format(table=table, row=row, size=size, max_bytes=max_bytes)
+        )
+
+
+class InvalidCopyFormat(TableException):
+    '''
+    Exception raised for an invalid format of bulk loader files.
+    '''
+
+    MESSAGE = (
+        "The format parameter must be 'pg_text', 'pg_csv' or 'mysql_infile', "
+        "but {value!r} was passed"
+    )
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid format.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class UnnamedCopyFile(TableException):
+    '''
+    Exception raised for when a bulk loader's statement needs the path of a file object
+    without name.
+    '''
+
+    MESSAGE = (
+        'The statement of the {format} format loads the {table} table from a path, '
+        'but the file object has no name'
+    )
+
+    def __init__(self, table: str, format: str) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        format : str
+            The format's name.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(table=table, format=format))
+
+
+class InvalidParamstyle(TableException):
+    '''
+    Exception raised for an invalid DB-API parameter style.
+    '''
+
+    MESSAGE = (
+        "The paramstyle parameter must be 'qmark', 'numeric', 'named', 'format' or "
+        "'pyformat', but {value!r} was passed"
+    )
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid parameter style.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class InvalidUpdateTable(TableException):
+    '''
+    Exception raised for when UPDATE statements are requested for a table without
+    primary key or without columns out of its primary key.
+    '''
+
+    MESSAGE = (
+        'The {table} table must have a primary key and columns out of it '
+        'to receive UPDATE statements'
+    )
+
+    def __init__(self, table: str) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(table=table))
+
+
+class InvalidUpsertDialect(TableException):
+    '''
+    Exception raised for when UPSERT statements are requested for a dialect that
+    doesn't support them.
+    '''
+
+    MESSAGE = (
+        'The given value is an invalid dialect for UPSERT statements: {dialect!r} '
+        '(the dialects are {dialects})'
+    )
+
+    def __init__(self, dialect: Any, dialects: Iterable[str]) -> None:
+        '''
+        Parameters
+        ----------
+        dialect : Any
+            The requested dialect.
+        dialects : Iterable[str]
+            The dialects that support UPSERT statements.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(dialect=dialect, dialects=', '.join(dialects)))
+
+
+class InvalidUpsertTable(TableException):
+    '''
+    Exception raised for when UPSERT statements are requested for a table without
+    primary key and without exactly one unique column (their conflict target).
+    '''
+
+    MESSAGE = (
+        'The {table} table must have a primary key or exactly one unique column '
+        'to receive UPSERT statements'
+    )
+
+    def __init__(self, table: str) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(table=table))
+
+
+class ColumnNotFound(TableException):
+    '''
+    Exception raised for when a table doesn't have the requested column.
+    '''
+
+    MESSAGE = 'The {table} table doesn\'t have a column named {column!r}'
+
+    def __init__(self, table: str, column: Any) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        column : Any
+            The requested column's name.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(table=table, column=column))
+
+
+class ColumnLengthMismatch(TableException):
+    '''
+    Exception raised for when the columns of column-oriented data have different lengths.
+    '''
+
+    MESSAGE = (
+        'The {column} column of {table} table has {length} values, '
+        'but the other columns have {expected}'
+    )
+
+    def __init__(self, table: str, column: str, length: int, expected: int) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        column : str
+            The column's name.
+        length : int
+            The quantity of values of the column.
+        expected : int
+            The quantity of values of the other columns.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(
+            self.MESSAGE.format(table=table, column=column, length=length, expected=expected)
+        )
+
+
+class InvalidRows(TableException):
+    '''
+    Exception raised for when bulk validated rows have invalid values.
+    '''
+
+    MESSAGE = 'The {table} table received {qty_errors} invalid values, the first one:\n{message}'
+
+    def __init__(self, table: str, qty_errors: int, message: str) -> None:
+        '''
+        Parameters
+        ----------
+        table : str
+            The table's name.
+        qty_errors : int
+            The quantity of errors.
+        message : str
+            The first error's message.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(table=table, qty_errors=qty_errors, message=message))
+
+
+class InvalidQueryCacheSize(TableException):
+    '''
+    Exception raised for an invalid maximum size of the query cache.
+    '''
+
+    MESSAGE = 'Invalid maxsize parameter, it must be a non-negative int or None: {value!r}'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid maximum size.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class InvalidLimitValue(TableException):
+    '''
+    Exception raised for an invalid LIMIT of a SELECT query.
+    '''
+
+    MESSAGE = 'Invalid limit parameter, it must be a non-negative int: {value!r}'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid limit.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
+
+
+class InvalidOffsetValue(TableException):
+    '''
+    Exception raised for an invalid OFFSET of a SELECT query.
+    '''
+
+    MESSAGE = 'Invalid offset parameter, it must be a non-negative int or None: {value!r}'
+
+    def __init__(self, value: Any) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The invalid offset.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value))
@@ -0,0 +1,285 @@
+'''
+Defines the Select class for building SELECT queries of SQL tables.
+'''
+
+from typing import TYPE_CHECKING, Any, Hashable
+
+from .base import QueryCache
+from .column import Column
+from .condition import Condition, render_condition
+from .exceptions.table import InvalidLimitValue, InvalidOffsetValue
+
+if TYPE_CHECKING:
+    from .table import Table
+
+
+def _compile_select(key: Hashable) -> tuple[str, tuple[str, ...] | None]:
+    # Compiles the query of a structure (see `Select._get_key`, which has the placeholder
+    # of the parameter style), returning its SQL and the names of its parameters (None
+    # for positional parameter styles).
+    table, columns, where, order_by, has_limit, has_offset, placeholder = key
+    position = 0
+
+    def next_placeholder() -> str:
+        nonlocal position
+        position += 1
+
+        return placeholder.format(name=f'p{position}', position=position)
+
+    query = f'SELECT {", ".join(column.name for column in columns)} FROM {table}'
+
+    if where is not None:
+        query += f' WHERE {render_condition(where, next_placeholder)}'
+
+    if order_by:
+        query += ' ORDER BY ' + ', '.join(
+            f'{column} DESC' if descending else column for column, descending in order_by
+        )
+
+    if has_limit:
+        query += f' LIMIT {next_placeholder()}'
+
+    if has_offset:
+        query += f' OFFSET {next_placeholder()}'
+
+    if '{name}' in placeholder:
+        return query, tuple(f'p{i}' for i in range(1, position + 1))
+
+    return query, None
+
+
+class Select:
+    '''
+    Represents a SELECT query of a table, built by `Table.select`.
+
+    Each method returns a new query, so a query can be the base of others. The values
+    of the query (of its conditions, LIMIT and OFFSET) are bound as parameters, and its
+    SQL is compiled once per structure and kept in the bounded `cache` (shared by every
+    table), so the queries built again and again with the same structure are only bound
+    to their values.
+    '''
+
+    __slots__ = ('_table', '_columns', '_where', '_order_by', '_limit', '_offset')
+
+    _DEFAULT_CACHE_SIZE = 1024
+    cache = QueryCache(_compile_select, _DEFAULT_CACHE_SIZE)
+    '''The cache of compiled queries, by structure, with least recently used eviction.'''
+
+    def __init__(self, table: 'Table', columns: tuple[Column, ...]) -> None:
+        '''
+        Parameters
+        ----------
+        table : Table
+            The queried table.
+        columns : tuple[Column, ...]
+            The selected columns.
+
+        Returns
+        -------
+        None
+        '''
+
+        self._table = table
+        self._columns = columns
+        self._where: Condition | None = None
+        self._order_by: tuple[tuple[str, bool], ...] = ()
+        self._limit: int | None = None
+        self._offset: int | None = None
+
+    def _copy(self) -> 'Select':
+        query = object.__new__(Select)
+        query._table = self._table
+        query._columns = self._columns
+        query._where = self._where
+        query._order_by = self._order_by
+        query._limit = self._limit
+        query._offset = self._offset
+
+        return query
+
+    def where(self, *conditions: Condition) -> 'Select':
+        '''
+        Parameters
+        ----------
+        *conditions : Condition
+            The conditions the rows must satisfy (created by the comparison methods of
+            the table's columns), combined with the previous ones by AND.
+
+        Returns
+        -------
+        Select
+            The query with the conditions.
+
+        Raises
+        ------
+        ColumnNotFound
+            If a condition has a column of another table.
+
+        Examples
+        --------
+        >>> query = my_table.select().where(MyTable.id.gt(10), MyTable.name.ne(None))
+        >>> query.compile()
+        ('SELECT id, name FROM MYTABLE WHERE id > ? AND name IS NOT NULL', (10,))
+        '''
+
+        query = self._copy()
+
+        for condition in conditions:
+            for column in condition.columns:
+                self._table._get_own_column(column)
+
+            query._where = condition if query._where is None else query._where & condition
+
+        return query
+
+    def order_by(self, *columns: str | Column) -> 'Select':
+        '''
+        Parameters
+        ----------
+        *columns : str | Column
+            The columns (or their names) the rows are sorted by, after the previous ones.
+            The names starting with `-` are sorted in descending order.
+
+        Returns
+        -------
+        Select
+            The query with the order.
+
+        Raises
+        ------
+        ColumnNotFound
+            If the table doesn't have a column.
+
+        Examples
+        --------
+        >>> my_table.select().order_by('-name', MyTable.id).compile()
+        ('SELECT id, name FROM MYTABLE ORDER BY name DESC, id', ())
+        '''
+
+        order_by = []
+
+        for column in columns:
+            descending = isinstance(column, str) and column.startswith('-')
+
+            if descending:
+                column = column[1:]
+
+            order_by.append((self._table._get_own_column(column).name, descending))
+
+        query = self._copy()
+        query._order_by = self._order_by + tuple(order_by)
+
+        return query
+
+    def limit(self, limit: int, offset: int | None = None) -> 'Select':
+        '''
+        Parameters
+        ----------
+        limit : int
+            The maximum quantity of rows.
+        offset : int | None
+            The quantity of rows skipped before the first one (None for no offset).
+
+        Returns
+        -------
+        Select
+            The query with the LIMIT (and OFFSET) clause.
+
+        Raises
+        ------
+        InvalidLimitValue
+            If the limit isn't a non-negative int.
+        InvalidOffsetValue
+            If the offset isn't a non-negative int or None.
+        '''
+
+        if not self._is_non_negative_int(limit):
+            raise InvalidLimitValue(limit)
+
+        if offset is not None and not self._is_non_negative_int(offset):
+            raise InvalidOffsetValue(offset)
+
+        query = self._copy()
+        query._limit = limit
+        query._offset = offset
+
+        return query
+
+    def _is_non_negative_int(self, value: Any) -> bool:
+        return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+    def compile(self, paramstyle: str = 'qmark') -> tuple[str, tuple | dict[str, Any]]:
+        '''
+        Compiles the query, or reuses the SQL of a cached query with the same structure.
+
+        Parameters
+        ----------
+        paramstyle : str
+            The DB-API parameter style of the database module (see
+            `Table.prepare_insert`). The named styles use `p1`, `p2`... as names.
+
+        Returns
+        -------
+        tuple[str, tuple | dict[str, Any]]
+            The query's SQL and its parameters: a tuple for positional styles or a dict
+            by name for `'named'` and `'pyformat'`.
+
+        Raises
+        ------
+        InvalidParamstyle
+            If the parameter style isn't supported.
+
+        Examples
+        --------
+        >>> query = my_table.select('name').where(MyTable.id.in_([1, 2])).limit(10)
+        >>> query.compile()
+        ('SELECT name FROM MYTABLE WHERE id IN (?, ?) LIMIT ?', (1, 2, 10))
+        >>> query.compile('named')[1]
+        {'p1': 1, 'p2': 2, 'p3': 10}
+        >>> cursor.execute(*query.compile())
+        '''
+
+        self._table._validate_paramstyle(paramstyle)
+
+        query, names = self.cache.get(self._get_key(paramstyle))
+        params = self.params
+
+        if names is not None:
+            return query, dict(zip(names, params))
+
+        return query, params
+
+    def _get_key(self, paramstyle: str) -> Hashable:
+        return (
+            self._table._name,
+            self._columns,
+            None if self._where is None else self._where.key,
+            self._order_by,
+            self._limit is not None,
+            self._offset is not None,
+            self._table._PLACEHOLDERS[paramstyle],
+        )
+
+    def __str__(self) -> str:
+        '''
+        Returns
+        -------
+        str
+            The query's SQL, with `?` placeholders.
+        '''
+
+        return self.compile()[0]
+
+    @property
+    def params(self) -> tuple:
+        '''The query's values, in the order of their placeholders.'''
+
+        params = () if self._where is None else self._where.params
+
+        if self._limit is not None:
+            params += (self._limit,)
+
+        if self._offset is not None:
+            params += (self._offset,)
+
+        return params
@@ -2,21 +2,57 @@
 Defines the Table class for constructing SQL tables.
 '''
 
-import re
-from typing import Any
+import csv
+import io
+import os
+from importlib import import_module
+from itertools import chain, islice
+from operator import itemgetter
+from os import PathLike
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Sequence
 
 from ..constraints import ForeignKeyConstraint, PrimaryKeyConstraint, UniqueConstraint
 from ..constraints.base.named_constraint import NamedConstraint
+from ..types.base.sql_type import SQLType
+from ..utils.identifier import is_valid_identifier
+from ..utils.parallel import get_fork_context, imap_in_process_pool
 from . import Column
-from .base import TableMeta
+from .base import (
+    COPY_FORMATS,
+    CopyFormat,
+    CsvError,
+    ErrorBitmap,
+    ErrorReport,
+    RenderPlan,
+    RowValidator,
+    TableMeta,
+    compile_row_validator,
+)
 from .exceptions.table import (
+    ColumnLengthMismatch,
+    ColumnNotFound,
+    InvalidChunkSizeValue,
     InvalidConstraintList,
+    InvalidCopyFormat,
     InvalidCreateIfNotExistsValue,
+    InvalidMaxBytesValue,
+    InvalidMaxRowsValue,
     InvalidName,
     InvalidNamedConstraint,
+    InvalidParamstyle,
     InvalidTestValue,
+    InvalidUpdateTable,
+    InvalidUpsertDialect,
+    InvalidUpsertTable,
+    InvalidWorkersValue,
     MultiplePrimaryKeyConstraints,
+    RowTooLarge,
+    UnnamedCopyFile,
 )
+from .select import Select
+
+if TYPE_CHECKING:
+    import numpy
 
 
 class Table(metaclass=TableMeta):
@@ -32,6 +68,21 @@ class Table(metaclass=TableMeta):
 
     _tables: list['Table'] = []
 
+    _COMPRESSED_FILE_MODULES = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'lzma'}
+    _MIN_TABLES_FOR_PARALLEL_RENDER = 500
+    _DEFAULT_VALIDATION_CHUNK_SIZE = 10_000
+    _DEFAULT_CSV_BUFFER_SIZE = 1 << 20
+    _DEFAULT_INSERT_MAX_ROWS = 1000
+    _DEFAULT_COPY_BUFFER_SIZE = 1 << 20
+    _PLACEHOLDERS = {
+        'qmark': '?',
+        'numeric': ':{position}',
+        'named': ':{name}',
+        'format': '%s',
+        'pyformat': '%({name})s',
+    }
+    _UPSERT_DIALECTS = ('postgresql', 'sqlite', 'mysql')
+
     def __init__(self, *, create_if_not_exists: bool = False, test: bool = False) -> None:
         '''
         Parameters
@@ -130,9 +181,15 @@ class Table(metaclass=TableMeta):
         self._validate_create_if_not_exists(create_if_not_exists)
         self._create_if_not_exists: bool = create_if_not_exists
 
+        self._create_query: str | None = None
+        self._create_query_version: int | None = None
+
         if self.__constraints__ is not None:
             self._validate_named_constraints(self.__constraints__)
-            self._set_named_constraints_on_columns(self.__constraints__)
+
+            if not self._named_constraints_wired:
+                self._set_named_constraints_on_columns(self.__constraints__)
+                self.__class__._named_constraints_wired = True
 
         if not self._test:
             self._tables.append(self)
@@ -142,7 +199,7 @@ class Table(metaclass=TableMeta):
             raise InvalidName(name)
 
     def _is_name_valid(self, name: str) -> bool:
-        return isinstance(name, str) and re.search(r'^[a-zA-Z][a-zA-Z0-9_]*$', name)
+        return is_valid_identifier(name)
 
     def _validate_test(self, test: bool) -> None:
         if not self._is_bool(test):
@@ -163,13 +220,12 @@ class Table(metaclass=TableMeta):
             raise MultiplePrimaryKeyConstraints(self._name)
 
         for constraint in constraints:
-            if isinstance(constraint.column, str):
-                if not self._is_constraint_column_a_valid_table_column(constraint.column):
+            for column_name in self._get_constraint_column_names(constraint.column):
+                if not self._is_constraint_column_a_valid_table_column(column_name):
                     raise InvalidNamedConstraint(self._name, constraint.name)
-            else:
-                for column in constraint.column:
-                    if not self._is_constraint_column_a_valid_table_column(column):
-                        raise InvalidNamedConstraint(self._name, constraint.name)
+
+    def _get_constraint_column_names(self, const_column: str | list[str]) -> list[str]:
+        return [const_column] if isinstance(const_column, str) else const_column
 
     def _is_constraint_list_valid(self, constraints: list[NamedConstraint]) -> bool:
         if isinstance(constraints, list):
@@ -189,13 +245,7 @@ class Table(metaclass=TableMeta):
         return len(pk_consts) > 1
 
     def _is_constraint_column_a_valid_table_column(self, constraint_column: str) -> bool:
-        for column in self.columns:
-            if constraint_column == column.name:
-                break
-        else:
-            return False
-
-        return True
+        return constraint_column in self._columns_by_name
 
     def _set_named_constraints_on_columns(self, constraints: list[NamedConstraint]) -> None:
         pk_consts = [
@@ -218,29 +268,110 @@ class Table(metaclass=TableMeta):
             self._set_named_unique_on_column(un_const.column)
 
     def _set_named_primary_key_on_column(self, const_column: str | list[str]) -> None:
-        for table_column in self._columns:
-            if isinstance(const_column, str):
-                if table_column.name == const_column:
-                    table_column.define_primary_key_from_named_constraint()
-            else:
-                for const_column_name in const_column:
-                    if table_column.name == const_column_name:
-                        table_column.define_primary_key_from_named_constraint()
+        for column_name in self._get_constraint_column_names(const_column):
+            self._columns_by_name[column_name].define_primary_key_from_named_constraint()
 
     def _set_named_foreign_key_on_column(self, fk_const: ForeignKeyConstraint) -> None:
-        for table_column in self._columns:
-            if isinstance(fk_const.column, str):
-                if table_column.name == fk_const.column:
-                    table_column.define_foreign_key_from_named_constraint(fk_const)
-            else:
-                for const_column_name in fk_const.column:
-                    if table_column.name == const_column_name:
-                        table_column.define_foreign_key_from_named_constraint(fk_const)
+        for column_name in self._get_constraint_column_names(fk_const.column):
+            self._columns_by_name[column_name].define_foreign_key_from_named_constraint(fk_const)
 
     def _set_named_unique_on_column(self, const_column: str) -> None:
-        for table_column in self._columns:
-            if table_column.name == const_column:
-                table_column.define_unique_from_named_constraint()
+        self._columns_by_name[const_column].define_unique_from_named_constraint()
+
+    def column(self, name: str) -> Column:
+        '''
+        Returns the table's column with the given name.
+
+        Parameters
+        ----------
+        name : str
+            The column's name.
+
+        Returns
+        -------
+        Column
+            The column with the given name.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(50))
+        ...
+        >>> my_table = MyTable()
+        >>> print(my_table.column('name'))
+        name VARCHAR(50) NOT NULL
+        >>> print(my_table['name'])
+        name VARCHAR(50) NOT NULL
+        '''
+
+        column_name = name.strip().lower() if isinstance(name, str) else name
+
+        try:
+            return self._columns_by_name[column_name]
+        except (KeyError, TypeError):
+            raise ColumnNotFound(self._name, name) from None
+
+    def __getitem__(self, name: str) -> Column:
+        return self.column(name)
+
+    def _get_own_column(self, column: str | Column) -> Column:
+        # The table's column with the given name, or the given column if it's the table's.
+        if column.__class__ is str and column in self._columns_by_name:
+            # Fast path for the exact names, which don't need to be normalized.
+            return self._columns_by_name[column]
+
+        if not isinstance(column, Column):
+            return self.column(column)
+
+        if self._columns_by_name.get(column.name) is not column:
+            raise ColumnNotFound(self._name, column.name)
+
+        return column
+
+    def select(self, *columns: str | Column) -> Select:
+        '''
+        Starts a SELECT query of the table (see `Select`).
+
+        Parameters
+        ----------
+        *columns : str | Column
+            The selected columns (or their names). If there are no columns, all the
+            table's columns are selected.
+
+        Returns
+        -------
+        Select
+            The query, to be refined by its `where`, `order_by` and `limit` methods and
+            compiled by its `compile` method.
+
+        Raises
+        ------
+        ColumnNotFound
+            If the table doesn't have a column.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(50))
+        ...
+        >>> query = (
+        ...     MyTable().select('name')
+        ...     .where(MyTable.id.between(10, 20) | MyTable.name.like('A%'))
+        ...     .order_by('-id')
+        ...     .limit(5)
+        ... )
+        >>> print(query)
+        SELECT name FROM MYTABLE WHERE id BETWEEN ? AND ? OR name LIKE ? ORDER BY id DESC LIMIT ?
+        >>> query.params
+        (10, 20, 'A%', 5)
+        '''
+
+        if not columns:
+            return Select(self, tuple(self._columns))
+
+        return Select(self, tuple(self._get_own_column(column) for column in columns))
 
     def __str__(self) -> str:
         '''
@@ -248,53 +379,1173 @@ class Table(metaclass=TableMeta):
         -------
         str
             A string representation of the class instance in SQL format.
+
+        The rendered query is cached and only rebuilt when a named constraint
+        changes any of the table's columns.
+        '''
+
+        if self._create_query_version != self._columns_version:
+            self._create_query = self._render_create_query()
+            self._create_query_version = self._columns_version
+
+        return self._create_query
+
+    def validate_csv(
+        self,
+        source: str | PathLike | IO,
+        *,
+        dialect: str | csv.Dialect = 'excel',
+        delimiter: str | None = None,
+        encoding: str = 'UTF-8',
+        null: str | None = '',
+        buffer_size: int = _DEFAULT_CSV_BUFFER_SIZE,
+    ) -> Iterator[CsvError]:
+        '''
+        Validates a delimited (CSV, TSV...) file against the table's columns, yielding
+        its invalid fields.
+
+        The file is streamed one record at a time: its header names the columns of the
+        fields, each field is converted by its column's `SQLType.parse_text` and the
+        record is validated by a row validator compiled for the header's columns (see
+        `compile_validator`). The table's columns that aren't in the header aren't
+        validated.
+
+        Parameters
+        ----------
+        source : str | PathLike | IO
+            The file's path or an open (text or binary) file object. Paths ending with
+            `.gz`, `.bz2` or `.xz` are decompressed while they are read.
+        dialect : str | csv.Dialect
+            The `csv` dialect of the file.
+        delimiter : str | None
+            The fields' delimiter, replacing the dialect's one (like `'\\t'` for TSV).
+        encoding : str
+            The file's encoding.
+        null : str | None
+            The text of NULL fields (None if the file has no NULL fields).
+        buffer_size : int
+            The size of the buffer the file is read with, in bytes.
+
+        Returns
+        -------
+        Iterator[CsvError]
+            A generator with each invalid field (and each record with a wrong number of
+            fields), in the file's order.
+
+        Raises
+        ------
+        ColumnNotFound
+            If the header has a column that the table doesn't have.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> for error in MyTable().validate_csv('customers.csv.gz'):
+        ...     print(error)
+        ...
+        CsvError(line=3, column='name', value='Annabelle')
+        CsvError(line=7, column='id', value='')
         '''
 
-        unnamed_pk_consts_str = ''
-        unnamed_pk_consts = [
-            column.name for column in self.primary_key if not column.is_primary_key_named()
+        fmtparams = {} if delimiter is None else {'delimiter': delimiter}
+
+        if not hasattr(source, 'read'):
+            with self._open_file_for_reading(source, encoding, buffer_size) as file:
+                yield from self._iter_csv_errors(csv.reader(file, dialect, **fmtparams), null)
+            return
+
+        if isinstance(source, io.TextIOBase):
+            yield from self._iter_csv_errors(csv.reader(source, dialect, **fmtparams), null)
+            return
+
+        file = io.TextIOWrapper(source, encoding=encoding, newline='')
+
+        try:
+            yield from self._iter_csv_errors(csv.reader(file, dialect, **fmtparams), null)
+        finally:
+            # Detaching keeps the caller's file open when the wrapper is collected.
+            file.detach()
+
+    @classmethod
+    def _open_file_for_reading(
+        cls, path: str | PathLike, encoding: str, buffer_size: int
+    ) -> IO:
+        suffix = os.path.splitext(path)[1].lower()
+        module_name = cls._COMPRESSED_FILE_MODULES.get(suffix)
+
+        if module_name is not None:
+            binary_file = import_module(module_name).open(path, 'rb')
+
+            return io.TextIOWrapper(
+                io.BufferedReader(binary_file, buffer_size), encoding=encoding, newline=''
+            )
+
+        return open(path, encoding=encoding, newline='', buffering=buffer_size)
+
+    def _iter_csv_errors(
+        self, reader: Iterator[list[str]], null: str | None
+    ) -> Iterator[CsvError]:
+        header = next(reader, None)
+
+        if header is None:
+            return
+
+        columns = [self.column(name) for name in header]
+        validate_row = compile_row_validator(self._name, columns)
+
+        # Text SQL types don't convert their fields.
+        parsers = [
+            (
+                None
+                if type(column.data_type).parse_text is SQLType.parse_text
+                else column.data_type.parse_text
+            )
+            for column in columns
         ]
 
-        if unnamed_pk_consts:
-            unnamed_pk_consts_str = f'PRIMARY KEY ({", ".join(unnamed_pk_consts)})'
+        for fields in reader:
+            if len(fields) != len(columns):
+                if fields:
+                    yield CsvError(reader.line_num, None, None)
+                continue
+
+            values = []
+
+            for parse_text, text in zip(parsers, fields):
+                if text == null:
+                    values.append(None)
+                elif parse_text is None:
+                    values.append(text)
+                else:
+                    try:
+                        values.append(parse_text(text))
+                    except ValueError:
+                        values.append(_UNPARSABLE_TEXT)
+
+            errors = validate_row(values)
+
+            while errors:
+                i = (errors & -errors).bit_length() - 1
+                yield CsvError(reader.line_num, columns[i].name, fields[i])
+                errors &= errors - 1
+
+    def _render_create_query(self) -> str:
+        return self._get_render_plan().render(self._create_if_not_exists)
+
+    def _get_render_plan(self) -> RenderPlan:
+        table_cls = self.__class__
+
+        if table_cls._render_plan_version != table_cls._columns_version:
+            table_cls._render_plan = RenderPlan(self._name, self._columns, self.__constraints__)
+            table_cls._render_plan_version = table_cls._columns_version
+
+        return table_cls._render_plan
+
+    def compile_validator(self) -> RowValidator:
+        '''
+        Returns the row validator of this table class.
+
+        The validator is a function generated for the table's columns, with each
+        column's SQL type check inlined and its nullability and bounds written as
+        constants. It's compiled once per table class (and recompiled when a named
+        constraint changes any of the table's columns).
+
+        Returns
+        -------
+        RowValidator
+            A function that receives a row (a sequence with one value per column, in
+            the order of `columns`) and returns the bitmask of its invalid columns: the
+            bit `1 << i` is set when the value of the i-th column is invalid, so 0 means
+            a valid row. A row with a wrong quantity of values has all the bits set.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> validate_row = MyTable().compile_validator()
+        >>> validate_row((1, 'Ann'))
+        0
+        >>> validate_row((1, None))
+        0
+        >>> validate_row((None, 'Annabelle'))
+        3
+        '''
+
+        table_cls = self.__class__
+
+        if table_cls._row_validator_version != table_cls._columns_version:
+            table_cls._row_validator = compile_row_validator(self._name, self._columns)
+            table_cls._row_validator_version = table_cls._columns_version
+
+        return table_cls._row_validator
+
+    def validate_row(self, row: Sequence[Any]) -> bool:
+        '''
+        Validates a row against the table's columns (see `compile_validator`).
+
+        Parameters
+        ----------
+        row : Sequence[Any]
+            The row's values, in the order of `columns`.
+
+        Returns
+        -------
+        bool
+            True if every value is valid for its column, False otherwise.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> my_table = MyTable()
+        >>> my_table.validate_row((1, 'Ann'))
+        True
+        >>> my_table.validate_row((1, 'Annabelle'))
+        False
+        '''
+
+        return not self.compile_validator()(row)
+
+    def validate_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        workers: int | None = None,
+        chunk_size: int | None = None,
+        report: bool = False,
+    ) -> dict[int, int] | ErrorReport:
+        '''
+        Validates many rows against the table's columns (see `compile_validator`).
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The rows, each one with its values in the order of `columns`.
+        workers : int | None
+            If greater than 1, the rows are validated in chunks by a pool of this many
+            processes, each one with the table's validator. Rows that fit in a single
+            chunk, and platforms that can't fork processes, are validated in this process.
+        chunk_size : int | None
+            The number of rows validated by each process task (only used with `workers`).
+            The rows are read from `rows` one chunk at a time, and at most `2 * workers`
+            chunks are in flight.
+        report : bool
+            If the errors must be returned in an `ErrorReport`, with the invalid values
+            and their messages, instead of bitmasks.
+
+        Returns
+        -------
+        dict[int, int] | ErrorReport
+            The bitmask of invalid columns of each invalid row, by the row's index, in
+            the order of `rows`. With `report`, an `ErrorReport` with each invalid value.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> MyTable().validate_rows([(1, 'Ann'), (2, 'Annabelle'), ('3', None)])
+        {1: 2, 2: 1}
+        >>> MyTable().validate_rows(rows, workers=8, chunk_size=50_000)
+        >>> errors = MyTable().validate_rows([(1, 'Ann'), (None, 'Annabelle')], report=True)
+        >>> list(errors.messages())
+        ["Row 1: the id column can't be NULL",
+         "Row 1: the value 'Annabelle' of the name column isn't a valid VARCHAR(5) data"]
+        '''
+
+        self._validate_workers(workers)
+        self._validate_chunk_size(chunk_size)
+
+        if not report:
+            return self._find_invalid_rows(rows, workers, chunk_size, None)
+
+        # Only the invalid values of the invalid rows are kept (and sent back by the
+        # worker processes), not the rows themselves.
+        error_report = ErrorReport(self._name, self._columns)
+        invalid_rows = self._find_invalid_rows(
+            rows, workers, chunk_size, error_report.get_invalid_values
+        )
+
+        for i, (errors, values) in invalid_rows.items():
+            error_report.add_invalid_values(i, errors, values)
+
+        return error_report
+
+    def _find_invalid_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        workers: int | None,
+        chunk_size: int | None,
+        get_invalid_values: Callable[[Sequence[Any], int], tuple | int] | None,
+    ) -> dict[int, Any]:
+        validate_row = self.compile_validator()
+
+        if workers is None or workers == 1 or get_fork_context() is None:
+            return _find_invalid_rows(validate_row, get_invalid_values, 0, rows)
+
+        chunks = self._iter_row_chunks(rows, chunk_size or self._DEFAULT_VALIDATION_CHUNK_SIZE)
+        first_chunk = next(chunks, None)
+        second_chunk = next(chunks, None)
+
+        if second_chunk is None:
+            return _find_invalid_rows(
+                validate_row, get_invalid_values, 0, first_chunk[1] if first_chunk else []
+            )
+
+        invalid_rows = {}
+
+        chunks = chain((first_chunk, second_chunk), chunks)
+
+        for chunk_invalid_rows in imap_in_process_pool(
+            _validate_rows_chunk,
+            chunks,
+            workers,
+            initializer=_set_worker_row_validator,
+            initargs=(validate_row, get_invalid_values),
+        ):
+            invalid_rows.update(chunk_invalid_rows)
+
+        return invalid_rows
+
+    @classmethod
+    def _validate_chunk_size(cls, chunk_size: int | None) -> None:
+        if not cls._is_positive_int_or_none(chunk_size):
+            raise InvalidChunkSizeValue(chunk_size)
+
+    @staticmethod
+    def _iter_row_chunks(
+        rows: Iterable[Sequence[Any]], chunk_size: int
+    ) -> Iterator[tuple[int, list[Sequence[Any]]]]:
+        rows = iter(rows)
+        start = 0
+
+        while chunk := list(islice(rows, chunk_size)):
+            yield start, chunk
+            start += len(chunk)
+
+    def validate_columns(
+        self, data: 'Mapping[str, Sequence[Any] | numpy.ndarray]', *, report: bool = False
+    ) -> ErrorBitmap | ErrorReport:
+        '''
+        Validates column-oriented data against the table's columns.
+
+        Each column's values are validated at once (see `Column.validate_values`), with
+        the vectorized checks of its SQL type when they're in a NumPy array, and the
+        errors are returned in a bitmap with one bit per value.
+
+        Parameters
+        ----------
+        data : Mapping[str, Sequence[Any] | numpy.ndarray]
+            The one-dimensional values of each column, by the column's name. All the
+            columns must have the same quantity of values. The table's columns that
+            aren't in `data` aren't validated.
+        report : bool
+            If the errors must be returned in an `ErrorReport`, with the invalid values
+            and their messages, instead of a bitmap.
+
+        Returns
+        -------
+        ErrorBitmap | ErrorReport
+            The invalid values of each row, where the bit `1 << i` of a row is the i-th
+            column of `columns`, and the quantity of errors of each column. With
+            `report`, an `ErrorReport` with each invalid value.
+
+        Raises
+        ------
+        ColumnNotFound
+            If `data` has a column that the table doesn't have.
+        ColumnLengthMismatch
+            If the columns have different quantities of values.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> errors = MyTable().validate_columns(
+        ...     {'id': numpy.array([1, 2, 3]), 'name': ['Ann', 'Annabelle', None]}
+        ... )
+        >>> errors.error_counts
+        {'id': 0, 'name': 1}
+        >>> errors.invalid_rows()
+        [1]
+        >>> errors.invalid_columns(1)
+        ['name']
+        '''
+
+        masks = [None] * len(self._columns)
+        columns_values = [None] * len(self._columns)
+        qty_rows = None
+
+        for name, values in data.items():
+            column = self.column(name)
+
+            if qty_rows is None:
+                qty_rows = len(values)
+            elif len(values) != qty_rows:
+                raise ColumnLengthMismatch(self._name, column.name, len(values), qty_rows)
+
+            index = self._columns.index(column)
+            masks[index] = column.validate_values(values)
+            columns_values[index] = values
+
+        bitmap = ErrorBitmap.from_masks(
+            [column.name for column in self._columns], qty_rows or 0, masks
+        )
+
+        if not report:
+            return bitmap
+
+        error_report = ErrorReport(self._name, self._columns)
+
+        for row in bitmap.invalid_rows():
+            errors = bitmap.row_errors(row)
+            values = tuple(
+                self._get_python_value(values[row])
+                for i, values in enumerate(columns_values)
+                if errors >> i & 1
+            )
+            error_report.add_invalid_values(row, errors, values)
+
+        return error_report
+
+    @staticmethod
+    def _get_python_value(value: Any) -> Any:
+        # The values of NumPy arrays are NumPy scalars, which have the Python value.
+        return value.item() if hasattr(value, 'item') else value
+
+    def insert_many(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        max_rows: int | None = _DEFAULT_INSERT_MAX_ROWS,
+        max_bytes: int | None = None,
+        validate: bool = True,
+        dialect: str = 'ansi',
+    ) -> Iterator[str]:
+        '''
+        Yields multi-row INSERT statements with the rows, one batch at a time.
+
+        Each statement inserts at most `max_rows` rows and takes at most `max_bytes` bytes
+        (UTF-8 encoded), like the `max_allowed_packet` of MySQL. The rows are read from
+        `rows` as the statements are consumed, so only one batch is held in memory.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The rows, each one with its values in the order of `columns`.
+        max_rows : int | None
+            The maximum quantity of rows of each statement (None for no maximum).
+        max_bytes : int | None
+            The maximum size of each statement, in bytes (None for no maximum).
+        validate : bool
+            If each row must be validated (see `compile_validator`) before it's rendered.
+        dialect : str
+            The SQL dialect of the values' literals (see `SQLType.render_literal`).
+
+        Returns
+        -------
+        Iterator[str]
+            A generator with each INSERT statement.
+
+        Raises
+        ------
+        InvalidRows
+            If a row doesn't have a value per column or, if `validate`, a row is invalid
+            (the statements of the previous rows were already yielded).
+        RowTooLarge
+            If a single row doesn't fit in a statement of `max_bytes` bytes.
+        NonFiniteLiteral
+            If a NaN or infinite number has no literal in the dialect.
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> rows = [(1, 'Ann'), (2, None), (3, 'Bob')]
+        >>> for statement in MyTable().insert_many(rows, max_rows=2):
+        ...     print(statement)
+        ...
+        INSERT INTO MYTABLE (id, name) VALUES
+            (1, 'Ann'),
+            (2, NULL);
+        INSERT INTO MYTABLE (id, name) VALUES
+            (3, 'Bob');
+        '''
+
+        self._validate_max_rows(max_rows)
+        self._validate_max_bytes(max_bytes)
+
+        yield from self._render_insert_batches(
+            rows, ';', max_rows, max_bytes, validate, self._get_literal_renderers(dialect)
+        )
+
+    def upsert_many(
+        self,
+        rows: Iterable[Sequence[Any]],
+        *,
+        dialect: str = 'postgresql',
+        max_rows: int | None = _DEFAULT_INSERT_MAX_ROWS,
+        max_bytes: int | None = None,
+        validate: bool = True,
+    ) -> Iterator[str]:
+        '''
+        Yields multi-row UPSERT statements with the rows, one batch at a time (see
+        `insert_many`): INSERT statements that update the existing rows with the same
+        conflict target instead of failing.
+
+        The conflict target is the primary key or, in tables without primary key, the
+        only unique column, and the columns out of it are updated. The statements use
+        `ON CONFLICT (...) DO UPDATE` in PostgreSQL and SQLite (or `DO NOTHING`, if every
+        column is in the conflict target) and `ON DUPLICATE KEY UPDATE` in MySQL. The
+        clause is built once per table class. PostgreSQL doesn't accept a statement that
+        updates a row twice, so a batch mustn't have two rows with the same key.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The rows, each one with its values in the order of `columns`.
+        dialect : str
+            The SQL dialect of the statements: `'postgresql'`, `'sqlite'` or `'mysql'`.
+        max_rows : int | None
+            The maximum quantity of rows of each statement (None for no maximum).
+        max_bytes : int | None
+            The maximum size of each statement, in bytes (None for no maximum).
+        validate : bool
+            If each row must be validated (see `compile_validator`) before it's rendered.
+
+        Returns
+        -------
+        Iterator[str]
+            A generator with each UPSERT statement.
+
+        Raises
+        ------
+        InvalidUpsertDialect
+            If the dialect doesn't support UPSERT statements.
+        InvalidUpsertTable
+            If the table has no primary key and doesn't have exactly one unique column.
+        InvalidRows
+            If a row doesn't have a value per column or, if `validate`, a row is invalid
+            (the statements of the previous rows were already yielded).
+        RowTooLarge
+            If a single row doesn't fit in a statement of `max_bytes` bytes.
+        NonFiniteLiteral
+            If a NaN or infinite number has no literal in the dialect.
+
+        Examples
+        --------
+        >>> rows = [(1, 'Ann'), (2, None)]
+        >>> for statement in MyTable().upsert_many(rows):
+        ...     print(statement)
+        ...
+        INSERT INTO MYTABLE (id, name) VALUES
+            (1, 'Ann'),
+            (2, NULL)
+        ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name;
+        >>> for statement in MyTable().upsert_many(rows, dialect='mysql'):
+        ...     print(statement)
+        ...
+        INSERT INTO MYTABLE (id, name) VALUES
+            (1, 'Ann'),
+            (2, NULL)
+        ON DUPLICATE KEY UPDATE name = VALUES(name);
+        '''
+
+        if dialect not in self._UPSERT_DIALECTS:
+            raise InvalidUpsertDialect(dialect, self._UPSERT_DIALECTS)
 
-        unnamed_fk_consts_str = ''
-        unnamed_fk_consts = [
-            str(column.foreign_key)
-            for column in self._columns
-            if column.foreign_key
-            if not column.is_foreign_key_named()
+        self._validate_max_rows(max_rows)
+        self._validate_max_bytes(max_bytes)
+
+        footer = f'\n{self._get_statement_template("upsert", dialect)};'
+
+        yield from self._render_insert_batches(
+            rows, footer, max_rows, max_bytes, validate, self._get_literal_renderers(dialect)
+        )
+
+    def _render_insert_batches(
+        self,
+        rows: Iterable[Sequence[Any]],
+        footer: str,
+        max_rows: int | None,
+        max_bytes: int | None,
+        validate: bool,
+        renderers: list[Callable[[Any], str]],
+    ) -> Iterator[str]:
+        # Yields the multi-row INSERT statements of `insert_many`, each one ending with
+        # `footer` (the final semicolon and any clause before it).
+        validate_row = self.compile_validator() if validate else None
+        qty_columns = len(self._columns)
+        column_names = ', '.join(column.name for column in self._columns)
+        header = f'INSERT INTO {self._name} ({column_names}) VALUES\n\t'
+        separator = ',\n\t'
+        # The size of a statement without rows (the header and the footer).
+        empty_size = len(header.encode()) + len(footer.encode())
+        batch = []
+        size = empty_size
+
+        for i, row in enumerate(rows):
+            if validate_row is None:
+                # Unvalidated rows still need a value per column, as zip would cut them.
+                if len(row) != qty_columns:
+                    self._raise_for_row_errors(i, row, -1)
+            elif errors := validate_row(row):
+                self._raise_for_row_errors(i, row, errors)
+
+            literals = [
+                'NULL' if value is None else render(value)
+                for render, value in zip(renderers, row)
+            ]
+            values = f'({", ".join(literals)})'
+
+            if max_bytes is not None:
+                values_size = len(values) if values.isascii() else len(values.encode())
+
+                if empty_size + values_size > max_bytes:
+                    raise RowTooLarge(self._name, i, empty_size + values_size, max_bytes)
+
+                if batch and size + len(separator) + values_size > max_bytes:
+                    yield f'{header}{separator.join(batch)}{footer}'
+                    batch = []
+                    size = empty_size
+
+                size += values_size + (len(separator) if batch else 0)
+
+            batch.append(values)
+
+            if len(batch) == max_rows:
+                yield f'{header}{separator.join(batch)}{footer}'
+                batch = []
+                size = empty_size
+
+        if batch:
+            yield f'{header}{separator.join(batch)}{footer}'
+
+    def _get_conflict_columns(self) -> list[Column]:
+        # The conflict target of UPSERT statements.
+        if key_columns := self.primary_key:
+            return key_columns
+
+        unique_columns = [column for column in self._columns if column.unique]
+
+        if len(unique_columns) != 1:
+            raise InvalidUpsertTable(self._name)
+
+        return unique_columns
+
+    def _build_upsert_clause(self, dialect: str) -> str:
+        conflict_columns = self._get_conflict_columns()
+        update_names = [
+            column.name for column in self._columns if column not in conflict_columns
         ]
 
-        if unnamed_fk_consts:
-            unnamed_fk_consts_str = ",\n\t".join(unnamed_fk_consts)
+        if dialect == 'mysql':
+            # Without columns to update, a key column is set to itself, so the row is kept.
+            assignments = [f'{name} = VALUES({name})' for name in update_names] or [
+                f'{conflict_columns[0].name} = {conflict_columns[0].name}'
+            ]
+
+            return f'ON DUPLICATE KEY UPDATE {", ".join(assignments)}'
+
+        target = ', '.join(column.name for column in conflict_columns)
+
+        if not update_names:
+            return f'ON CONFLICT ({target}) DO NOTHING'
+
+        assignments = [f'{name} = EXCLUDED.{name}' for name in update_names]
+
+        return f'ON CONFLICT ({target}) DO UPDATE SET {", ".join(assignments)}'
+
+    def _get_literal_renderers(self, dialect: str) -> list[Callable[[Any], str]]:
+        # The functions that render the non-NULL values of each column as literals.
+        sql_dialect = SQLType._get_dialect(dialect)
+
+        return [column.data_type._get_literal_renderer(sql_dialect) for column in self._columns]
 
-        unnamed_consts = (
-            unnamed_pk_consts_str
-            + (',\n\t' if unnamed_pk_consts_str and unnamed_fk_consts_str else '')
-            + unnamed_fk_consts_str
+    @classmethod
+    def _validate_max_rows(cls, max_rows: int | None) -> None:
+        if not cls._is_positive_int_or_none(max_rows):
+            raise InvalidMaxRowsValue(max_rows)
+
+    @classmethod
+    def _validate_max_bytes(cls, max_bytes: int | None) -> None:
+        if not cls._is_positive_int_or_none(max_bytes):
+            raise InvalidMaxBytesValue(max_bytes)
+
+    def _raise_for_row_errors(self, index: int, row: Sequence[Any], errors: int) -> None:
+        report = ErrorReport(self._name, self._columns)
+        report.add_row_errors(index, row, errors)
+        report.raise_for_errors()
+
+    def write_copy(
+        self,
+        rows: Iterable[Sequence[Any]],
+        file: str | PathLike | IO,
+        *,
+        format: str = 'pg_text',
+        encoding: str = 'UTF-8',
+        validate: bool = True,
+        buffer_size: int = _DEFAULT_COPY_BUFFER_SIZE,
+    ) -> str:
+        '''
+        Writes the rows in a data file of a bulk loader, returning the statement that
+        loads it.
+
+        The rows are streamed to the file one field at a time, in the order of `columns`,
+        through a `buffer_size` bytes buffer, and each field is escaped as the loader
+        expects.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The rows, each one with its values in the order of `columns`.
+        file : str | PathLike | IO
+            The file's path or an open (text or binary) file object.
+        format : str
+            The file's format: `'pg_text'` (the text format of PostgreSQL's COPY),
+            `'pg_csv'` (the CSV format of PostgreSQL's COPY) or `'mysql_infile'` (the
+            default format of MySQL's LOAD DATA).
+        encoding : str
+            The file's encoding.
+        validate : bool
+            If each row must be validated (see `compile_validator`) before it's written.
+        buffer_size : int
+            The size of the buffer the file is written with, in bytes.
+
+        Returns
+        -------
+        str
+            The `COPY ... FROM` or `LOAD DATA LOCAL INFILE` statement that loads the file
+            (PostgreSQL's statements load from STDIN the file objects that aren't files
+            on disk, like `sys.stdout`).
+
+        Raises
+        ------
+        InvalidCopyFormat
+            If the format isn't supported.
+        UnnamedCopyFile
+            If the format is `'mysql_infile'` and the file object isn't a file on disk.
+        InvalidRows
+            If a row doesn't have a value per column or, if `validate`, a row is invalid
+            (the previous rows were already written).
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> MyTable().write_copy([(1, 'Ann'), (2, None)], '/tmp/my_table.tsv')
+        "COPY MYTABLE (id, name) FROM '/tmp/my_table.tsv' WITH (FORMAT text, ENCODING 'UTF-8')"
+        >>> print(open('/tmp/my_table.tsv').read())
+        1	Ann
+        2	\\N
+        '''
+
+        copy_format = self._get_copy_format(format)
+
+        path = self._get_copy_file_path(file)
+
+        if path is None and copy_format.NEEDS_PATH:
+            raise UnnamedCopyFile(self._name, format)
+
+        if not hasattr(file, 'write'):
+            with open(file, 'w', encoding=encoding, newline='', buffering=buffer_size) as text_file:
+                self._write_copy_rows(rows, text_file, copy_format, validate)
+        elif isinstance(file, io.TextIOBase):
+            self._write_copy_rows(rows, file, copy_format, validate)
+        else:
+            text_file = io.TextIOWrapper(
+                io.BufferedWriter(file, buffer_size), encoding=encoding, newline=''
+            )
+
+            try:
+                self._write_copy_rows(rows, text_file, copy_format, validate)
+            finally:
+                # Detaching keeps the caller's file open when the wrappers are collected.
+                text_file.detach().detach()
+
+        return copy_format.render_statement(
+            self._name, [column.name for column in self._columns], path, encoding
         )
 
-        columns_str = ',\n\t'.join(str(column) for column in self._columns)
+    def _get_copy_file_path(self, file: str | PathLike | IO) -> str | None:
+        if not hasattr(file, 'write'):
+            return os.path.abspath(file)
+
+        # Only the names of files on disk are paths, not the pseudo names of the
+        # standard streams (like '<stdout>') or of files opened from descriptors.
+        name = getattr(file, 'name', None)
+
+        if isinstance(name, str) and not name.startswith('<') and os.path.isfile(name):
+            return os.path.abspath(name)
+
+        return None
+
+    def _get_copy_format(self, format: str) -> CopyFormat:
+        try:
+            return COPY_FORMATS[format]
+        except (KeyError, TypeError):
+            raise InvalidCopyFormat(format) from None
+
+    def _write_copy_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        file: IO,
+        copy_format: CopyFormat,
+        validate: bool,
+    ) -> None:
+        validate_row = self.compile_validator() if validate else None
+        qty_columns = len(self._columns)
+        formatters = [copy_format.get_value_formatter(column.data_type) for column in self._columns]
+        write = file.write
+        # The separator written after each field.
+        separators = [copy_format.DELIMITER] * (qty_columns - 1) + ['\n']
+
+        for i, row in enumerate(rows):
+            if validate_row is None:
+                # Unvalidated rows still need a value per column, as zip would cut them.
+                if len(row) != qty_columns:
+                    self._raise_for_row_errors(i, row, -1)
+            elif errors := validate_row(row):
+                self._raise_for_row_errors(i, row, errors)
+
+            for value, format_value, separator in zip(row, formatters, separators):
+                write(format_value(value))
+                write(separator)
+
+    def prepare_insert(
+        self, rows: Iterable[Sequence[Any]], *, paramstyle: str = 'qmark', validate: bool = True
+    ) -> tuple[str, Iterator[Sequence[Any] | dict[str, Any]]]:
+        '''
+        Prepares the rows to be inserted by a DB-API `executemany`, with a single INSERT
+        statement with placeholders instead of the rows' values.
+
+        The statement is built once per table class and parameter style (and rebuilt when
+        a named constraint changes any of the table's columns), and the rows' parameters
+        are yielded as `executemany` consumes them.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The rows, each one with its values in the order of `columns`.
+        paramstyle : str
+            The DB-API parameter style of the database module (its `paramstyle`
+            attribute): `'qmark'` (`?`), `'numeric'` (`:1`), `'named'` (`:name`),
+            `'format'` (`%s`) or `'pyformat'` (`%(name)s`).
+        validate : bool
+            If each row must be validated (see `compile_validator`) when it's consumed.
+
+        Returns
+        -------
+        tuple[str, Iterator[Sequence[Any] | dict[str, Any]]]
+            The INSERT statement and a generator with the parameters of each row: the
+            row itself for positional styles, or a dict by column's name for `'named'`
+            and `'pyformat'`.
+
+        Raises
+        ------
+        InvalidRows
+            If a row doesn't have a value per column or, if `validate`, a row is invalid
+            (raised by the generator).
+
+        Examples
+        --------
+        >>> class MyTable(Table):
+        ...     id = Column(Integer, primary_key=True)
+        ...     name = Column(String(5), nullable=True)
+        ...
+        >>> statement, parameters = MyTable().prepare_insert(rows, paramstyle=sqlite3.paramstyle)
+        >>> statement
+        'INSERT INTO MYTABLE (id, name) VALUES (?, ?)'
+        >>> connection.executemany(statement, parameters)
+        '''
 
-        if unnamed_consts:
-            columns_str += ',\n\n\t'
+        self._validate_paramstyle(paramstyle)
 
-        table_repr = (
-            f"CREATE TABLE{' IF NOT EXISTS' if self._create_if_not_exists else ''} "
-            f"{self._name} (\n\t{columns_str}{unnamed_consts}\n);"
+        return (
+            self._get_statement_template('insert', paramstyle),
+            self._iter_parameters(rows, self._columns, None, paramstyle, validate),
         )
 
-        if self.__constraints__ is not None:
-            for constraint in self.__constraints__:
-                table_repr += f'\n\nALTER TABLE {self._name}\n\t{"ADD " + str(constraint)};'
+    def prepare_update(
+        self, rows: Iterable[Sequence[Any]], *, paramstyle: str = 'qmark', validate: bool = True
+    ) -> tuple[str, Iterator[Sequence[Any] | dict[str, Any]]]:
+        '''
+        Prepares the rows to be updated by a DB-API `executemany`, with a single UPDATE
+        statement that sets the columns out of the primary key of the row with the same
+        primary key (see `prepare_insert`).
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence[Any]]
+            The rows, each one with its values in the order of `columns`.
+        paramstyle : str
+            The DB-API parameter style of the database module (see `prepare_insert`).
+        validate : bool
+            If each row must be validated (see `compile_validator`) when it's consumed.
+
+        Returns
+        -------
+        tuple[str, Iterator[Sequence[Any] | dict[str, Any]]]
+            The UPDATE statement and a generator with the parameters of each row: a tuple
+            with the values out of the primary key followed by the primary key's ones for
+            positional styles, or a dict by column's name for `'named'` and `'pyformat'`.
+
+        Raises
+        ------
+        InvalidUpdateTable
+            If the table has no primary key or no columns out of it.
+        InvalidRows
+            If a row doesn't have a value per column or, if `validate`, a row is invalid
+            (raised by the generator).
+
+        Examples
+        --------
+        >>> statement, parameters = MyTable().prepare_update(rows, paramstyle='named')
+        >>> statement
+        'UPDATE MYTABLE SET name = :name WHERE id = :id'
+        '''
 
-        return table_repr
+        self._validate_paramstyle(paramstyle)
+
+        set_columns, key_columns = self._get_update_columns()
+
+        if not set_columns or not key_columns:
+            raise InvalidUpdateTable(self._name)
+
+        columns = set_columns + key_columns
+        # Both lists aren't empty, so the getter always returns a tuple.
+        reorder = itemgetter(*(self._columns.index(column) for column in columns))
+
+        return (
+            self._get_statement_template('update', paramstyle),
+            self._iter_parameters(rows, columns, reorder, paramstyle, validate),
+        )
+
+    def _validate_paramstyle(self, paramstyle: str) -> None:
+        if paramstyle not in self._PLACEHOLDERS:
+            raise InvalidParamstyle(paramstyle)
+
+    def _get_update_columns(self) -> tuple[list[Column], list[Column]]:
+        # The columns set by UPDATE statements and the ones of their WHERE clause.
+        return (
+            [column for column in self._columns if not column.primary_key],
+            [column for column in self._columns if column.primary_key],
+        )
+
+    def _get_statement_template(self, kind: str, variant: str) -> str:
+        # The variant is the parameter style of prepared statements or the dialect of
+        # UPSERT clauses.
+        table_cls = self.__class__
+
+        if table_cls._statement_templates_version != table_cls._columns_version:
+            table_cls._statement_templates = {}
+            table_cls._statement_templates_version = table_cls._columns_version
+
+        template = table_cls._statement_templates.get((kind, variant))
+
+        if template is None:
+            template = self._build_statement_template(kind, variant)
+            table_cls._statement_templates[kind, variant] = template
+
+        return template
+
+    def _build_statement_template(self, kind: str, variant: str) -> str:
+        if kind == 'upsert':
+            return self._build_upsert_clause(variant)
+
+        placeholder = self._PLACEHOLDERS[variant]
+
+        if kind == 'insert':
+            column_names = ', '.join(column.name for column in self._columns)
+            placeholders = ', '.join(
+                placeholder.format(name=column.name, position=i)
+                for i, column in enumerate(self._columns, 1)
+            )
+
+            return f'INSERT INTO {self._name} ({column_names}) VALUES ({placeholders})'
+
+        set_columns, key_columns = self._get_update_columns()
+        assignments = [
+            f'{column.name} = {placeholder.format(name=column.name, position=i)}'
+            for i, column in enumerate(set_columns + key_columns, 1)
+        ]
+
+        return (
+            f'UPDATE {self._name} SET {", ".join(assignments[:len(set_columns)])} '
+            f'WHERE {" AND ".join(assignments[len(set_columns):])}'
+        )
+
+    def _iter_parameters(
+        self,
+        rows: Iterable[Sequence[Any]],
+        columns: list[Column],
+        reorder: Callable[[Sequence[Any]], tuple] | None,
+        paramstyle: str,
+        validate: bool,
+    ) -> Iterator[Sequence[Any] | dict[str, Any]]:
+        validate_row = self.compile_validator() if validate else None
+        qty_columns = len(self._columns)
+        names = [column.name for column in columns]
+        is_named = paramstyle in ('named', 'pyformat')
+
+        for i, row in enumerate(rows):
+            if validate_row is None:
+                # Unvalidated rows still need a value per column, as zip and the reorder
+                # getter would cut them.
+                if len(row) != qty_columns:
+                    self._raise_for_row_errors(i, row, -1)
+            elif errors := validate_row(row):
+                self._raise_for_row_errors(i, row, errors)
+
+            if reorder is not None:
+                row = reorder(row)
+
+            yield dict(zip(names, row)) if is_named else row
+
+    @classmethod
+    def save_all_tables(
+        cls, path: str | PathLike | IO, encoding: str = 'UTF-8', *, workers: int | None = None
+    ) -> None:
+        '''
+        Saves the SQL queries of all tables in a file, writing one table at a time.
+
+        Parameters
+        ----------
+        path : str | PathLike | IO
+            The file's path or an open (text or binary) file object. Paths ending with
+            `.gz`, `.bz2` or `.xz` are compressed while they are written.
+        encoding : str
+            The file's encoding.
+        workers : int | None
+            The number of processes used for rendering the tables (see `iter_create_queries`).
+
+        Returns
+        -------
+        None
+        '''
+
+        cls._validate_workers(workers)
+
+        if hasattr(path, 'write'):
+            cls._write_create_queries(path, encoding, workers)
+            return
+
+        with cls._open_file_for_writing(path, encoding) as file:
+            cls._write_create_queries(file, encoding, workers)
+
+    @classmethod
+    def _open_file_for_writing(cls, path: str | PathLike, encoding: str) -> IO:
+        suffix = os.path.splitext(path)[1].lower()
+        module_name = cls._COMPRESSED_FILE_MODULES.get(suffix)
+
+        if module_name is not None:
+            return import_module(module_name).open(path, 'wt', encoding=encoding)
+
+        return open(path, 'w', encoding=encoding)
+
+    @classmethod
+    def _write_create_queries(cls, file: IO, encoding: str, workers: int | None) -> None:
+        is_text_file = isinstance(file, io.TextIOBase)
+        separator = ''
+
+        for create_query in cls.iter_create_queries(workers=workers):
+            chunk = separator + create_query
+            file.write(chunk if is_text_file else chunk.encode(encoding))
+            separator = '\n\n'
+
+    @classmethod
+    def iter_create_queries(
+        cls, *, workers: int | None = None, chunk_size: int | None = None
+    ) -> Iterator[str]:
+        '''
+        Yields the SQL query of each table in the global list, one at a time.
+
+        Parameters
+        ----------
+        workers : int | None
+            If greater than 1, the tables are rendered in chunks by a pool of this many
+            processes. The queries are still yielded in the global list's order. Small
+            schemas, and platforms that can't fork processes, are rendered in this process.
+        chunk_size : int | None
+            The number of tables rendered by each process task (only used with `workers`).
+
+        Returns
+        -------
+        Iterator[str]
+            A generator with the SQL query of each table.
+        '''
+
+        cls._validate_workers(workers)
+
+        if cls._should_render_in_parallel(workers):
+            yield from cls._iter_create_queries_in_parallel(workers, chunk_size)
+            return
+
+        for table in cls._tables:
+            yield str(table)
+
+    @classmethod
+    def _validate_workers(cls, workers: int | None) -> None:
+        if not cls._is_positive_int_or_none(workers):
+            raise InvalidWorkersValue(workers)
+
+    @classmethod
+    def _is_positive_int_or_none(cls, value: int | None) -> bool:
+        return value is None or (
+            isinstance(value, int) and not isinstance(value, bool) and value > 0
+        )
+
+    @classmethod
+    def _should_render_in_parallel(cls, workers: int | None) -> bool:
+        return (
+            workers is not None
+            and workers > 1
+            and len(cls._tables) >= cls._MIN_TABLES_FOR_PARALLEL_RENDER
+            and get_fork_context() is not None
+        )
 
     @classmethod
-    def save_all_tables(cls, path: str, encoding: str = 'UTF-8') -> None:
-        with open(path, 'w', encoding=encoding) as file:
-            file.write(cls.create_query_all_tables)
+    def _iter_create_queries_in_parallel(
+        cls, workers: int, chunk_size: int | None
+    ) -> Iterator[str]:
+        qty_tables = len(cls._tables)
+        chunk_size = chunk_size or -(-qty_tables // (workers * 4))
+        chunks = ((start, start + chunk_size) for start in range(0, qty_tables, chunk_size))
+
+        for create_queries in imap_in_process_pool(_render_tables_chunk, chunks, workers):
+            yield from create_queries
+
+    @classmethod
+    def render_all(cls, *, workers: int | None = None) -> str | None:
+        '''
+        Returns the SQL queries of all tables in the global list.
+
+        Parameters
+        ----------
+        workers : int | None
+            The number of processes used for rendering the tables (see `iter_create_queries`).
+
+        Returns
+        -------
+        str | None
+            The SQL queries of all tables, or None if there isn't any table.
+        '''
+
+        return '\n\n'.join(cls.iter_create_queries(workers=workers)) if cls._tables else None
 
     @property
     def tablename(self) -> str:
@@ -326,4 +1577,56 @@ class Table(metaclass=TableMeta):
     @classmethod
     @property
     def create_query_all_tables(cls) -> str | None:
-        return '\n\n'.join([str(table) for table in cls._tables]) if cls._tables else None
+        return cls.render_all()
+
+
+def _render_tables_chunk(start: int, stop: int) -> list[str]:
+    return [str(table) for table in Table._tables[start:stop]]
+
+
+# Replaces the fields that their column's SQL type can't convert, being invalid for any
+# SQL type.
+_UNPARSABLE_TEXT = object()
+
+
+# The row validator of the table being validated by a worker process, and the function
+# that picks the invalid values of its rows for an `ErrorReport` (None for bitmasks), set
+# once when the worker starts (they're inherited from the parent process).
+_worker_row_validator: RowValidator | None = None
+_worker_get_invalid_values: Callable[[Sequence[Any], int], tuple | int] | None = None
+
+
+def _set_worker_row_validator(
+    validate_row: RowValidator,
+    get_invalid_values: Callable[[Sequence[Any], int], tuple | int] | None,
+) -> None:
+    global _worker_row_validator, _worker_get_invalid_values
+
+    _worker_row_validator = validate_row
+    _worker_get_invalid_values = get_invalid_values
+
+
+def _validate_rows_chunk(start: int, rows: list[Sequence[Any]]) -> dict[int, Any]:
+    return _find_invalid_rows(_worker_row_validator, _worker_get_invalid_values, start, rows)
+
+
+def _find_invalid_rows(
+    validate_row: RowValidator,
+    get_invalid_values: Callable[[Sequence[Any], int], tuple | int] | None,
+    start: int,
+    rows: Iterable[Sequence[Any]],
+) -> dict[int, Any]:
+    # The bitmask of each invalid row by its index, with the row's invalid values if
+    # `get_invalid_values`.
+    invalid_rows = {}
+
+    for i, row in enumerate(rows, start):
+        errors = validate_row(row)
+
+        if errors:
+            if get_invalid_values is None:
+                invalid_rows[i] = errors
+            else:
+                invalid_rows[i] = (errors, get_invalid_values(row, errors))
+
+    return invalid_rows
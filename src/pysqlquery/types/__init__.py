@@ -17,15 +17,52 @@ There are these classes:
 - `Time` - equivalent to TIME type
 '''
 
-from .bit import Bit
-from .boolean import Boolean
-from .char import Char
-from .date import Date
-from .datetime import DateTime
-from .decimal import Decimal
-from .double import Double
-from .float import Float
-from .integer import Integer
-from .real import Real
-from .string import String
-from .time import Time
+from typing import TYPE_CHECKING
+
+from ..utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .bit import Bit
+    from .boolean import Boolean
+    from .char import Char
+    from .date import Date
+    from .datetime import DateTime
+    from .decimal import Decimal
+    from .double import Double
+    from .float import Float
+    from .integer import Integer
+    from .real import Real
+    from .string import String
+    from .time import Time
+
+__all__ = [
+    'Bit',
+    'Boolean',
+    'Char',
+    'Date',
+    'DateTime',
+    'Decimal',
+    'Double',
+    'Float',
+    'Integer',
+    'Real',
+    'String',
+    'Time',
+]
+
+_LAZY_ATTRS = {
+    'Bit': '.bit',
+    'Boolean': '.boolean',
+    'Char': '.char',
+    'Date': '.date',
+    'DateTime': '.datetime',
+    'Decimal': '.decimal',
+    'Double': '.double',
+    'Float': '.float',
+    'Integer': '.integer',
+    'Real': '.real',
+    'String': '.string',
+    'Time': '.time',
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
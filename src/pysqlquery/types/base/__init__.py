@@ -4,6 +4,7 @@ Package for abstract SQL type base classes.
 
 # isort: skip_file
 
+from .sql_type_meta import SQLTypeMeta
 from .sql_type import SQLType
 from .sql_date_type import SQLDateType
 from .sql_text_type import SQLTextType
@@ -0,0 +1,280 @@
+'''
+Defines the DatePattern class for validating dates without `datetime.strptime`.
+'''
+
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from ...utils.numpy_support import import_numpy
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class DatePattern:
+    '''
+    A date pattern compiled for validating values.
+
+    `DatePattern(pattern).matches(value)` is True exactly when
+    `datetime.strptime(value, pattern)` succeeds, but `strptime` parses the pattern
+    and takes a lock on every call. Here the pattern is compiled once into a regular
+    expression with the same alternatives `strptime` uses for each directive, followed
+    by the same range checks.
+
+    Only the `%Y`, `%m`, `%d`, `%H`, `%M` and `%S` directives are supported, each one
+    at most once.
+    '''
+
+    DIRECTIVES = {
+        'Y': r'(?P<Y>\d\d\d\d)',
+        'm': r'(?P<m>1[0-2]|0[1-9]|[1-9])',
+        'd': r'(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+        'H': r'(?P<H>2[0-3]|[0-1]\d|\d)',
+        'M': r'(?P<M>[0-5]\d|\d)',
+        'S': r'(?P<S>6[0-1]|[0-5]\d|\d)',
+    }
+
+    # The width of each directive in the canonical (zero padded) form of the values.
+    _DIRECTIVE_WIDTHS = {'Y': 4, 'm': 2, 'd': 2, 'H': 2, 'M': 2, 'S': 2}
+
+    # The value `strptime` assumes for each missing directive, in `datetime` order.
+    _DEFAULTS = (('Y', 1900), ('m', 1), ('d', 1), ('H', 0), ('M', 0), ('S', 0))
+
+    def __init__(self, pattern: str) -> None:
+        '''
+        Parameters
+        ----------
+        pattern : str
+            The date pattern, in `strptime` format.
+
+        Returns
+        -------
+        None
+
+        Raises
+        ------
+        ValueError
+            If the pattern has an unsupported or repeated directive.
+        '''
+
+        self._pattern: str = pattern
+        self._parts: list[tuple[str, str]] = self._split_pattern(pattern)
+        self._regex: re.Pattern = re.compile(
+            ''.join(self._get_part_regex(kind, text) for kind, text in self._parts),
+            re.IGNORECASE,
+        )
+
+        directives = {text for kind, text in self._parts if kind == 'directive'}
+        positions = [i for i, (name, _) in enumerate(self._DEFAULTS) if name in directives]
+
+        # The directives in `datetime` order. When they are contiguous (like in dates
+        # or times) the `datetime` arguments are the parsed fields between the defaults
+        # of the missing directives.
+        self._field_names: tuple[str, ...] = tuple(self._DEFAULTS[i][0] for i in positions)
+        self._are_fields_contiguous: bool = positions == list(
+            range(positions[0], positions[-1] + 1)
+        )
+        self._head_defaults: tuple[int, ...] = tuple(
+            default for _, default in self._DEFAULTS[: positions[0]]
+        )
+        self._tail_defaults: tuple[int, ...] = tuple(
+            default for _, default in self._DEFAULTS[positions[-1] + 1 :]
+        )
+
+    def _split_pattern(self, pattern: str) -> list[tuple[str, str]]:
+        parts = []
+        directives = set()
+
+        for i, text in enumerate(re.split(r'%(.)', pattern, flags=re.DOTALL)):
+            if i % 2:
+                if text not in self.DIRECTIVES or text in directives:
+                    raise ValueError(f'unsupported directive %{text} in {pattern!r}')
+
+                directives.add(text)
+                parts.append(('directive', text))
+            elif '%' in text:
+                raise ValueError(f'stray % in {pattern!r}')
+            elif text:
+                parts.append(('literal', text))
+
+        if not directives:
+            raise ValueError(f'no directives in {pattern!r}')
+
+        return parts
+
+    def _get_part_regex(self, kind: str, text: str) -> str:
+        if kind == 'directive':
+            return self.DIRECTIVES[text]
+
+        return r'\s+'.join(re.escape(piece) for piece in re.split(r'\s+', text))
+
+    def matches(self, value: Any) -> bool:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The value to be validated.
+
+        Returns
+        -------
+        bool
+            True if the value is a string in the pattern, False otherwise.
+        '''
+
+        if not isinstance(value, str):
+            return False
+
+        match = self._regex.match(value)
+
+        if match is None or match.end() != len(value):
+            return False
+
+        try:
+            datetime(*self._get_datetime_args(match))
+        except ValueError:
+            return False
+
+        return True
+
+    def _get_datetime_args(self, match: re.Match) -> list[int]:
+        if not self._are_fields_contiguous:
+            fields = match.groupdict()
+
+            return [
+                int(fields[name]) if name in fields else default
+                for name, default in self._DEFAULTS
+            ]
+
+        fields = match.group(*self._field_names)
+
+        if len(self._field_names) == 1:
+            fields = (fields,)
+
+        return [*self._head_defaults, *map(int, fields), *self._tail_defaults]
+
+    def matches_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        '''
+        Parameters
+        ----------
+        array : numpy.ndarray
+            A NumPy array of strings (`U` dtype).
+
+        Returns
+        -------
+        numpy.ndarray
+            A boolean mask with True for each value in the pattern.
+
+        The values in the canonical form of the pattern (zero padded fields and single
+        spaces) are checked with vectorized operations, using `datetime64` for the days
+        of each month. Any other value is checked by `matches`.
+        '''
+
+        numpy = import_numpy()
+
+        values = numpy.ascontiguousarray(array).reshape(-1)
+        valid = numpy.zeros(values.shape, dtype=bool)
+        is_canonical = self._match_canonical_values(values, valid)
+
+        others = numpy.flatnonzero(~is_canonical)
+
+        if others.size:
+            valid[others] = [self.matches(value) for value in values[others].tolist()]
+
+        return valid.reshape(array.shape)
+
+    def _match_canonical_values(
+        self, values: 'numpy.ndarray', valid: 'numpy.ndarray'
+    ) -> 'numpy.ndarray':
+        # Fills `valid` for the values in canonical form and returns which ones they are.
+        numpy = import_numpy()
+
+        layout = self._get_canonical_layout()
+
+        if layout is None:
+            return numpy.zeros(values.shape, dtype=bool)
+
+        width = sum(len(chars) if kind == 'literal' else size for kind, chars, size in layout)
+        max_length = values.dtype.itemsize // 4
+
+        if not values.size or max_length < width:
+            return numpy.zeros(values.shape, dtype=bool)
+
+        codes = values.view(numpy.uint32).reshape(values.size, max_length)
+        is_canonical = numpy.char.str_len(values) == width
+        fields = {}
+        offset = 0
+
+        for kind, chars, size in layout:
+            if kind == 'literal':
+                for char in chars:
+                    column = codes[:, offset]
+                    is_canonical &= (column == ord(char.lower())) | (column == ord(char.upper()))
+                    offset += 1
+                continue
+
+            digits = codes[:, offset : offset + size].astype(numpy.int64) - ord('0')
+            is_canonical &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+            fields[chars] = digits @ (10 ** numpy.arange(size - 1, -1, -1))
+            offset += size
+
+        rows = numpy.flatnonzero(is_canonical)
+        valid[rows] = self._are_fields_valid(
+            {name: field[rows] for name, field in fields.items()}, rows.size
+        )
+
+        return is_canonical
+
+    def _get_canonical_layout(self) -> list[tuple[str, str, int]] | None:
+        # Literals with digits would make the canonical form ambiguous, and letters must
+        # have single character cases to be compared ignoring case.
+        layout = []
+
+        for kind, text in self._parts:
+            if kind == 'directive':
+                layout.append((kind, text, self._DIRECTIVE_WIDTHS[text]))
+            elif any(
+                char.isdigit() or len(char.lower()) != 1 or len(char.upper()) != 1
+                for char in text
+            ):
+                return None
+            else:
+                layout.append((kind, re.sub(r'\s+', ' ', text), 0))
+
+        return layout
+
+    def _are_fields_valid(self, fields: dict, size: int) -> 'numpy.ndarray':
+        numpy = import_numpy()
+
+        def get_field(name: str, default: int) -> 'numpy.ndarray':
+            return fields[name] if name in fields else numpy.full(size, default)
+
+        year, month, day, hour, minute, second = (
+            get_field(name, default) for name, default in self._DEFAULTS
+        )
+
+        valid = (year >= 1) & (month >= 1) & (month <= 12) & (day >= 1)
+        valid &= (hour <= 23) & (minute <= 59) & (second <= 59)
+
+        months = ((year - 1970) * 12 + numpy.clip(month, 1, 12) - 1).astype('datetime64[M]')
+        days_in_month = (months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')
+
+        return valid & (day <= days_in_month.astype(numpy.int64))
+
+    @property
+    def pattern(self) -> str:
+        return self._pattern
+
+
+@lru_cache(maxsize=None)
+def compile_date_pattern(pattern: str) -> DatePattern | None:
+    '''
+    Returns the compiled date pattern, or None if the pattern isn't supported by
+    `DatePattern` (so it must be validated with `datetime.strptime`).
+    '''
+
+    try:
+        return DatePattern(pattern)
+    except ValueError:
+        return None
@@ -4,9 +4,16 @@ Defines the abstract base class for constructing date SQL type classes.
 
 import re
 from abc import ABCMeta
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING, Any, Callable
 
+from ...utils.dialect import Dialect
 from ..exceptions.sql_date_type import InvalidDatePattern
 from . import SQLType
+from .date_pattern import DatePattern, compile_date_pattern
+
+if TYPE_CHECKING:
+    import numpy
 
 
 class SQLDateType(SQLType, metaclass=ABCMeta):
@@ -20,6 +27,8 @@ class SQLDateType(SQLType, metaclass=ABCMeta):
     This class must be inherited by concrete or another abstract one.
     '''
 
+    __slots__ = ('_pattern', '_compiled_pattern')
+
     def __init__(self, sql_type_name: str, date_pattern: str) -> None:
         '''
         Parameters
@@ -38,6 +47,10 @@ class SQLDateType(SQLType, metaclass=ABCMeta):
 
         self._validate_pattern(date_pattern)
         self._pattern: str = self._format_pattern(date_pattern)
+        self._compiled_pattern: DatePattern | None = compile_date_pattern(self._pattern)
+
+    def _get_identity(self) -> tuple:
+        return super()._get_identity() + (self._pattern,)
 
     def _validate_pattern(self, pattern: str) -> None:
         if not self._is_pattern_valid(pattern):
@@ -49,6 +62,58 @@ class SQLDateType(SQLType, metaclass=ABCMeta):
     def _format_pattern(self, pattern: str) -> str:
         return pattern.strip()
 
+    def _is_date_valid(self, value: Any) -> bool:
+        # Patterns with other directives than %Y, %m, %d, %H, %M and %S can't be compiled,
+        # so they're validated by strptime.
+        if self._compiled_pattern is not None:
+            return self._compiled_pattern.matches(value)
+
+        try:
+            datetime.strptime(value, self._pattern)
+        except (TypeError, ValueError):
+            return False
+
+        return True
+
+    def _get_date_inline_check(self, value: str, sql_type: str) -> str:
+        if self._compiled_pattern is not None:
+            return f'{sql_type}._compiled_pattern.matches({value})'
+
+        return f'{sql_type}._is_date_valid({value})'
+
+    def _validate_date_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        kind = array.dtype.kind
+
+        if kind == 'U' and self._compiled_pattern is not None:
+            return self._compiled_pattern.matches_array(array)
+
+        if kind in 'biufcSMm':
+            return self._new_mask(array, False)
+
+        return super()._validate_array(array)
+
+    def _get_literal_renderer(self, dialect: Dialect) -> Callable[[Any], str]:
+        render_any = super()._get_literal_renderer(dialect)
+        quote = dialect.quote
+        pattern = self._pattern
+
+        # The valid values are texts in the pattern (the ISO format for the built-in
+        # types), which hardly have characters to be escaped, and date and time objects
+        # are formatted in it.
+        def render(value: Any) -> str:
+            if type(value) is str:
+                if "'" in value or '\\' in value:
+                    return quote(value)
+
+                return f"'{value}'"
+
+            if isinstance(value, (date, time)):
+                return quote(value.strftime(pattern))
+
+            return render_any(value)
+
+        return render
+
     @property
     def pattern(self) -> str:
         return self._pattern
@@ -2,11 +2,28 @@
 Defines the abstract base class for constructing decimal SQL type classes.
 '''
 
+import decimal
+import math
 from abc import ABCMeta
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Any
 
+from ...utils.numpy_support import import_numpy
 from ..exceptions.sql_decimal_type import InvalidScale
 from .sql_num_type import SQLNumType
 
+if TYPE_CHECKING:
+    import numpy
+
+# 1.0, 10.0, 100.0, ... up to the largest power of ten that is a finite float, so the
+# integer digits of a float are the number of powers lower or equal than it.
+FLOAT_POWERS_OF_TEN = tuple(10.0**exponent for exponent in range(309))
+
+# Floats below it have an integer part with less than 16 digits, so multiplying them
+# by a power of ten up to 1e22 (all exact floats) and rounding is exact.
+_MAX_EXACTLY_SCALED_FLOAT = 2.0**51
+_MAX_EXACT_FLOAT_POWER = 22
+
 
 class SQLDecimalType(SQLNumType, metaclass=ABCMeta):
     '''
@@ -19,6 +36,8 @@ class SQLDecimalType(SQLNumType, metaclass=ABCMeta):
     This class must be inherited by concrete or another abstract one.
     '''
 
+    __slots__ = ('_scale',)
+
     def __init__(self, sql_type_name: str, precision: int | None, scale: int | None) -> None:
         '''
         Parameters
@@ -40,6 +59,9 @@ class SQLDecimalType(SQLNumType, metaclass=ABCMeta):
         self._validate_scale(scale)
         self._scale: int | None = scale
 
+    def _get_identity(self) -> tuple:
+        return super()._get_identity() + (self._scale,)
+
     def _validate_scale(self, scale: int | None) -> None:
         if not self._is_scale_valid(scale):
             raise InvalidScale(super().name, scale)
@@ -50,6 +72,165 @@ class SQLDecimalType(SQLNumType, metaclass=ABCMeta):
             and (not scale or isinstance(scale, int) and 0 <= scale < super().precision)
         )
 
+    def _is_number_valid(self, value: Any) -> bool:
+        value_type = type(value)
+
+        if value_type is float:
+            return self._is_float_valid(value)
+
+        if value_type is int or isinstance(value, int):
+            precision = self._precision
+
+            return not precision or -(10**precision) < value < 10**precision
+
+        if isinstance(value, float):
+            return self._is_float_valid(value)
+
+        if isinstance(value, decimal.Decimal):
+            return self._is_python_decimal_valid(value)
+
+        return False
+
+    def _is_float_valid(self, value: float) -> bool:
+        # The number of decimal digits of a float is the smallest `n` for which
+        # round(value, n) == value, so one rounding with the allowed quantity of decimal
+        # digits checks both the precision and the scale.
+        precision = self._precision
+
+        if not precision:
+            return True
+
+        if not -math.inf < value < math.inf:
+            return False
+
+        magnitude = abs(value)
+        qty_allowed_decimal_digits = precision - bisect_right(FLOAT_POWERS_OF_TEN, magnitude)
+
+        if qty_allowed_decimal_digits < 0:
+            return False
+
+        if self._scale and self._scale < qty_allowed_decimal_digits:
+            qty_allowed_decimal_digits = self._scale
+
+        if qty_allowed_decimal_digits <= _MAX_EXACT_FLOAT_POWER:
+            power = FLOAT_POWERS_OF_TEN[qty_allowed_decimal_digits]
+            scaled = magnitude * power
+
+            if scaled < _MAX_EXACTLY_SCALED_FLOAT:
+                return round(scaled) / power == magnitude
+
+        return round(magnitude, qty_allowed_decimal_digits) == magnitude
+
+    def _is_python_decimal_valid(self, value: decimal.Decimal) -> bool:
+        if not self.precision:
+            return True
+
+        if not value.is_finite():
+            return False
+
+        _, digits, exponent = value.as_tuple()
+
+        while exponent < 0 and len(digits) > 1 and digits[-1] == 0:
+            digits = digits[:-1]
+            exponent += 1
+
+        if digits == (0,):
+            return True
+
+        qty_decimal_digits = max(-exponent, 0)
+        qty_integer_digits = max(len(digits) + exponent, 0)
+
+        return qty_decimal_digits <= self._get_qty_allowed_decimal_digits(qty_integer_digits)
+
+    def _get_qty_allowed_decimal_digits(self, qty_integer_digits: int) -> int:
+        qty_allowed_decimal_digits = self.precision - qty_integer_digits
+
+        if self.scale:
+            return min(qty_allowed_decimal_digits, self.scale)
+
+        return qty_allowed_decimal_digits
+
+    def parse_text(self, text: str) -> decimal.Decimal:
+        # Decimals keep the exact digits of the text, so they're validated exactly.
+        try:
+            return decimal.Decimal(text)
+        except decimal.InvalidOperation:
+            raise ValueError(f'invalid decimal text: {text!r}') from None
+
+    def _get_number_inline_check(self, value: str, sql_type: str) -> str:
+        # Floats and ints out of the precision are checked by `_is_number_valid`.
+        if not self.precision:
+            return (
+                f'type({value}) is float or type({value}) is int '
+                f'or {sql_type}._is_number_valid({value})'
+            )
+
+        limit = 10**self.precision
+
+        return (
+            f'-{limit} < {value} < {limit} if type({value}) is int '
+            f'else {sql_type}._is_number_valid({value})'
+        )
+
+    def _validate_number_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        kind = array.dtype.kind
+
+        if kind in 'cUS':
+            return self._new_mask(array, False)
+
+        if kind not in 'biuf':
+            return super()._validate_array(array)
+
+        if not self.precision:
+            return self._new_mask(array, True)
+
+        if kind == 'f':
+            return self._validate_float_array(array.astype(import_numpy().float64))
+
+        return self._validate_int_array(array)
+
+    def _validate_int_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        limit = 10**self.precision
+
+        if array.dtype.kind == 'b' or limit > import_numpy().iinfo(array.dtype).max:
+            return self._new_mask(array, True)
+
+        return (array > -limit) & (array < limit)
+
+    def _validate_float_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        numpy = import_numpy()
+
+        magnitudes = numpy.abs(array)
+        qty_integer_digits = numpy.searchsorted(
+            numpy.array(FLOAT_POWERS_OF_TEN), magnitudes, side='right'
+        )
+        qty_allowed_decimal_digits = self.precision - qty_integer_digits
+
+        if self.scale:
+            qty_allowed_decimal_digits = numpy.minimum(qty_allowed_decimal_digits, self.scale)
+
+        valid = numpy.isfinite(magnitudes) & (qty_allowed_decimal_digits >= 0)
+        qty_allowed_decimal_digits = numpy.clip(
+            qty_allowed_decimal_digits, 0, _MAX_EXACT_FLOAT_POWER + 1
+        )
+
+        with numpy.errstate(over='ignore', invalid='ignore'):
+            powers = 10.0**qty_allowed_decimal_digits
+            scaled = magnitudes * powers
+            is_exact = (qty_allowed_decimal_digits <= _MAX_EXACT_FLOAT_POWER) & (
+                scaled < _MAX_EXACTLY_SCALED_FLOAT
+            )
+            is_rounded = numpy.rint(scaled) / powers == magnitudes
+
+        # The values whose rounding isn't exact with floats are checked by round().
+        inexact = numpy.flatnonzero(valid & ~is_exact)
+        valid &= is_exact & is_rounded | ~is_exact
+
+        if inexact.size:
+            valid[inexact] = [self._is_float_valid(value) for value in array[inexact].tolist()]
+
+        return valid
+
     @property
     def scale(self) -> int | None:
         return self._scale
@@ -17,3 +17,13 @@ class SQLIntType(SQLNumType, metaclass=ABCMeta):
 
     This class must be inherited by concrete or another abstract one.
     '''
+
+    __slots__ = ()
+
+    _BOOL_TEXTS = {'true': True, 't': True, '1': True, 'false': False, 'f': False, '0': False}
+
+    def _parse_bool_text(self, text: str) -> bool:
+        try:
+            return self._BOOL_TEXTS[text.strip().lower()]
+        except KeyError:
+            raise ValueError(f'invalid boolean text: {text!r}') from None
@@ -2,8 +2,12 @@
 Defines the abstract base class for constructing numeric SQL type classes.
 '''
 
+import decimal
 from abc import ABCMeta
+from math import isfinite
+from typing import Any, Callable
 
+from ...utils.dialect import Dialect
 from ..exceptions.sql_num_type import InvalidPrecision
 from .sql_type import SQLType
 
@@ -18,6 +22,8 @@ class SQLNumType(SQLType, metaclass=ABCMeta):
     This class must be inherited by abstract one.
     '''
 
+    __slots__ = ('_precision',)
+
     def __init__(self, sql_type_name: str, precision: int | None) -> None:
         '''
         Parameters
@@ -37,6 +43,9 @@ class SQLNumType(SQLType, metaclass=ABCMeta):
         self._validate_precision(precision)
         self._precision: int | None = precision
 
+    def _get_identity(self) -> tuple:
+        return super()._get_identity() + (self._precision,)
+
     def _validate_precision(self, precision: int | None) -> None:
         if not self._is_precision_valid(precision):
             raise InvalidPrecision(super().name, precision)
@@ -44,6 +53,31 @@ class SQLNumType(SQLType, metaclass=ABCMeta):
     def _is_precision_valid(self, precision: int | None) -> bool:
         return precision is None or (isinstance(precision, int) and precision > 0)
 
+    def _get_literal_renderer(self, dialect: Dialect) -> Callable[[Any], str]:
+        render_any = super()._get_literal_renderer(dialect)
+        render_non_finite = self._render_non_finite
+
+        # Numbers are rendered by their own `str` (bools, which are valid numbers, as
+        # 1 and 0), except NaN and infinite ones, which aren't numeric literals.
+        def render(value: Any) -> str:
+            value_type = type(value)
+
+            if value_type is int:
+                return str(value)
+
+            if value_type is float:
+                return str(value) if isfinite(value) else render_non_finite(value, dialect)
+
+            if value_type is decimal.Decimal:
+                return str(value) if value.is_finite() else render_non_finite(value, dialect)
+
+            if value is True or value is False:
+                return '1' if value else '0'
+
+            return render_any(value)
+
+        return render
+
     @property
     def precision(self) -> int | None:
         return self._precision
@@ -3,10 +3,16 @@ Defines the abstract base class for constructing text SQL type classes.
 '''
 
 from abc import ABCMeta
+from typing import TYPE_CHECKING, Any, Callable
 
+from ...utils.dialect import Dialect
+from ...utils.numpy_support import import_numpy
 from ..exceptions.sql_text_type import InvalidTypeLength
 from .sql_type import SQLType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class SQLTextType(SQLType, metaclass=ABCMeta):
     '''
@@ -19,6 +25,8 @@ class SQLTextType(SQLType, metaclass=ABCMeta):
     This class must be inherited by concrete or another abstract one.
     '''
 
+    __slots__ = ('_length',)
+
     def __init__(self, sql_type_name: str, length: int | None) -> None:
         '''
         Parameters
@@ -38,6 +46,9 @@ class SQLTextType(SQLType, metaclass=ABCMeta):
         self._validate_length(length)
         self._length: int | None = length
 
+    def _get_identity(self) -> tuple:
+        return super()._get_identity() + (self._length,)
+
     def _validate_length(self, length: int | None) -> None:
         if not self._is_length_valid(length):
             raise InvalidTypeLength(super().name, length)
@@ -45,6 +56,39 @@ class SQLTextType(SQLType, metaclass=ABCMeta):
     def _is_length_valid(self, length: int | None) -> bool:
         return length is None or (isinstance(length, int) and length > 0)
 
+    def _validate_str_array(
+        self, array: 'numpy.ndarray', max_length: int | None
+    ) -> 'numpy.ndarray':
+        kind = array.dtype.kind
+
+        if kind == 'U':
+            if max_length is None:
+                return self._new_mask(array, True)
+
+            return import_numpy().char.str_len(array) <= max_length
+
+        if kind in 'biufcS':
+            return self._new_mask(array, False)
+
+        return super()._validate_array(array)
+
+    def _get_literal_renderer(self, dialect: Dialect) -> Callable[[Any], str]:
+        if dialect.escapes_backslashes:
+            quote = dialect.quote
+
+            return lambda value: quote(value if type(value) is str else str(value))
+
+        # Only the quotes are escaped, so the escaping of `Dialect.quote` is inlined.
+        def render(value: Any) -> str:
+            text = value if type(value) is str else str(value)
+
+            if "'" in text:
+                text = text.replace("'", "''")
+
+            return f"'{text}'"
+
+        return render
+
     @property
     def length(self) -> int | None:
         return self._length
@@ -2,22 +2,35 @@
 Defines the abstract base class for constructing abstract SQL type classes.
 '''
 
-from abc import ABCMeta, abstractmethod
-from typing import Any
+import decimal
+import math
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
-from ..exceptions.sql_type import InvalidTypeName
+from ...utils.dialect import DIALECTS, Dialect
+from ...utils.numpy_support import import_numpy, is_numpy_array
+from ..exceptions.sql_type import InvalidDialect, InvalidTypeName, NonFiniteLiteral
+from .sql_type_meta import SQLTypeMeta
 
+if TYPE_CHECKING:
+    import numpy
 
-class SQLType(metaclass=ABCMeta):
+
+class SQLType(metaclass=SQLTypeMeta):
     '''
     Abstract class for construct abstract SQL type classes.
 
     This class provides the basic structures for construct
     abstract classes for kind of SQL types.
 
+    SQL types are immutable: instances created with the same arguments are shared
+    (see `SQLTypeMeta`) and instances with the same attributes are equal.
+
     This class must be inherited by abstract one.
     '''
 
+    __slots__ = ('_name', '_rendered')
+
     def __init__(self, sql_type_name: str) -> None:
         '''
         Parameters
@@ -45,6 +58,18 @@ class SQLType(metaclass=ABCMeta):
     def _format_name(self, name: str) -> str:
         return name.strip().upper()
 
+    def _get_identity(self) -> tuple:
+        return (type(self), self._name)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, SQLType):
+            return NotImplemented
+
+        return self._get_identity() == other._get_identity()
+
+    def __hash__(self) -> int:
+        return hash(self._get_identity())
+
     @abstractmethod
     def __str__(self) -> str:
         '''
@@ -68,6 +93,213 @@ class SQLType(metaclass=ABCMeta):
             True if the value is valid for the SQL type, False otherwise.
         '''
 
+    def validate_values(self, values: Iterable[Any]) -> 'list[bool] | numpy.ndarray':
+        '''
+        Validates many values at once, with the same rules of `validate_value`.
+
+        NumPy arrays (and memoryviews, when NumPy is installed) are validated by
+        vectorized checks whenever the SQL type provides them for the array's dtype.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            The values to be validated. It can be any iterable, a NumPy array or a
+            memoryview.
+
+        Returns
+        -------
+        list[bool] | numpy.ndarray
+            A boolean mask with True for each valid value. It's a NumPy array with the
+            shape of `values` when `values` is a NumPy array or a memoryview and NumPy
+            is installed, otherwise it's a list.
+
+        Examples
+        --------
+        >>> String(3).validate_values(['abc', 'abcd', 10])
+        [True, False, False]
+        >>> String(3).validate_values(numpy.array(['abc', 'abcd']))
+        array([ True, False])
+        '''
+
+        if isinstance(values, memoryview):
+            numpy = import_numpy()
+            values = values.tolist() if numpy is None else numpy.asarray(values)
+
+        if is_numpy_array(values):
+            return self._validate_array(values)
+
+        validate_value = self.validate_value
+
+        return [validate_value(value) for value in values]
+
+    def parse_text(self, text: str) -> Any:
+        '''
+        Converts a text field (like the ones read from CSV files) to the Python value
+        validated by `validate_value`.
+
+        Parameters
+        ----------
+        text : str
+            The text to be converted.
+
+        Returns
+        -------
+        Any
+            The converted value. Text and date SQL types return the text itself.
+
+        Raises
+        ------
+        ValueError
+            If the text can't be converted.
+
+        Examples
+        --------
+        >>> Integer().parse_text('42')
+        42
+        >>> Boolean().parse_text('t')
+        True
+        >>> Date().parse_text('2024-01-31')
+        '2024-01-31'
+        '''
+
+        return text
+
+    def render_literal(self, value: Any, dialect: str = 'ansi') -> str:
+        '''
+        Renders a value of this SQL type as a SQL literal.
+
+        Parameters
+        ----------
+        value : Any
+            The value to be rendered (None is rendered as NULL).
+        dialect : str
+            The SQL dialect of the literal: `'ansi'`, `'postgresql'`, `'mysql'`,
+            `'sqlite'`, `'sqlserver'` or `'oracle'`. It changes the literals of booleans
+            and the escaping of strings.
+
+        Returns
+        -------
+        str
+            The SQL literal.
+
+        Raises
+        ------
+        InvalidDialect
+            If the dialect isn't supported.
+        NonFiniteLiteral
+            If the value is a NaN or infinite number and the dialect has no literal for
+            it (PostgreSQL and Oracle have literals for them, SQLite only for infinite
+            numbers).
+
+        Examples
+        --------
+        >>> String().render_literal("O'Hara")
+        "'O''Hara'"
+        >>> Boolean().render_literal(True)
+        'TRUE'
+        >>> Boolean().render_literal(True, 'sqlserver')
+        '1'
+        >>> Integer().render_literal(None)
+        'NULL'
+        '''
+
+        render = self._get_literal_renderer(self._get_dialect(dialect))
+
+        return 'NULL' if value is None else render(value)
+
+    def render_literals(self, values: Iterable[Any], dialect: str = 'ansi') -> list[str]:
+        '''
+        Renders many values of this SQL type as SQL literals, with the same rules of
+        `render_literal`.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            The values to be rendered.
+        dialect : str
+            The SQL dialect of the literals (see `render_literal`).
+
+        Returns
+        -------
+        list[str]
+            The SQL literal of each value.
+
+        Examples
+        --------
+        >>> Date().render_literals(['2024-01-31', None])
+        ["'2024-01-31'", 'NULL']
+        '''
+
+        render = self._get_literal_renderer(self._get_dialect(dialect))
+
+        return ['NULL' if value is None else render(value) for value in values]
+
+    @staticmethod
+    def _get_dialect(dialect: str) -> Dialect:
+        try:
+            return DIALECTS[dialect]
+        except (KeyError, TypeError):
+            raise InvalidDialect(dialect) from None
+
+    def _get_literal_renderer(self, dialect: Dialect) -> Callable[[Any], str]:
+        # Returns the function that renders the non-NULL values of this SQL type as
+        # literals of the dialect. SQL types override it with the fast paths of their
+        # values; this one renders any value.
+        def render(value: Any) -> str:
+            if value is True or value is False:
+                return dialect.true if value else dialect.false
+
+            if isinstance(value, (int, float, decimal.Decimal)):
+                if not self._is_finite(value):
+                    return self._render_non_finite(value, dialect)
+
+                return str(value)
+
+            return dialect.quote(str(value))
+
+        return render
+
+    @staticmethod
+    def _is_finite(value: int | float | decimal.Decimal) -> bool:
+        if isinstance(value, decimal.Decimal):
+            return value.is_finite()
+
+        return isinstance(value, int) or math.isfinite(value)
+
+    @staticmethod
+    def _render_non_finite(value: float | decimal.Decimal, dialect: Dialect) -> str:
+        # NaN and infinite numbers aren't numeric literals, so they're rendered by the
+        # dialect's own literals (if it has them).
+        if value.is_nan() if isinstance(value, decimal.Decimal) else math.isnan(value):
+            literal = dialect.nan
+        elif value > 0:
+            literal = dialect.infinity
+        else:
+            literal = dialect.negative_infinity
+
+        if literal is None:
+            raise NonFiniteLiteral(value, dialect.name)
+
+        return literal
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        # Generic path for the dtypes without vectorized checks: `tolist` converts the
+        # elements to Python objects, so they're validated exactly like `validate_value`.
+        numpy = import_numpy()
+
+        return numpy.fromiter(
+            map(self.validate_value, array.ravel().tolist()), dtype=bool, count=array.size
+        ).reshape(array.shape)
+
+    def _new_mask(self, array: 'numpy.ndarray', valid: bool) -> 'numpy.ndarray':
+        return import_numpy().full(array.shape, valid, dtype=bool)
+
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        # Returns a Python expression equivalent to `validate_value`, inlined by the row
+        # validators compiled by tables, where `value` and `sql_type` are the names of
+        # the value and of this SQL type. None means `validate_value` must be called.
+        return None
+
     @property
     def name(self) -> str:
         return self._name
@@ -0,0 +1,64 @@
+'''
+Defines the SQL type meta class for interning SQL type instances.
+'''
+
+from abc import ABCMeta
+from functools import wraps
+from typing import Any, Callable
+
+
+class SQLTypeMeta(ABCMeta):
+    '''
+    This class is used as meta class for SQL type classes.
+
+    SQL types are immutable value objects, so calling a SQL type class with the same
+    arguments returns the same (interned) instance, e.g. `String(255) is String(255)`.
+
+    It also caches the output of the `__str__` method of each concrete SQL type.
+    '''
+
+    _instances: dict[tuple, Any] = {}
+
+    def __new__(mcs, name: str, bases: tuple, clsdict: dict):
+        render = clsdict.get('__str__')
+
+        if render is not None and not getattr(render, '__isabstractmethod__', False):
+            clsdict['__str__'] = mcs._cache_rendering(render)
+
+        return super().__new__(mcs, name, bases, clsdict)
+
+    @staticmethod
+    def _cache_rendering(render: Callable[[Any], str]) -> Callable[[Any], str]:
+        @wraps(render)
+        def __str__(self) -> str:
+            # Only the most derived __str__ is cached, so a subclass calling
+            # super().__str__() doesn't get its own rendering overwritten.
+            if type(self).__str__ is not __str__:
+                return render(self)
+
+            try:
+                return self._rendered
+            except AttributeError:
+                self._rendered = render(self)
+
+            return self._rendered
+
+        return __str__
+
+    def __call__(cls, *args, **kwargs):
+        key = (
+            cls,
+            tuple((type(arg), arg) for arg in args),
+            tuple((name, type(arg), arg) for name, arg in sorted(kwargs.items())),
+        )
+
+        try:
+            return cls._instances[key]
+        except KeyError:
+            instance = super().__call__(*args, **kwargs)
+        except TypeError:
+            return super().__call__(*args, **kwargs)
+
+        cls._instances[key] = instance
+
+        return instance
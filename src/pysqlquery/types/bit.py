@@ -2,8 +2,14 @@
 Defines the Bit class for constructing BIT SQL type.
 '''
 
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..utils.dialect import Dialect
 from .base import SQLIntType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Bit(SQLIntType):
     '''
@@ -13,6 +19,8 @@ class Bit(SQLIntType):
     specific to the BIT data type.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'bit'
 
     def __init__(self) -> None:
@@ -61,3 +69,36 @@ class Bit(SQLIntType):
         '''
 
         return isinstance(value, bool) or (isinstance(value, int) and value in (0, 1))
+
+    def parse_text(self, text: str) -> bool:
+        return self._parse_bool_text(text)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        kind = array.dtype.kind
+
+        if kind == 'b':
+            return self._new_mask(array, True)
+
+        if kind in 'iu':
+            return (array == 0) | (array == 1)
+
+        if kind in 'fcUS':
+            return self._new_mask(array, False)
+
+        return super()._validate_array(array)
+
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        return f'isinstance({value}, int) and {value} in (0, 1)'
+
+    def _get_literal_renderer(self, dialect: Dialect) -> Callable[[Any], str]:
+        render_any = super()._get_literal_renderer(dialect)
+        true, false = dialect.true_bit, dialect.false_bit
+
+        # Bools and the ints 0 and 1 are valid bits.
+        def render(value: Any) -> str:
+            if isinstance(value, int) and value in (0, 1):
+                return true if value else false
+
+            return render_any(value)
+
+        return render
@@ -2,8 +2,14 @@
 Defines the Boolean class for constructing BOOLEAN SQL type.
 '''
 
+from typing import TYPE_CHECKING, Any, Callable
+
+from ..utils.dialect import Dialect
 from .base import SQLIntType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Boolean(SQLIntType):
     '''
@@ -13,6 +19,8 @@ class Boolean(SQLIntType):
     specific to the BOOLEAN data type.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'boolean'
 
     def __init__(self) -> None:
@@ -57,3 +65,32 @@ class Boolean(SQLIntType):
         '''
 
         return isinstance(value, bool)
+
+    def parse_text(self, text: str) -> bool:
+        return self._parse_bool_text(text)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        kind = array.dtype.kind
+
+        if kind in 'biufcUS':
+            return self._new_mask(array, kind == 'b')
+
+        return super()._validate_array(array)
+
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        return f'({value} is True or {value} is False)'
+
+    def _get_literal_renderer(self, dialect: Dialect) -> Callable[[Any], str]:
+        render_any = super()._get_literal_renderer(dialect)
+        true, false = dialect.true, dialect.false
+
+        def render(value: Any) -> str:
+            if value is True:
+                return true
+
+            if value is False:
+                return false
+
+            return render_any(value)
+
+        return render
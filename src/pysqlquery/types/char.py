@@ -2,8 +2,13 @@
 Defines the Char class for constructing CHAR SQL type.
 '''
 
+from typing import TYPE_CHECKING
+
 from .base import SQLTextType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Char(SQLTextType):
     '''
@@ -13,6 +18,8 @@ class Char(SQLTextType):
     specific to the CHAR data type.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'char'
 
     def __init__(self, length: int | None = None) -> None:
@@ -77,3 +84,11 @@ class Char(SQLTextType):
         '''
 
         return isinstance(value, str) and len(value) <= (super().length if super().length else 1)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        return self._validate_str_array(array, super().length if super().length else 1)
+
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        max_length = super().length if super().length else 1
+
+        return f'isinstance({value}, str) and len({value}) <= {max_length}'
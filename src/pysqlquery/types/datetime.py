@@ -2,10 +2,13 @@
 Defines the DateTime class for constructing DATETIME SQL type.
 '''
 
-from datetime import datetime
+from typing import TYPE_CHECKING
 
 from .base import SQLDateType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class DateTime(SQLDateType):
     '''
@@ -15,6 +18,8 @@ class DateTime(SQLDateType):
     specific to the DATETIME data type in `yyyy-mm-dd HH:MM:ss` pattern.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'datetime'
 
     def __init__(self) -> None:
@@ -60,9 +65,10 @@ class DateTime(SQLDateType):
         False
         '''
 
-        try:
-            datetime.strptime(value, super().pattern)
-        except (TypeError, ValueError):
-            return False
+        return self._is_date_valid(value)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        return self._validate_date_array(array)
 
-        return True
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        return self._get_date_inline_check(value, sql_type)
@@ -5,6 +5,8 @@ Defines the base exception classes for SQL type classes.
 from abc import ABCMeta
 from typing import Any
 
+from ...utils.dialect import DIALECTS
+
 
 class SQLTypeException(Exception, metaclass=ABCMeta):
     '''
@@ -35,3 +37,50 @@ class InvalidTypeName(SQLTypeException):
         '''
 
         super().__init__(self.MESSAGE.format(name=name))
+
+
+class InvalidDialect(SQLTypeException):
+    '''
+    Exception raised for an invalid SQL dialect.
+    '''
+
+    MESSAGE = 'The given value is an invalid SQL dialect: {dialect!r} (the dialects are {dialects})'
+
+    def __init__(self, dialect: Any) -> None:
+        '''
+        Parameters
+        ----------
+        dialect : Any
+            The invalid dialect.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(dialect=dialect, dialects=', '.join(DIALECTS)))
+
+
+class NonFiniteLiteral(SQLTypeException):
+    '''
+    Exception raised for when a NaN or infinite number is rendered as a literal of a
+    dialect without literals for it.
+    '''
+
+    MESSAGE = 'The {value!r} number has no SQL literal in the {dialect} dialect'
+
+    def __init__(self, value: Any, dialect: str) -> None:
+        '''
+        Parameters
+        ----------
+        value : Any
+            The NaN or infinite number.
+        dialect : str
+            The dialect's name.
+
+        Returns
+        -------
+        None
+        '''
+
+        super().__init__(self.MESSAGE.format(value=value, dialect=dialect))
@@ -2,10 +2,14 @@
 Defines the Float class for constructing FLOAT SQL type.
 '''
 
-from typing import Any
+import decimal
+from typing import TYPE_CHECKING
 
 from .base import SQLDecimalType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Float(SQLDecimalType):
     '''
@@ -15,6 +19,8 @@ class Float(SQLDecimalType):
     specific to the FLOAT data type.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'float'
 
     def __init__(self, precision: int | None = None, scale: int | None = None) -> None:
@@ -60,11 +66,11 @@ class Float(SQLDecimalType):
 
         return rendered_value
 
-    def validate_value(self, value: float | int) -> bool:
+    def validate_value(self, value: float | int | decimal.Decimal) -> bool:
         '''
         Parameters
         ----------
-        value : float | int
+        value : float | int | decimal.Decimal
             The value to be validated.
 
         Returns
@@ -95,36 +101,18 @@ class Float(SQLDecimalType):
         True
         >>> float_type.validate_value(1.55)
         False
+        >>> float_type.validate_value(-10.5)
+        True
+        >>> float_type.validate_value(decimal.Decimal('10.50'))
+        True
+        >>> float_type.validate_value(1e-07)
+        False
         '''
 
-        if not self._is_number(value):
-            return False
-
-        number_str = str(value)
-
-        if super().precision:
-            if not self._is_smaller_or_eq_than_the_precision_limit(number_str):
-                return False
-
-            if super().scale:
-                DECIMAL_SEP = '.'
-
-                pos_decimal_sep = number_str.find(DECIMAL_SEP)
-
-                if pos_decimal_sep == -1:
-                    return True
-
-                qty_decimal_digits = len(number_str) - pos_decimal_sep - 1
-
-                return self._is_smaller_or_eq_than_the_scale(qty_decimal_digits)
-
-        return True
-
-    def _is_number(self, value: Any) -> bool:
-        return isinstance(value, (int, float))
+        return self._is_number_valid(value)
 
-    def _is_smaller_or_eq_than_the_precision_limit(self, number_str: str) -> bool:
-        return len(number_str.replace('.', '')) <= super().precision
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        return self._validate_number_array(array)
 
-    def _is_smaller_or_eq_than_the_scale(self, qty_decimal_digits: int) -> bool:
-        return qty_decimal_digits <= super().scale
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        return self._get_number_inline_check(value, sql_type)
@@ -2,8 +2,14 @@
 Defines the Integer class for constructing INTEGER SQL type.
 '''
 
+from typing import TYPE_CHECKING
+
+from ..utils.numpy_support import import_numpy
 from .base import SQLIntType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Integer(SQLIntType):
     '''
@@ -13,6 +19,8 @@ class Integer(SQLIntType):
     specific to the INTEGER data type.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'integer'
 
     def __init__(self, precision: int | None = None) -> None:
@@ -72,12 +80,50 @@ class Integer(SQLIntType):
         >>> int_type = Integer(2)
         >>> int_type.validate_value(10)
         True
+        >>> int_type.validate_value(-99)
+        True
         >>> int_type.validate_value(100)
         False
         >>> int_type.validate_value(1.5)
         False
         '''
 
-        return isinstance(value, int) and (
-            len(str(value)) <= super().precision if super().precision else True
-        )
+        return isinstance(value, int) and self._is_within_precision(value)
+
+    def _is_within_precision(self, value: int) -> bool:
+        if not super().precision:
+            return True
+
+        limit = 10 ** super().precision
+
+        return -limit < value < limit
+
+    def parse_text(self, text: str) -> int:
+        return int(text)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        kind = array.dtype.kind
+
+        if kind == 'b' or (kind in 'iu' and not super().precision):
+            return self._new_mask(array, True)
+
+        if kind in 'iu':
+            limit = 10 ** super().precision
+
+            if limit > import_numpy().iinfo(array.dtype).max:
+                return self._new_mask(array, True)
+
+            return (array > -limit) & (array < limit)
+
+        if kind in 'fcUS':
+            return self._new_mask(array, False)
+
+        return super()._validate_array(array)
+
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        if not super().precision:
+            return f'isinstance({value}, int)'
+
+        limit = 10 ** super().precision
+
+        return f'isinstance({value}, int) and -{limit} < {value} < {limit}'
@@ -2,8 +2,13 @@
 Defines the String class for constructing VARCHAR SQL type.
 '''
 
+from typing import TYPE_CHECKING
+
 from .base import SQLTextType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class String(SQLTextType):
     '''
@@ -13,6 +18,8 @@ class String(SQLTextType):
     specific to the VARCHAR data type.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'varchar'
 
     def __init__(self, length: int | None = None) -> None:
@@ -79,3 +86,12 @@ class String(SQLTextType):
         '''
 
         return isinstance(value, str) and (len(value) <= super().length if super().length else True)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        return self._validate_str_array(array, super().length if super().length else None)
+
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        if not super().length:
+            return f'isinstance({value}, str)'
+
+        return f'isinstance({value}, str) and len({value}) <= {super().length}'
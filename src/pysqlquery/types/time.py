@@ -2,10 +2,13 @@
 Defines the Time class for constructing TIME SQL type.
 '''
 
-from datetime import datetime
+from typing import TYPE_CHECKING
 
 from .base import SQLDateType
 
+if TYPE_CHECKING:
+    import numpy
+
 
 class Time(SQLDateType):
     '''
@@ -15,6 +18,8 @@ class Time(SQLDateType):
     specific to the TIME data type in `HH:MM:ss` pattern.
     '''
 
+    __slots__ = ()
+
     _TYPE_NAME = 'time'
 
     def __init__(self) -> None:
@@ -59,9 +64,10 @@ class Time(SQLDateType):
         False
         '''
 
-        try:
-            datetime.strptime(value, super().pattern)
-        except (TypeError, ValueError):
-            return False
+        return self._is_date_valid(value)
+
+    def _validate_array(self, array: 'numpy.ndarray') -> 'numpy.ndarray':
+        return self._validate_date_array(array)
 
-        return True
+    def _get_inline_check(self, value: str, sql_type: str) -> str | None:
+        return self._get_date_inline_check(value, sql_type)
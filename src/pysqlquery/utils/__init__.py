@@ -0,0 +1,3 @@
+'''
+Package for internal helpers shared by the other `pysqlquery` packages.
+'''
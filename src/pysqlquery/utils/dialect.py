@@ -0,0 +1,97 @@
+'''
+Defines the SQL dialects that literals and statements can be rendered for.
+'''
+
+from typing import NamedTuple
+
+
+class Dialect(NamedTuple):
+    '''
+    The differences between SQL dialects in rendered literals.
+    '''
+
+    name: str
+    '''The dialect's name.'''
+
+    true: str
+    '''The literal of true booleans.'''
+
+    false: str
+    '''The literal of false booleans.'''
+
+    true_bit: str
+    '''The literal of set bits.'''
+
+    false_bit: str
+    '''The literal of unset bits.'''
+
+    escapes_backslashes: bool
+    '''If backslashes are escape characters in string literals (so they're doubled).'''
+
+    nan: str | None
+    '''The literal of NaN floats, or None if the dialect has none.'''
+
+    infinity: str | None
+    '''The literal of positive infinite floats, or None if the dialect has none.'''
+
+    negative_infinity: str | None
+    '''The literal of negative infinite floats, or None if the dialect has none.'''
+
+    def quote(self, text: str) -> str:
+        '''
+        Parameters
+        ----------
+        text : str
+            The text to be quoted.
+
+        Returns
+        -------
+        str
+            The text as a string literal, with its quotes (and backslashes, if the
+            dialect escapes them) doubled.
+
+        Examples
+        --------
+        >>> DIALECTS['ansi'].quote("O'Hara")
+        "'O''Hara'"
+        '''
+
+        if self.escapes_backslashes and '\\' in text:
+            text = text.replace('\\', '\\\\')
+
+        if "'" in text:
+            text = text.replace("'", "''")
+
+        return f"'{text}'"
+
+
+DIALECTS = {
+    'ansi': Dialect('ansi', 'TRUE', 'FALSE', "B'1'", "B'0'", False, None, None, None),
+    'postgresql': Dialect(
+        'postgresql',
+        'TRUE',
+        'FALSE',
+        "B'1'",
+        "B'0'",
+        False,
+        "'NaN'::float8",
+        "'Infinity'::float8",
+        "'-Infinity'::float8",
+    ),
+    'mysql': Dialect('mysql', 'TRUE', 'FALSE', "b'1'", "b'0'", True, None, None, None),
+    # SQLite reads the overflowing real literals as infinite, but has no NaN.
+    'sqlite': Dialect('sqlite', '1', '0', '1', '0', False, None, '9e999', '-9e999'),
+    'sqlserver': Dialect('sqlserver', '1', '0', '1', '0', False, None, None, None),
+    'oracle': Dialect(
+        'oracle',
+        '1',
+        '0',
+        '1',
+        '0',
+        False,
+        'BINARY_DOUBLE_NAN',
+        'BINARY_DOUBLE_INFINITY',
+        '-BINARY_DOUBLE_INFINITY',
+    ),
+}
+'''The supported dialects by name.'''
@@ -0,0 +1,48 @@
+'''
+Defines the validation of SQL identifiers (table, column and constraint names).
+'''
+
+import re
+from functools import lru_cache
+from typing import Any
+
+IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_]*$')
+UNDERSCORE_IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
+def is_valid_identifier(name: Any, *, allow_leading_underscore: bool = False) -> bool:
+    '''
+    Parameters
+    ----------
+    name : Any
+        The identifier to be validated.
+    allow_leading_underscore : bool
+        If the identifier can start with an underscore.
+
+    Returns
+    -------
+    bool
+        True if the name is a string with a valid SQL identifier, False otherwise.
+
+    Examples
+    --------
+    >>> is_valid_identifier('created_at')
+    True
+    >>> is_valid_identifier('_created_at')
+    False
+    >>> is_valid_identifier('_created_at', allow_leading_underscore=True)
+    True
+    >>> is_valid_identifier('2created_at')
+    False
+    >>> is_valid_identifier(123)
+    False
+    '''
+
+    return isinstance(name, str) and _matches_identifier_pattern(name, allow_leading_underscore)
+
+
+@lru_cache(maxsize=4096)
+def _matches_identifier_pattern(name: str, allow_leading_underscore: bool) -> bool:
+    pattern = UNDERSCORE_IDENTIFIER_PATTERN if allow_leading_underscore else IDENTIFIER_PATTERN
+
+    return pattern.search(name) is not None
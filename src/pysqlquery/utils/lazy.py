@@ -0,0 +1,68 @@
+'''
+Defines the lazy loading of the public names of `pysqlquery` packages.
+'''
+
+import sys
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_attributes(
+    package_name: str, lazy_attrs: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    '''
+    Returns the module level `__getattr__` and `__dir__` functions of a package whose
+    public names are imported from its submodules only when they are first accessed.
+
+    The other names are looked up as the package's submodules, so they are still
+    reachable as attributes (like `pysqlquery.types`) without being imported upfront.
+
+    Parameters
+    ----------
+    package_name : str
+        The package's `__name__`.
+    lazy_attrs : dict[str, str]
+        The relative name of the submodule that defines each public name.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The `__getattr__` and `__dir__` functions of the package.
+
+    Examples
+    --------
+    In the package's `__init__.py`:
+
+    >>> __getattr__, __dir__ = lazy_attributes(__name__, {'Column': '.column'})
+    '''
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = lazy_attrs[name]
+        except KeyError:
+            return _import_submodule(package_name, name)
+
+        value = getattr(import_module(module_name, package_name), name)
+        setattr(sys.modules[package_name], name, value)
+
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package_name]), *lazy_attrs})
+
+    return __getattr__, __dir__
+
+
+def _import_submodule(package_name: str, name: str) -> Any:
+    error = AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+    if name.startswith('__'):
+        raise error
+
+    try:
+        return import_module(f'.{name}', package_name)
+    except ModuleNotFoundError as exc:
+        if exc.name != f'{package_name}.{name}':
+            raise
+
+        raise error from None
@@ -0,0 +1,36 @@
+'''
+Defines helpers for the optional NumPy support.
+
+NumPy isn't a dependency of `pysqlquery` (install it with `pip install pysqlquery[numpy]`),
+so it's only imported when a NumPy array or a memoryview must be handled.
+'''
+
+import sys
+from functools import lru_cache
+from types import ModuleType
+from typing import Any
+
+
+@lru_cache(maxsize=None)
+def import_numpy() -> ModuleType | None:
+    '''
+    Returns the `numpy` module, or None if it isn't installed.
+    '''
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+def is_numpy_array(value: Any) -> bool:
+    '''
+    Returns if the value is a NumPy array, without importing NumPy (a NumPy array
+    can only exist if NumPy was already imported).
+    '''
+
+    numpy = sys.modules.get('numpy')
+
+    return numpy is not None and isinstance(value, numpy.ndarray)
@@ -0,0 +1,81 @@
+'''
+Defines helpers for running `pysqlquery` work in a process pool.
+'''
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+# multiprocessing and concurrent.futures are imported inside the functions, as they're
+# slow to import and only needed for parallel work.
+
+
+def get_fork_context() -> 'BaseContext | None':
+    '''
+    Returns the `fork` multiprocessing context, or None if this platform can't fork.
+
+    Forked workers inherit the parent's memory, so tables and columns defined anywhere
+    (even inside functions) are available to them without being pickled.
+    '''
+
+    import multiprocessing
+
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+
+    return multiprocessing.get_context('fork')
+
+
+def imap_in_process_pool(
+    function: Callable[..., Any],
+    args: Iterable[tuple],
+    workers: int,
+    *,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Iterator[Any]:
+    '''
+    Runs `function(*arg)` for each tuple in `args` in a pool of forked processes.
+
+    Results are yielded in the same order as `args`. At most `2 * workers` calls are in
+    flight at a time, so a slow consumer never makes the results pile up in memory.
+
+    Parameters
+    ----------
+    function : Callable
+        A module level function (it's referenced by name in the workers).
+    args : Iterable[tuple]
+        The positional arguments of each call.
+    workers : int
+        The number of worker processes.
+    initializer : Callable | None
+        A function called once in each worker before any call.
+    initargs : tuple
+        The arguments of `initializer`.
+
+    Returns
+    -------
+    Iterator[Any]
+        The result of each call, in the order of `args`.
+    '''
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_fork_context(),
+        initializer=initializer,
+        initargs=initargs,
+    ) as executor:
+        pending = deque()
+
+        for arg in args:
+            pending.append(executor.submit(function, *arg))
+
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
@@ -18,7 +18,7 @@ from src.pysqlquery.table.exceptions.column import (
     InvalidSQLType,
     InvalidUnique,
 )
-from src.pysqlquery.types import Char, Float, Integer, String
+from src.pysqlquery.types import Boolean, Char, Float, Integer, String
 
 
 class TestColumn:
@@ -70,6 +70,28 @@ class TestColumn:
 
         assert result == expected
 
+    def test_quando_coluna_nome_recebe_default_com_aspas_retorna_DEFAULT_com_aspas_escapadas(
+        self,
+    ) -> None:
+        class Tabela(Table):
+            nome = Column(String(20), default="O'Hara")
+
+        entry = Tabela(test=True).nome
+        result = str(entry)
+        expected = "nome VARCHAR(20) NOT NULL DEFAULT 'O''Hara'"
+
+        assert result == expected
+
+    def test_quando_coluna_ativo_recebe_default_True_retorna_DEFAULT_TRUE(self) -> None:
+        class Tabela(Table):
+            ativo = Column(Boolean, default=True)
+
+        entry = Tabela(test=True).ativo
+        result = str(entry)
+        expected = 'ativo BOOLEAN NOT NULL DEFAULT TRUE'
+
+        assert result == expected
+
     def test_quando_coluna_contagem_recebe_data_type_Integer_e_auto_increment_mssql_retorna_contagem_INTEGER_IDENTITY_1_1(
         self,
     ) -> None:
@@ -479,3 +501,15 @@ class TestColumn:
         expected = False
 
         assert result == expected
+
+    def test_quando_coluna_e_criada_ela_e_seu_data_type_nao_possuem__dict__(
+        self,
+    ) -> None:
+        class Tabela(Table):
+            col = Column(String(50), ForeignKey('outra_tabela', 'id'))
+
+        entry = Tabela(test=True).col
+
+        assert not hasattr(entry, '__dict__')
+        assert not hasattr(entry.data_type, '__dict__')
+        assert not hasattr(entry.foreign_key, '__dict__')
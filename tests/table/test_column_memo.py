@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.exceptions.column import InvalidMemoSize
+from src.pysqlquery.types import Bit, Boolean, Char, Date, Decimal, Integer
+
+VALUES = [None, 0, 1, 1.0, True, False, 'BR', 'USA', '2024-01-31', '2024-02-30', 10.5, [1], {}]
+
+
+class TestColumnMemo:
+    def test_quando_valida_valores_repetidos_conta_acertos_e_erros(self) -> None:
+        entry = Column(Char(2), memo_size=10)
+
+        for value in ['BR', 'US', 'BR', 'BR', 'USA']:
+            entry.validate_value(value)
+
+        assert entry.memo_info.hits == 2
+        assert entry.memo_info.misses == 3
+        assert entry.memo_info.currsize == 3
+        assert entry.memo_info.maxsize == 10
+
+    def test_quando_valores_iguais_tem_tipos_diferentes_memoriza_cada_um(self) -> None:
+        entry = Column(Boolean, memo_size=10)
+
+        assert entry.validate_value(True) is True
+        assert entry.validate_value(1) is False
+        assert entry.validate_value(1.0) is False
+
+    def test_quando_valor_nao_e_hashable_valida_sem_memorizar(self) -> None:
+        entry = Column(Integer, memo_size=10)
+
+        assert entry.validate_value([1]) is False
+        assert entry.memo_info.currsize == 0
+
+    def test_quando_memo_enche_descarta_os_menos_usados(self) -> None:
+        entry = Column(Integer, memo_size=3)
+
+        for value in range(10):
+            entry.validate_value(value)
+
+        assert entry.memo_info.currsize == 3
+
+    def test_quando_limpa_o_memo_zera_as_estatisticas(self) -> None:
+        entry = Column(Integer, memo_size=3)
+        entry.validate_value(1)
+
+        entry.clear_memo()
+
+        assert entry.memo_info.currsize == 0
+        assert entry.memo_info.misses == 0
+
+    def test_quando_memo_size_nao_e_passado_memo_info_retorna_None(self) -> None:
+        entry = Column(Integer)
+
+        assert entry.memo_size is None
+        assert entry.memo_info is None
+
+    @pytest.mark.parametrize('memo_size', [0, -1, True, 1.5, 'a'])
+    def test_quando_memo_size_e_invalido_lanca_InvalidMemoSize(self, memo_size) -> None:
+        with pytest.raises(InvalidMemoSize):
+            Column(Integer, memo_size=memo_size)
+
+    def test_quando_valida_linhas_com_memo_retorna_o_mesmo_resultado_sem_memo(self) -> None:
+        class TabelaComMemo(Table):
+            code = Column(Char(2), memo_size=4)
+            day = Column(Date, nullable=True, memo_size=4)
+            price = Column(Decimal(3, 1), memo_size=4)
+            flag = Column(Bit, memo_size=4)
+
+        class TabelaSemMemo(Table):
+            code = Column(Char(2))
+            day = Column(Date, nullable=True)
+            price = Column(Decimal(3, 1))
+            flag = Column(Bit)
+
+        rng = random.Random(18)
+        rows = [[rng.choice(VALUES) for _ in range(4)] for _ in range(2000)]
+
+        result = TabelaComMemo(test=True).validate_rows(rows)
+
+        assert result == TabelaSemMemo(test=True).validate_rows(rows)
+        assert TabelaComMemo.code.memo_info.hits > 0
+
+    def test_quando_valida_lista_com_memo_retorna_o_mesmo_resultado_sem_memo(self) -> None:
+        entry = Column(Date, nullable=True, memo_size=4)
+
+        assert entry.validate_values(VALUES) == Column(Date, nullable=True).validate_values(
+            VALUES
+        )
@@ -0,0 +1,94 @@
+import pytest
+
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.base import ErrorCode, ErrorReport, ValidationError
+from src.pysqlquery.table.exceptions.table import InvalidRows
+from src.pysqlquery.types import Integer, String
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer, primary_key=True)
+        name = Column(String(5), nullable=True)
+
+    return Tabela(test=True)
+
+
+class TestErrorReport:
+    def test_quando_valida_linhas_com_report_retorna_os_erros_de_cada_valor(self, tabela) -> None:
+        rows = [(1, 'Ann'), (None, 'Annabelle'), (3, None), ('4', 5), (5,)]
+
+        report = tabela.validate_rows(rows, report=True)
+
+        assert isinstance(report, ErrorReport)
+        assert list(report) == [
+            ValidationError(1, 'id', ErrorCode.NULL_VALUE, None),
+            ValidationError(1, 'name', ErrorCode.INVALID_VALUE, 'Annabelle'),
+            ValidationError(3, 'id', ErrorCode.INVALID_VALUE, '4'),
+            ValidationError(3, 'name', ErrorCode.INVALID_VALUE, 5),
+            ValidationError(4, None, ErrorCode.WRONG_VALUE_COUNT, 1),
+        ]
+        assert report.invalid_rows() == [1, 3, 4]
+        assert report.error_counts == {'id': 2, 'name': 2}
+
+    def test_quando_le_mensagens_retorna_mensagens_formatadas(self, tabela) -> None:
+        report = tabela.validate_rows([(None, 'Annabelle'), (1, 'a', 'b')], report=True)
+
+        assert list(report.messages()) == [
+            "Row 0: the id column can't be NULL",
+            "Row 0: the value 'Annabelle' of the name column isn't a valid VARCHAR(5) data",
+            'Row 1: 3 values were passed, but the TABELA table has 2 columns',
+        ]
+
+    def test_quando_registra_erros_nao_formata_mensagens(self, tabela, monkeypatch) -> None:
+        monkeypatch.setattr(ErrorReport, 'MESSAGES', None)
+
+        report = tabela.validate_rows([(None, None)] * 100, report=True)
+
+        assert len(report) == 100
+        assert report.codes.tolist() == [ErrorCode.NULL_VALUE] * 100
+
+    def test_quando_ha_erros_raise_for_errors_lanca_InvalidRows(self, tabela) -> None:
+        report = tabela.validate_rows([(1, None), (2, 'Annabelle')], report=True)
+
+        with pytest.raises(InvalidRows, match='received 1 invalid values'):
+            report.raise_for_errors()
+
+    def test_quando_nao_ha_erros_raise_for_errors_nao_lanca_excecao(self, tabela) -> None:
+        report = tabela.validate_rows([(1, None), (2, 'Ann')], report=True)
+
+        assert len(report) == 0
+        report.raise_for_errors()
+
+    def test_quando_pega_valores_invalidos_guarda_so_os_valores_das_colunas_com_erro(
+        self, tabela
+    ) -> None:
+        report = ErrorReport('TABELA', tabela.columns)
+
+        assert report.get_invalid_values((None, 'Ann'), 0b1) == (None,)
+        assert report.get_invalid_values(('1', 'Annabelle'), 0b10) == ('Annabelle',)
+        assert report.get_invalid_values((1, 'a', 'b'), 0b11) == 3
+
+    def test_quando_adiciona_valores_invalidos_registra_um_erro_por_valor(self, tabela) -> None:
+        report = ErrorReport('TABELA', tabela.columns)
+
+        report.add_invalid_values(2, 0b11, (None, 'Annabelle'))
+        report.add_invalid_values(5, 0b11, 3)
+
+        assert list(report) == [
+            ValidationError(2, 'id', ErrorCode.NULL_VALUE, None),
+            ValidationError(2, 'name', ErrorCode.INVALID_VALUE, 'Annabelle'),
+            ValidationError(5, None, ErrorCode.WRONG_VALUE_COUNT, 3),
+        ]
+
+    def test_quando_valida_com_2_workers_retorna_o_mesmo_relatorio(self, tabela) -> None:
+        rows = [
+            (i, 'abcdef' if i % 7 == 0 else None) if i % 5 else ('x', 'a') for i in range(1000)
+        ]
+
+        result = tabela.validate_rows(iter(rows), workers=2, chunk_size=64, report=True)
+        expected = tabela.validate_rows(rows, report=True)
+
+        assert list(result) == list(expected)
+        assert list(result.messages()) == list(expected.messages())
@@ -0,0 +1,145 @@
+import sqlite3
+
+import pytest
+
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.exceptions.table import (
+    InvalidMaxBytesValue,
+    InvalidMaxRowsValue,
+    InvalidRows,
+    RowTooLarge,
+)
+from src.pysqlquery.types import Boolean, Decimal, Float, Integer, String
+from src.pysqlquery.types.exceptions.sql_type import InvalidDialect, NonFiniteLiteral
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer, primary_key=True)
+        name = Column(String(20), nullable=True)
+        price = Column(Decimal(6, 2), nullable=True)
+        active = Column(Boolean, nullable=True)
+
+    return Tabela(test=True)
+
+
+def generate_rows(qty: int) -> list[tuple]:
+    return [(i, f"O'Neil {i}" if i % 3 else None, i * 1.25, i % 2 == 0) for i in range(qty)]
+
+
+class TestInsertMany:
+    def test_quando_insere_linhas_retorna_statements_com_max_rows_linhas(self, tabela) -> None:
+        statements = list(tabela.insert_many(generate_rows(5), max_rows=2))
+
+        assert len(statements) == 3
+        assert statements[2] == 'INSERT INTO TABELA (id, name, price, active) VALUES\n\t' + (
+            "(4, 'O''Neil 4', 5.0, TRUE);"
+        )
+
+    def test_quando_executa_statements_insere_todas_as_linhas(self, tabela) -> None:
+        rows = generate_rows(250)
+        connection = sqlite3.connect(':memory:')
+        connection.execute('CREATE TABLE TABELA (id, name, price, active)')
+
+        for statement in tabela.insert_many(rows, max_rows=None, max_bytes=1000):
+            connection.execute(statement)
+
+        assert connection.execute('SELECT * FROM TABELA ORDER BY id').fetchall() == [
+            (id_, name, price, int(active)) for id_, name, price, active in rows
+        ]
+
+    @pytest.mark.parametrize('max_bytes', [100, 257, 1000])
+    def test_quando_recebe_max_bytes_os_statements_nao_passam_do_limite(
+        self, tabela, max_bytes
+    ) -> None:
+        rows = generate_rows(100) + [(100, 'ção' * 4, None, None)]
+
+        statements = list(tabela.insert_many(rows, max_rows=None, max_bytes=max_bytes))
+
+        assert all(len(statement.encode()) <= max_bytes for statement in statements)
+        assert sum(statement.count('\n\t') for statement in statements) == len(rows)
+
+    def test_quando_recebe_max_bytes_cada_statement_tem_o_maximo_de_linhas(self, tabela) -> None:
+        rows = generate_rows(100)
+
+        statements = list(tabela.insert_many(rows, max_rows=None, max_bytes=300))
+
+        for statement, next_statement in zip(statements, statements[1:]):
+            next_row = next_statement.split('\n\t')[1].rstrip(',;')
+            assert len(statement.encode()) + len(',\n\t') + len(next_row) > 300
+
+    def test_quando_linha_nao_cabe_em_max_bytes_lanca_RowTooLarge(self, tabela) -> None:
+        with pytest.raises(RowTooLarge):
+            list(tabela.insert_many([(1, 'a' * 20, None, None)], max_bytes=60))
+
+    def test_quando_le_statements_consome_as_linhas_aos_poucos(self, tabela) -> None:
+        rows = iter(generate_rows(10))
+
+        statements = tabela.insert_many(rows, max_rows=4)
+        next(statements)
+
+        assert len(list(rows)) == 6
+
+    def test_quando_linha_e_invalida_lanca_InvalidRows(self, tabela) -> None:
+        statements = tabela.insert_many([(1, 'a', None, None), ('2', 'b', None, None)])
+
+        with pytest.raises(InvalidRows, match='Row 1: the value'):
+            list(statements)
+
+    def test_quando_validate_e_False_nao_valida_as_linhas(self, tabela) -> None:
+        statements = list(tabela.insert_many([('2', 'b', None, None)], validate=False))
+
+        assert statements[0].endswith("('2', 'b', NULL, NULL);")
+
+    @pytest.mark.parametrize('row', [(1, 'a'), (1, 'a', None, None, 2)])
+    def test_quando_validate_e_False_e_linha_tem_quantidade_errada_lanca_InvalidRows(
+        self, tabela, row
+    ) -> None:
+        statements = tabela.insert_many([(1, 'a', None, None), row], validate=False)
+
+        with pytest.raises(InvalidRows, match=f'Row 1: {len(row)} values were passed'):
+            list(statements)
+
+    def test_quando_recebe_dialeto_renderiza_os_literais_do_dialeto(self, tabela) -> None:
+        statements = list(tabela.insert_many([(1, 'C:\\', 2.5, True)], dialect='mysql'))
+
+        assert statements[0].endswith("(1, 'C:\\\\', 2.5, TRUE);")
+
+    def test_quando_float_nao_e_finito_usa_literal_do_dialeto_ou_lanca_NonFiniteLiteral(
+        self,
+    ) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            value = Column(Float)
+
+        rows = [(1, float('nan')), (2, float('inf'))]
+
+        statements = list(Tabela(test=True).insert_many(rows, dialect='postgresql'))
+
+        assert statements[0].endswith("(1, 'NaN'::float8),\n\t(2, 'Infinity'::float8);")
+
+        with pytest.raises(NonFiniteLiteral):
+            list(Tabela(test=True).insert_many(rows, dialect='mysql'))
+
+    def test_quando_dialeto_e_invalido_lanca_InvalidDialect(self, tabela) -> None:
+        with pytest.raises(InvalidDialect):
+            list(tabela.insert_many([], dialect='postgres'))
+
+        with pytest.raises(InvalidDialect):
+            String().render_literal('a', 'postgres')
+
+    def test_quando_nao_ha_linhas_nao_retorna_statements(self, tabela) -> None:
+        assert list(tabela.insert_many([])) == []
+
+    @pytest.mark.parametrize('max_rows', [0, -1, 1.5, True])
+    def test_quando_max_rows_e_invalido_lanca_InvalidMaxRowsValue(self, tabela, max_rows) -> None:
+        with pytest.raises(InvalidMaxRowsValue):
+            list(tabela.insert_many([], max_rows=max_rows))
+
+    @pytest.mark.parametrize('max_bytes', [0, -1, '1', False])
+    def test_quando_max_bytes_e_invalido_lanca_InvalidMaxBytesValue(
+        self, tabela, max_bytes
+    ) -> None:
+        with pytest.raises(InvalidMaxBytesValue):
+            list(tabela.insert_many([], max_bytes=max_bytes))
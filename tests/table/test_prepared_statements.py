@@ -0,0 +1,191 @@
+import sqlite3
+
+import pytest
+
+from src.pysqlquery.constraints import PrimaryKeyConstraint
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.exceptions.table import (
+    InvalidParamstyle,
+    InvalidRows,
+    InvalidUpdateTable,
+)
+from src.pysqlquery.types import Decimal, Integer, String
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer, primary_key=True)
+        name = Column(String(20), nullable=True)
+        price = Column(Decimal(6, 2), nullable=True)
+
+    return Tabela(test=True)
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE TABELA (id PRIMARY KEY, name, price)')
+
+    yield connection
+
+    connection.close()
+
+
+def generate_rows(qty: int) -> list[tuple]:
+    return [(i, f"O'Neil {i}" if i % 3 else None, i * 1.25) for i in range(qty)]
+
+
+class TestPrepareInsert:
+    @pytest.mark.parametrize(
+        'paramstyle, expected',
+        [
+            ('qmark', 'INSERT INTO TABELA (id, name, price) VALUES (?, ?, ?)'),
+            ('numeric', 'INSERT INTO TABELA (id, name, price) VALUES (:1, :2, :3)'),
+            ('named', 'INSERT INTO TABELA (id, name, price) VALUES (:id, :name, :price)'),
+            ('format', 'INSERT INTO TABELA (id, name, price) VALUES (%s, %s, %s)'),
+            (
+                'pyformat',
+                'INSERT INTO TABELA (id, name, price) VALUES (%(id)s, %(name)s, %(price)s)',
+            ),
+        ],
+    )
+    def test_quando_prepara_insert_retorna_statement_com_placeholders(
+        self, tabela, paramstyle, expected
+    ) -> None:
+        statement, _ = tabela.prepare_insert([], paramstyle=paramstyle)
+
+        assert statement == expected
+
+    @pytest.mark.parametrize('paramstyle', ['qmark', 'named'])
+    def test_quando_executa_com_executemany_insere_todas_as_linhas(
+        self, tabela, connection, paramstyle
+    ) -> None:
+        rows = generate_rows(500)
+
+        connection.executemany(*tabela.prepare_insert(iter(rows), paramstyle=paramstyle))
+
+        assert connection.execute('SELECT * FROM TABELA ORDER BY id').fetchall() == rows
+
+    def test_quando_estilo_e_named_retorna_dicts_por_nome_da_coluna(self, tabela) -> None:
+        _, parameters = tabela.prepare_insert([(1, 'a', None)], paramstyle='pyformat')
+
+        assert list(parameters) == [{'id': 1, 'name': 'a', 'price': None}]
+
+    def test_quando_prepara_insert_duas_vezes_reusa_o_statement(self, tabela) -> None:
+        statement, _ = tabela.prepare_insert([])
+
+        assert tabela.prepare_insert([])[0] is statement
+        assert type(tabela)(test=True).prepare_insert([])[0] is statement
+
+    def test_quando_named_constraint_altera_coluna_o_statement_e_construido_novamente(
+        self,
+    ) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+            name = Column(String)
+            __constraints__ = [PrimaryKeyConstraint('pk_tabela', 'id')]
+
+        statement, _ = Tabela(test=True).prepare_update([])
+
+        assert statement == 'UPDATE TABELA SET name = ? WHERE id = ?'
+
+    def test_quando_le_parametros_consome_as_linhas_aos_poucos(self, tabela) -> None:
+        rows = iter(generate_rows(10))
+
+        _, parameters = tabela.prepare_insert(rows)
+        next(parameters)
+
+        assert len(list(rows)) == 9
+
+    def test_quando_linha_e_invalida_lanca_InvalidRows(self, tabela, connection) -> None:
+        rows = [(1, 'a', None), (None, 'b', None)]
+
+        with pytest.raises(InvalidRows, match="Row 1: the id column can't be NULL"):
+            connection.executemany(*tabela.prepare_insert(rows))
+
+    def test_quando_validate_e_False_nao_valida_as_linhas(self, tabela) -> None:
+        _, parameters = tabela.prepare_insert([(None, 'b', None)], validate=False)
+
+        assert list(parameters) == [(None, 'b', None)]
+
+    @pytest.mark.parametrize('row', [(2, 'b'), (2, 'b', None, 3)])
+    @pytest.mark.parametrize('paramstyle', ['qmark', 'named'])
+    def test_quando_validate_e_False_e_linha_tem_quantidade_errada_lanca_InvalidRows(
+        self, tabela, paramstyle, row
+    ) -> None:
+        _, parameters = tabela.prepare_insert(
+            [(1, 'a', None), row], paramstyle=paramstyle, validate=False
+        )
+        next(parameters)
+
+        with pytest.raises(InvalidRows, match=f'Row 1: {len(row)} values were passed'):
+            next(parameters)
+
+    @pytest.mark.parametrize('paramstyle', ['', 'QMARK', 'dollar', None])
+    def test_quando_paramstyle_e_invalido_lanca_InvalidParamstyle(
+        self, tabela, paramstyle
+    ) -> None:
+        with pytest.raises(InvalidParamstyle):
+            tabela.prepare_insert([], paramstyle=paramstyle)
+
+
+class TestPrepareUpdate:
+    def test_quando_prepara_update_retorna_statement_e_parametros_na_ordem_do_statement(
+        self, tabela
+    ) -> None:
+        statement, parameters = tabela.prepare_update([(1, 'a', 2.5)], paramstyle='numeric')
+
+        assert statement == 'UPDATE TABELA SET name = :1, price = :2 WHERE id = :3'
+        assert list(parameters) == [('a', 2.5, 1)]
+
+    def test_quando_chave_primaria_e_composta_usa_todas_as_colunas_no_where(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            version = Column(Integer, primary_key=True)
+            name = Column(String)
+
+        statement, parameters = Tabela(test=True).prepare_update(
+            [(1, 2, 'a')], paramstyle='named'
+        )
+
+        assert statement == 'UPDATE TABELA SET name = :name WHERE id = :id AND version = :version'
+        assert list(parameters) == [{'name': 'a', 'id': 1, 'version': 2}]
+
+    @pytest.mark.parametrize('paramstyle', ['qmark', 'named'])
+    def test_quando_executa_com_executemany_atualiza_as_linhas(
+        self, tabela, connection, paramstyle
+    ) -> None:
+        rows = generate_rows(100)
+        connection.executemany(*tabela.prepare_insert(rows))
+        updated_rows = [(id_, 'updated', price * 2) for id_, _, price in rows[::2]]
+
+        connection.executemany(*tabela.prepare_update(updated_rows, paramstyle=paramstyle))
+
+        assert connection.execute('SELECT * FROM TABELA ORDER BY id').fetchall() == [
+            updated_rows[i // 2] if i % 2 == 0 else row for i, row in enumerate(rows)
+        ]
+
+    @pytest.mark.parametrize('row', [(2, 'b'), (2, 'b', None, 3)])
+    @pytest.mark.parametrize('paramstyle', ['qmark', 'named'])
+    def test_quando_validate_e_False_e_linha_tem_quantidade_errada_lanca_InvalidRows(
+        self, tabela, paramstyle, row
+    ) -> None:
+        _, parameters = tabela.prepare_update([row], paramstyle=paramstyle, validate=False)
+
+        with pytest.raises(InvalidRows, match=f'Row 0: {len(row)} values were passed'):
+            next(parameters)
+
+    def test_quando_tabela_nao_tem_chave_primaria_lanca_InvalidUpdateTable(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+
+        with pytest.raises(InvalidUpdateTable):
+            Tabela(test=True).prepare_update([])
+
+    def test_quando_tabela_so_tem_chave_primaria_lanca_InvalidUpdateTable(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+
+        with pytest.raises(InvalidUpdateTable):
+            Tabela(test=True).prepare_update([])
@@ -0,0 +1,191 @@
+import decimal
+import random
+
+import pytest
+
+from src.pysqlquery.constraints import PrimaryKeyConstraint
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.exceptions.table import InvalidChunkSizeValue, InvalidWorkersValue
+from src.pysqlquery.types import (
+    Bit,
+    Boolean,
+    Char,
+    Date,
+    DateTime,
+    Decimal,
+    Double,
+    Float,
+    Integer,
+    Real,
+    String,
+    Time,
+)
+
+SQL_TYPES = [
+    Integer(),
+    Integer(3),
+    String(),
+    String(4),
+    Char(),
+    Char(3),
+    Boolean(),
+    Bit(),
+    Decimal(),
+    Decimal(4, 2),
+    Double(6),
+    Float(5, 1),
+    Real(3),
+    Date(),
+    DateTime(),
+    Time(),
+]
+
+VALUES = [
+    None, 0, 1, -1, 2, 999, 1000, -1000, True, False, 0.5, 1.25, 12.345, -99.9, 1e-07,
+    float('nan'), float('inf'), decimal.Decimal('1.50'), decimal.Decimal('NaN'), '', 'a',
+    'abc', 'abcd', 'abcde', '2005-02-27', '2005-02-30', '2005-02-27 12:52:10', '12:45:31',
+    '25:00:00', b'abc', [1], object(),
+]
+
+
+class StrangeInteger(Integer):
+    def validate_value(self, value: int) -> bool:
+        return value == 'strange'
+
+
+class TestRowValidator:
+    @pytest.mark.parametrize('sql_type', SQL_TYPES, ids=str)
+    @pytest.mark.parametrize('nullable', [False, True])
+    def test_quando_valida_valores_retorna_mesmo_resultado_de_validate_value(
+        self, sql_type, nullable
+    ) -> None:
+        class Tabela(Table):
+            col = Column(sql_type, nullable=nullable)
+
+        validate_row = Tabela(test=True).compile_validator()
+
+        for value in VALUES:
+            expected = (value is None and nullable) or (
+                value is not None and sql_type.validate_value(value)
+            )
+
+            assert validate_row((value,)) == (0 if expected else 1), value
+
+    def test_quando_valida_linhas_aleatorias_retorna_mascara_das_colunas_invalidas(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            name = Column(String(4), nullable=True)
+            price = Column(Decimal(4, 2))
+            day = Column(Date, nullable=True)
+            active = Column(Boolean)
+
+        table = Tabela(test=True)
+        validate_row = table.compile_validator()
+        rng = random.Random(14)
+
+        for _ in range(2000):
+            row = [rng.choice(VALUES) for _ in table.columns]
+            expected = 0
+
+            for i, (column, value) in enumerate(zip(table.columns, row)):
+                if value is None and not column.nullable:
+                    expected |= 1 << i
+                elif value is not None and not column.data_type.validate_value(value):
+                    expected |= 1 << i
+
+            assert validate_row(row) == expected, row
+
+    def test_quando_linha_tem_quantidade_errada_de_valores_retorna_todas_as_colunas(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+            name = Column(String)
+
+        validate_row = Tabela(test=True).compile_validator()
+
+        assert validate_row((1,)) == 0b11
+        assert validate_row((1, 'a', 'b')) == 0b11
+
+    def test_quando_tipo_sobrescreve_validate_value_usa_validate_value(self) -> None:
+        class Tabela(Table):
+            col = Column(StrangeInteger())
+
+        validate_row = Tabela(test=True).compile_validator()
+
+        assert validate_row(('strange',)) == 0
+        assert validate_row((1,)) == 1
+
+    def test_quando_compila_validador_duas_vezes_retorna_o_mesmo_validador(self) -> None:
+        class Tabela(Table):
+            col = Column(Integer)
+
+        assert Tabela(test=True).compile_validator() is Tabela(test=True).compile_validator()
+
+    def test_quando_named_constraint_altera_coluna_o_validador_e_compilado_novamente(
+        self,
+    ) -> None:
+        class Tabela(Table):
+            id = Column(Integer, nullable=True)
+            __constraints__ = [PrimaryKeyConstraint('pk_tabela', 'id')]
+
+        assert Tabela(test=True).validate_row((None,)) is False
+
+    def test_quando_valida_linha_valida_retorna_True(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            name = Column(String(5), nullable=True)
+
+        table = Tabela(test=True)
+
+        assert table.validate_row((1, 'Ann')) is True
+        assert table.validate_row((1, None)) is True
+        assert table.validate_row((1, 'Annabelle')) is False
+
+    def test_quando_valida_linhas_retorna_mascara_das_linhas_invalidas(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            name = Column(String(5), nullable=True)
+
+        table = Tabela(test=True)
+        entry = iter([(1, 'Ann'), (2, 'Annabelle'), ('3', None), (None, 1)])
+
+        assert table.validate_rows(entry) == {1: 0b10, 2: 0b01, 3: 0b11}
+
+    def test_quando_valida_linhas_com_2_workers_retorna_as_linhas_invalidas_em_ordem(
+        self,
+    ) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            name = Column(String(4), nullable=True)
+
+        table = Tabela(test=True)
+        rows = [
+            (i, 'abcde' if i % 7 == 0 else None) if i % 5 else ('x', 'a') for i in range(1000)
+        ]
+
+        result = table.validate_rows(iter(rows), workers=2, chunk_size=64)
+
+        assert list(result.items()) == list(table.validate_rows(rows).items())
+        assert list(result) == sorted(result)
+
+    def test_quando_linhas_cabem_em_um_chunk_valida_no_processo(self, monkeypatch) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+
+        monkeypatch.setattr('src.pysqlquery.table.table.imap_in_process_pool', None)
+
+        assert Tabela(test=True).validate_rows([(1,), ('a',)], workers=2) == {1: 1}
+
+    def test_quando_workers_recebe_0_lanca_InvalidWorkersValue(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+
+        with pytest.raises(InvalidWorkersValue):
+            Tabela(test=True).validate_rows([], workers=0)
+
+    @pytest.mark.parametrize('chunk_size', [0, -1, 1.5, True])
+    def test_quando_chunk_size_e_invalido_lanca_InvalidChunkSizeValue(self, chunk_size) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+
+        with pytest.raises(InvalidChunkSizeValue):
+            Tabela(test=True).validate_rows([], workers=2, chunk_size=chunk_size)
@@ -0,0 +1,256 @@
+import sqlite3
+
+import pytest
+
+from src.pysqlquery.table import Column, Select, Table
+from src.pysqlquery.table.base import QueryCache
+from src.pysqlquery.table.exceptions.column import EmptyInValues
+from src.pysqlquery.table.exceptions.table import (
+    ColumnNotFound,
+    InvalidLimitValue,
+    InvalidOffsetValue,
+    InvalidParamstyle,
+    InvalidQueryCacheSize,
+)
+from src.pysqlquery.types import Decimal, Integer, String
+
+
+class Tabela(Table):
+    id = Column(Integer, primary_key=True)
+    name = Column(String(20), nullable=True)
+    price = Column(Decimal(6, 2), nullable=True)
+
+
+class OutraTabela(Table):
+    id = Column(Integer, primary_key=True)
+
+
+@pytest.fixture
+def tabela():
+    return Tabela(test=True)
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE TABELA (id PRIMARY KEY, name, price)')
+    connection.executemany(
+        'INSERT INTO TABELA VALUES (?, ?, ?)',
+        [(i, f'name {i}' if i % 3 else None, i * 1.5) for i in range(30)],
+    )
+
+    yield connection
+
+    connection.close()
+
+
+@pytest.fixture
+def cache():
+    maxsize = Select.cache.maxsize
+    Select.cache.clear()
+
+    yield Select.cache
+
+    Select.cache.resize(maxsize)
+
+
+class TestSelect:
+    def test_quando_nao_ha_colunas_seleciona_todas(self, tabela) -> None:
+        assert tabela.select().compile() == ('SELECT id, name, price FROM TABELA', ())
+
+    def test_quando_ha_colunas_seleciona_elas_na_ordem_dada(self, tabela) -> None:
+        result = tabela.select('price', Tabela.id).compile()
+
+        assert result == ('SELECT price, id FROM TABELA', ())
+
+    @pytest.mark.parametrize(
+        'condition, expected, params',
+        [
+            (Tabela.id.eq(1), 'id = ?', (1,)),
+            (Tabela.id.ne(1), 'id <> ?', (1,)),
+            (Tabela.id.lt(1), 'id < ?', (1,)),
+            (Tabela.id.le(1), 'id <= ?', (1,)),
+            (Tabela.id.gt(1), 'id > ?', (1,)),
+            (Tabela.id.ge(1), 'id >= ?', (1,)),
+            (Tabela.name.like('a%'), 'name LIKE ?', ('a%',)),
+            (Tabela.id.between(1, 5), 'id BETWEEN ? AND ?', (1, 5)),
+            (Tabela.id.in_(range(3)), 'id IN (?, ?, ?)', (0, 1, 2)),
+            (Tabela.name.eq(None), 'name IS NULL', ()),
+            (Tabela.name.ne(None), 'name IS NOT NULL', ()),
+        ],
+    )
+    def test_quando_filtra_gera_a_condicao_com_placeholders(
+        self, tabela, condition, expected, params
+    ) -> None:
+        result = tabela.select('id').where(condition).compile()
+
+        assert result == (f'SELECT id FROM TABELA WHERE {expected}', params)
+
+    def test_quando_combina_condicoes_usa_parenteses_so_onde_precisa(self, tabela) -> None:
+        condition = Tabela.id.gt(1) & Tabela.id.lt(9) & (Tabela.name.is_null() | ~Tabela.id.eq(5))
+
+        result = tabela.select('id').where(condition).compile()
+
+        assert result == (
+            'SELECT id FROM TABELA WHERE id > ? AND id < ? AND (name IS NULL OR NOT (id = ?))',
+            (1, 9, 5),
+        )
+
+    def test_quando_where_e_chamado_mais_vezes_combina_com_AND(self, tabela) -> None:
+        query = tabela.select('id').where(Tabela.id.gt(1))
+
+        result = query.where(Tabela.name.eq('a'), Tabela.price.le(2)).compile()
+
+        assert result[0] == 'SELECT id FROM TABELA WHERE id > ? AND name = ? AND price <= ?'
+        assert query.compile()[0] == 'SELECT id FROM TABELA WHERE id > ?'
+
+    def test_quando_ordena_por_nome_com_hifen_ordena_decrescente(self, tabela) -> None:
+        result = tabela.select('id').order_by('-price', Tabela.id).order_by('NAME').compile()
+
+        assert result[0] == 'SELECT id FROM TABELA ORDER BY price DESC, id, name'
+
+    def test_quando_limita_os_valores_sao_parametros(self, tabela) -> None:
+        result = tabela.select('id').where(Tabela.id.gt(1)).limit(10, 20).compile()
+
+        assert result == ('SELECT id FROM TABELA WHERE id > ? LIMIT ? OFFSET ?', (1, 10, 20))
+
+    @pytest.mark.parametrize(
+        'paramstyle, expected, params',
+        [
+            ('numeric', 'WHERE id IN (:1, :2) LIMIT :3', (1, 2, 5)),
+            ('format', 'WHERE id IN (%s, %s) LIMIT %s', (1, 2, 5)),
+            ('named', 'WHERE id IN (:p1, :p2) LIMIT :p3', {'p1': 1, 'p2': 2, 'p3': 5}),
+            (
+                'pyformat',
+                'WHERE id IN (%(p1)s, %(p2)s) LIMIT %(p3)s',
+                {'p1': 1, 'p2': 2, 'p3': 5},
+            ),
+        ],
+    )
+    def test_quando_compila_com_paramstyle_usa_seus_placeholders(
+        self, tabela, paramstyle, expected, params
+    ) -> None:
+        query = tabela.select('id').where(Tabela.id.in_([1, 2])).limit(5)
+
+        result = query.compile(paramstyle)
+
+        assert result == (f'SELECT id FROM TABELA {expected}', params)
+
+    @pytest.mark.parametrize('paramstyle', ['qmark', 'named'])
+    def test_quando_executa_no_sqlite_retorna_as_linhas_filtradas(
+        self, tabela, connection, paramstyle
+    ) -> None:
+        query = (
+            tabela.select('id', 'name')
+            .where(Tabela.id.between(5, 20), Tabela.name.ne(None) | Tabela.price.lt(10))
+            .order_by('-id')
+            .limit(3, 1)
+        )
+
+        result = connection.execute(*query.compile(paramstyle)).fetchall()
+
+        assert result == [(19, 'name 19'), (17, 'name 17'), (16, 'name 16')]
+
+    def test_quando_coluna_nao_existe_lanca_ColumnNotFound(self, tabela) -> None:
+        with pytest.raises(ColumnNotFound):
+            tabela.select('id', 'nome')
+
+        with pytest.raises(ColumnNotFound):
+            tabela.select().order_by('-nome')
+
+    def test_quando_condicao_e_de_outra_tabela_lanca_ColumnNotFound(self, tabela) -> None:
+        with pytest.raises(ColumnNotFound):
+            tabela.select().where(OutraTabela.id.eq(1))
+
+        with pytest.raises(ColumnNotFound):
+            tabela.select(OutraTabela.id)
+
+    def test_quando_in_nao_tem_valores_lanca_EmptyInValues(self) -> None:
+        with pytest.raises(EmptyInValues):
+            Tabela.id.in_([])
+
+    @pytest.mark.parametrize('limit', [-1, '1', 1.0, True, None])
+    def test_quando_limit_e_invalido_lanca_InvalidLimitValue(self, tabela, limit) -> None:
+        with pytest.raises(InvalidLimitValue):
+            tabela.select().limit(limit)
+
+    @pytest.mark.parametrize('offset', [-1, '1', False])
+    def test_quando_offset_e_invalido_lanca_InvalidOffsetValue(self, tabela, offset) -> None:
+        with pytest.raises(InvalidOffsetValue):
+            tabela.select().limit(1, offset)
+
+    def test_quando_paramstyle_e_invalido_lanca_InvalidParamstyle(self, tabela) -> None:
+        with pytest.raises(InvalidParamstyle):
+            tabela.select().compile('dollar')
+
+
+class TestQueryCache:
+    def test_quando_estrutura_se_repete_reusa_o_sql_compilado(self, tabela, cache) -> None:
+        queries = [
+            tabela.select('id').where(Tabela.id.in_([i, i + 1]), Tabela.name.eq(f'{i}'))
+            for i in range(5)
+        ]
+
+        results = [query.compile() for query in queries]
+
+        assert all(statement is results[0][0] for statement, _ in results)
+        assert [params for _, params in results] == [(i, i + 1, f'{i}') for i in range(5)]
+        assert cache.info.hits == 4
+        assert cache.info.misses == 1
+
+    @pytest.mark.parametrize(
+        'other',
+        [
+            Tabela(test=True).select('id').where(Tabela.id.in_([1, 2, 3])),
+            Tabela(test=True).select('id').where(Tabela.id.in_([1, 2])).limit(1),
+            Tabela(test=True).select('id').where(Tabela.id.ne(1)),
+            Tabela(test=True).select('id').where(Tabela.id.eq(None)),
+            Tabela(test=True).select('name').where(Tabela.id.in_([1, 2])),
+        ],
+    )
+    def test_quando_estrutura_muda_compila_novamente(self, tabela, cache, other) -> None:
+        tabela.select('id').where(Tabela.id.in_([1, 2])).compile()
+
+        other.compile()
+
+        assert cache.info.misses == 2
+
+    def test_quando_cache_esta_cheio_descarta_a_menos_usada(self, tabela, cache) -> None:
+        cache.resize(2)
+        first, second, third = (
+            tabela.select('id'), tabela.select('id').limit(1), tabela.select('id').limit(1, 1)
+        )
+        first.compile()
+        second.compile()
+        first.compile()
+
+        third.compile()
+        second.compile()
+
+        assert cache.info.currsize == 2
+        assert cache.info.misses == 4
+        assert cache.info.hits == 1
+
+    def test_quando_tamanho_e_zero_nao_guarda_consultas(self, tabela, cache) -> None:
+        cache.resize(0)
+
+        tabela.select().compile()
+        tabela.select().compile()
+
+        assert cache.info.currsize == 0
+        assert cache.info.misses == 2
+
+    def test_quando_limpa_descarta_as_consultas_e_as_estatisticas(self, tabela, cache) -> None:
+        tabela.select().compile()
+
+        cache.clear()
+
+        assert tuple(cache.info) == (0, 0, cache.maxsize, 0)
+
+    @pytest.mark.parametrize('maxsize', [-1, '1', 1.5, True])
+    def test_quando_tamanho_e_invalido_lanca_InvalidQueryCacheSize(self, maxsize) -> None:
+        with pytest.raises(InvalidQueryCacheSize):
+            QueryCache(lambda key: key, maxsize)
+
+        with pytest.raises(InvalidQueryCacheSize):
+            Select.cache.resize(maxsize)
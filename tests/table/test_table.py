@@ -1,3 +1,7 @@
+import bz2
+import gzip
+import io
+
 import pytest
 
 from src.pysqlquery.constraints import (
@@ -8,11 +12,13 @@ from src.pysqlquery.constraints import (
 )
 from src.pysqlquery.table import Column, Table
 from src.pysqlquery.table.exceptions.table import (
+    ColumnNotFound,
     InvalidConstraintList,
     InvalidCreateIfNotExistsValue,
     InvalidName,
     InvalidNamedConstraint,
     InvalidTestValue,
+    InvalidWorkersValue,
     MultiplePrimaryKeyConstraints,
 )
 from src.pysqlquery.types import Char, Float, Integer, String
@@ -558,6 +564,79 @@ class TestTable:
         assert isinstance(entry.col_1.foreign_key, ForeignKeyConstraint)
         assert isinstance(entry.col_2.foreign_key, ForeignKeyConstraint)
 
+    def test_quando_a_tabela_e_renderizada_duas_vezes_retorna_a_mesma_query_em_cache(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            nome = Column(String(50))
+
+        entry = Tabela(test=True)
+        result = str(entry)
+
+        assert str(entry) is result
+
+    def test_quando_uma_named_constraint_altera_uma_coluna_depois_da_renderizacao_a_query_e_renderizada_novamente(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, nullable=True)
+
+        entry = Tabela(test=True)
+        str(entry)
+        entry.id.define_primary_key_from_named_constraint()
+        result = str(entry)
+        expected = 'CREATE TABLE TABELA (\n\tid INTEGER NOT NULL\n);'
+
+        assert result == expected
+
+    def test_quando_instanciamos_2_vezes_uma_tabela_com_named_constraints_retorna_o_mesmo_repr(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer)
+            cpf = Column(Char(11))
+            id_setor = Column(Integer)
+
+            __constraints__ = [
+                PrimaryKeyConstraint('pk_tabela', 'id'),
+                UniqueConstraint('un_tabela_cpf', 'cpf'),
+                ForeignKeyConstraint('fk_tabela_setor', 'id_setor', 't_setor', 'id')
+            ]
+
+        entry_1 = Tabela(test=True)
+        entry_2 = Tabela(test=True)
+
+        assert str(entry_1) == str(entry_2)
+
+    def test_quando_instanciamos_2_vezes_a_mesma_tabela_as_instancias_compartilham_o_render_plan(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+
+        entry_1 = Tabela(test=True)
+        entry_2 = Tabela(create_if_not_exists=True, test=True)
+
+        assert entry_1._get_render_plan() is entry_2._get_render_plan()
+        assert str(entry_1) == 'CREATE TABLE TABELA (\n\tid INTEGER NOT NULL,\n\n\tPRIMARY KEY (id)\n);'
+        assert str(entry_2) == 'CREATE TABLE IF NOT EXISTS TABELA (\n\tid INTEGER NOT NULL,\n\n\tPRIMARY KEY (id)\n);'
+
+    def test_quando_buscamos_a_coluna_nome_pelo_nome_retorna_a_coluna(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            nome = Column(String(50))
+
+        entry = Tabela(test=True)
+
+        assert entry.column('nome') is entry.nome
+        assert entry.column(' NOME ') is entry.nome
+        assert entry['nome'] is entry.nome
+
+    def test_quando_buscamos_uma_coluna_inexistente_lanca_ColumnNotFound(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+
+        entry = Tabela(test=True)
+
+        with pytest.raises(ColumnNotFound):
+            entry.column('inexistente_col')
+
+        with pytest.raises(ColumnNotFound):
+            entry[123]
+
     @pytest.fixture
     def table_1(self) -> Table:
         class Tabela1(Table):
@@ -599,3 +678,64 @@ class TestTable:
         Table.save_all_tables(tempfile)
 
         assert tempfile.read_text() == 'CREATE TABLE T_SETOR (\n\tid INTEGER NOT NULL,\n\tnome VARCHAR(30) NOT NULL,\n\n\tPRIMARY KEY (id)\n);\n\nCREATE TABLE T_FUNCIONARIO (\n\tid INTEGER NOT NULL,\n\tnome VARCHAR(50) NOT NULL,\n\tsalario FLOAT(7, 2) NOT NULL DEFAULT 1212.78,\n\n\tPRIMARY KEY (id)\n);'
+
+    def test_quando_iteramos_as_queries_de_todas_as_tabelas_retorna_a_query_de_cada_tabela(self) -> None:
+        result = list(Table.iter_create_queries())
+        expected = [str(table) for table in Table.all_tables]
+
+        assert result == expected
+
+    def test_quando_salvamos_as_queries_em_arquivo_gz_e_lemos_o_arquivo_retorna_queries(self, tmp_path) -> None:
+        tempfile = tmp_path / 'tables.sql.gz'
+
+        Table.save_all_tables(tempfile)
+
+        with gzip.open(tempfile, 'rt', encoding='UTF-8') as file:
+            assert file.read() == Table.create_query_all_tables
+
+    def test_quando_salvamos_as_queries_em_arquivo_de_texto_aberto_retorna_queries(self) -> None:
+        file = io.StringIO()
+
+        Table.save_all_tables(file)
+
+        assert file.getvalue() == Table.create_query_all_tables
+
+    def test_quando_salvamos_as_queries_em_stream_bz2_binario_retorna_queries(self) -> None:
+        buffer = io.BytesIO()
+
+        with bz2.BZ2File(buffer, 'wb') as file:
+            Table.save_all_tables(file)
+
+        assert bz2.decompress(buffer.getvalue()).decode('UTF-8') == Table.create_query_all_tables
+
+    def test_quando_renderizamos_todas_as_tabelas_com_2_workers_retorna_as_queries_na_mesma_ordem(self, monkeypatch) -> None:
+        monkeypatch.setattr(Table, '_MIN_TABLES_FOR_PARALLEL_RENDER', 0)
+
+        result = Table.render_all(workers=2)
+        expected = Table.create_query_all_tables
+
+        assert result == expected
+
+    def test_quando_iteramos_as_queries_com_2_workers_e_chunk_size_1_retorna_a_query_de_cada_tabela(self, monkeypatch) -> None:
+        monkeypatch.setattr(Table, '_MIN_TABLES_FOR_PARALLEL_RENDER', 0)
+
+        result = list(Table.iter_create_queries(workers=2, chunk_size=1))
+        expected = [str(table) for table in Table.all_tables]
+
+        assert result == expected
+
+    def test_quando_salvamos_as_queries_com_2_workers_e_lemos_o_arquivo_retorna_queries(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setattr(Table, '_MIN_TABLES_FOR_PARALLEL_RENDER', 0)
+        tempfile = tmp_path / 'tables.sql'
+
+        Table.save_all_tables(tempfile, workers=2)
+
+        assert tempfile.read_text() == Table.create_query_all_tables
+
+    def test_quando_workers_recebe_0_lanca_InvalidWorkersValue(self) -> None:
+        with pytest.raises(InvalidWorkersValue):
+            Table.render_all(workers=0)
+
+    def test_quando_workers_recebe_aaa_lanca_InvalidWorkersValue(self) -> None:
+        with pytest.raises(InvalidWorkersValue):
+            Table.render_all(workers='aaa')
@@ -0,0 +1,159 @@
+import sqlite3
+
+import pytest
+
+from src.pysqlquery.constraints import UniqueConstraint
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.exceptions.table import (
+    InvalidMaxRowsValue,
+    InvalidRows,
+    InvalidUpsertDialect,
+    InvalidUpsertTable,
+    RowTooLarge,
+)
+from src.pysqlquery.types import Decimal, Integer, String
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer, primary_key=True)
+        name = Column(String(20), nullable=True)
+        price = Column(Decimal(6, 2), nullable=True)
+
+    return Tabela(test=True)
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(':memory:')
+    connection.execute('CREATE TABLE TABELA (id PRIMARY KEY, name, price)')
+
+    yield connection
+
+    connection.close()
+
+
+class TestUpsertMany:
+    @pytest.mark.parametrize(
+        'dialect, clause',
+        [
+            (
+                'postgresql',
+                'ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, price = EXCLUDED.price',
+            ),
+            (
+                'sqlite',
+                'ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name, price = EXCLUDED.price',
+            ),
+            ('mysql', 'ON DUPLICATE KEY UPDATE name = VALUES(name), price = VALUES(price)'),
+        ],
+    )
+    def test_quando_gera_upserts_retorna_insert_com_clausula_do_dialeto(
+        self, tabela, dialect, clause
+    ) -> None:
+        result = list(tabela.upsert_many([(1, "O'Neil", 2.5), (2, None, None)], dialect=dialect))
+
+        assert result == [
+            "INSERT INTO TABELA (id, name, price) VALUES\n"
+            f"\t(1, 'O''Neil', 2.5),\n\t(2, NULL, NULL)\n{clause};"
+        ]
+
+    def test_quando_executa_no_sqlite_insere_e_atualiza_as_linhas(
+        self, tabela, connection
+    ) -> None:
+        for statement in tabela.upsert_many([(1, 'a', 1), (2, 'b', 2)], dialect='sqlite'):
+            connection.execute(statement)
+
+        for statement in tabela.upsert_many(
+            [(2, 'updated', None), (3, 'c', 3)], dialect='sqlite', max_rows=1
+        ):
+            connection.execute(statement)
+
+        assert connection.execute('SELECT * FROM TABELA ORDER BY id').fetchall() == [
+            (1, 'a', 1),
+            (2, 'updated', None),
+            (3, 'c', 3),
+        ]
+
+    def test_quando_tabela_nao_tem_chave_primaria_usa_a_coluna_unica(self) -> None:
+        class Tabela(Table):
+            code = Column(String(5))
+            name = Column(String(20))
+            __constraints__ = [UniqueConstraint('un_tabela_code', 'code')]
+
+        result = next(Tabela(test=True).upsert_many([('a', 'b')]))
+
+        assert result.endswith('ON CONFLICT (code) DO UPDATE SET name = EXCLUDED.name;')
+
+    def test_quando_chave_primaria_e_composta_usa_todas_as_colunas(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+            version = Column(Integer, primary_key=True)
+            name = Column(String(20), unique=True)
+
+        result = next(Tabela(test=True).upsert_many([(1, 2, 'a')]))
+
+        assert result.endswith('ON CONFLICT (id, version) DO UPDATE SET name = EXCLUDED.name;')
+
+    @pytest.mark.parametrize(
+        'dialect, clause',
+        [
+            ('sqlite', 'ON CONFLICT (id) DO NOTHING;'),
+            ('mysql', 'ON DUPLICATE KEY UPDATE id = id;'),
+        ],
+    )
+    def test_quando_todas_as_colunas_sao_chave_nao_atualiza_nada(self, dialect, clause) -> None:
+        class Tabela(Table):
+            id = Column(Integer, primary_key=True)
+
+        result = next(Tabela(test=True).upsert_many([(1,)], dialect=dialect))
+
+        assert result.endswith(clause)
+
+    def test_quando_gera_upserts_duas_vezes_reusa_a_clausula(self, tabela) -> None:
+        first = next(tabela.upsert_many([(1, 'a', None)]))
+        clause = type(tabela)._statement_templates['upsert', 'postgresql']
+
+        assert first.endswith(f'{clause};')
+        assert type(tabela)(test=True)._get_statement_template('upsert', 'postgresql') is clause
+
+    def test_quando_max_bytes_e_definido_os_statements_nao_o_ultrapassam(self, tabela) -> None:
+        rows = [(i, 'ção' * 4, i * 1.25) for i in range(100)]
+
+        result = list(tabela.upsert_many(rows, max_rows=None, max_bytes=300))
+
+        assert len(result) > 1
+        assert all(len(statement.encode()) <= 300 for statement in result)
+        assert sum(statement.count('ção') for statement in result) == 400
+
+    def test_quando_linha_nao_cabe_com_a_clausula_lanca_RowTooLarge(self, tabela) -> None:
+        with pytest.raises(RowTooLarge):
+            list(tabela.upsert_many([(1, 'a', None)], max_bytes=100))
+
+    @pytest.mark.parametrize('dialect', ['ansi', 'oracle', 'POSTGRESQL', None])
+    def test_quando_dialeto_nao_tem_upsert_lanca_InvalidUpsertDialect(
+        self, tabela, dialect
+    ) -> None:
+        with pytest.raises(InvalidUpsertDialect):
+            list(tabela.upsert_many([], dialect=dialect))
+
+    def test_quando_tabela_nao_tem_alvo_de_conflito_lanca_InvalidUpsertTable(self) -> None:
+        class Tabela(Table):
+            id = Column(Integer, unique=True)
+            code = Column(String(5), unique=True)
+
+        with pytest.raises(InvalidUpsertTable):
+            list(Tabela(test=True).upsert_many([]))
+
+    def test_quando_linha_e_invalida_lanca_InvalidRows(self, tabela) -> None:
+        with pytest.raises(InvalidRows, match="Row 1: the id column can't be NULL"):
+            list(tabela.upsert_many([(1, 'a', None), (None, 'b', None)]))
+
+    def test_quando_validate_e_False_e_linha_e_curta_lanca_InvalidRows(self, tabela) -> None:
+        with pytest.raises(InvalidRows, match='Row 0: 2 values were passed'):
+            list(tabela.upsert_many([(1, 'a')], validate=False))
+
+    def test_quando_max_rows_e_invalido_lanca_InvalidMaxRowsValue(self, tabela) -> None:
+        with pytest.raises(InvalidMaxRowsValue):
+            list(tabela.upsert_many([], max_rows=0))
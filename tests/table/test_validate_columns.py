@@ -0,0 +1,183 @@
+import random
+
+import pytest
+
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.base import ErrorBitmap, ErrorReport, error_bitmap
+from src.pysqlquery.table.exceptions.table import ColumnLengthMismatch, ColumnNotFound
+from src.pysqlquery.types import Boolean, Char, Date, Decimal, Integer, String
+
+VALUES = [None, 0, 1, -5, 1000, True, 1.5, 12.345, '', 'ab', 'abcdef', '2005-02-27', 'x']
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer(3), primary_key=True)
+        name = Column(String(4), nullable=True)
+        code = Column(Char(2))
+        price = Column(Decimal(4, 2), nullable=True)
+        day = Column(Date, nullable=True)
+        active = Column(Boolean)
+
+    return Tabela(test=True)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def bitmap_backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(error_bitmap, 'import_numpy', lambda: None)
+
+    return request.param
+
+
+def generate_rows(qty_columns: int, qty: int) -> list[list]:
+    rng = random.Random(15)
+
+    return [[rng.choice(VALUES) for _ in range(qty_columns)] for _ in range(qty)]
+
+
+class TestValidateColumns:
+    def test_quando_valida_listas_retorna_os_mesmos_erros_do_validador_de_linhas(
+        self, tabela, bitmap_backend
+    ) -> None:
+        rows = generate_rows(len(tabela.columns), 500)
+        data = {
+            column.name: [row[i] for row in rows] for i, column in enumerate(tabela.columns)
+        }
+
+        result = tabela.validate_columns(data)
+        validate_row = tabela.compile_validator()
+        expected = [validate_row(row) for row in rows]
+
+        assert [result.row_errors(i) for i in range(len(rows))] == expected
+        assert result.invalid_rows() == [i for i, errors in enumerate(expected) if errors]
+        assert result.qty_invalid_rows == sum(1 for errors in expected if errors)
+        assert result.error_counts == {
+            column.name: sum(1 for errors in expected if errors >> i & 1)
+            for i, column in enumerate(tabela.columns)
+        }
+
+    def test_quando_valida_arrays_numpy_retorna_os_mesmos_erros_das_listas(self, tabela) -> None:
+        np = pytest.importorskip('numpy')
+        rng = np.random.default_rng(15)
+        arrays = {
+            'id': rng.integers(-1500, 1500, 500),
+            'name': np.array(generate_rows(1, 500), dtype=object).reshape(-1),
+            'code': rng.choice(np.array(['', 'ab', 'abc']), 500),
+            'price': np.array(
+                [round(value, int(rng.integers(0, 4))) for value in rng.uniform(-150, 150, 500)]
+            ),
+            'active': rng.integers(0, 2, 500).astype(bool),
+        }
+
+        expected = tabela.validate_columns(
+            {name: array.tolist() for name, array in arrays.items()}
+        )
+        result = tabela.validate_columns(arrays)
+
+        assert result.bitmap == expected.bitmap
+        assert result.error_counts == expected.error_counts
+        assert result.qty_invalid_rows > 0
+
+    def test_quando_valida_com_report_retorna_o_mesmo_relatorio_das_linhas(
+        self, tabela, bitmap_backend
+    ) -> None:
+        rows = generate_rows(len(tabela.columns), 500)
+        data = {
+            column.name: [row[i] for row in rows] for i, column in enumerate(tabela.columns)
+        }
+
+        result = tabela.validate_columns(data, report=True)
+        expected = tabela.validate_rows(rows, report=True)
+
+        assert isinstance(result, ErrorReport)
+        assert list(result) == list(expected)
+        assert list(result.messages()) == list(expected.messages())
+
+    def test_quando_valida_arrays_numpy_com_report_retorna_valores_python(self, tabela) -> None:
+        np = pytest.importorskip('numpy')
+
+        result = tabela.validate_columns(
+            {'id': np.array([1, 1000, 2]), 'code': np.array(['ab', 'abc', ''])}, report=True
+        )
+
+        assert [(error.row, error.column, error.value) for error in result] == [
+            (1, 'id', 1000),
+            (1, 'code', 'abc'),
+        ]
+        assert type(result[0].value) is int
+
+    def test_quando_coluna_nao_e_passada_nao_e_validada(self, tabela) -> None:
+        result = tabela.validate_columns({'name': ['abcdef', None]})
+
+        assert result.qty_rows == 2
+        assert result.invalid_rows() == [0]
+        assert result.invalid_columns(0) == ['name']
+        assert result.error_counts['id'] == 0
+
+    def test_quando_coluna_not_null_recebe_None_retorna_erro(self, tabela) -> None:
+        result = tabela.validate_columns({'id': [1, None], 'name': [None, None]})
+
+        assert result.row_errors(0) == 0
+        assert result.row_errors(1) == 0b1
+
+    def test_quando_coluna_nao_existe_lanca_ColumnNotFound(self, tabela) -> None:
+        with pytest.raises(ColumnNotFound):
+            tabela.validate_columns({'inexistente': [1]})
+
+    def test_quando_colunas_tem_tamanhos_diferentes_lanca_ColumnLengthMismatch(
+        self, tabela
+    ) -> None:
+        with pytest.raises(ColumnLengthMismatch):
+            tabela.validate_columns({'id': [1, 2], 'name': ['a']})
+
+    def test_quando_tabela_tem_mais_de_8_colunas_usa_mais_de_um_byte_por_linha(
+        self, bitmap_backend
+    ) -> None:
+        clsdict = {f'col_{i}': Column(Integer) for i in range(10)}
+        tabela = type('TabelaLarga', (Table,), clsdict)(test=True)
+
+        result = tabela.validate_columns({'col_9': [1, 'a'], 'col_0': ['a', 1]})
+
+        assert result.row_size == 2
+        assert result.row_errors(0) == 0b1
+        assert result.row_errors(1) == 1 << 9
+        assert result.invalid_columns(1) == ['col_9']
+
+    def test_quando_acessa_linha_inexistente_lanca_IndexError(self) -> None:
+        result = ErrorBitmap.from_masks(['a'], 1, [[True]])
+
+        with pytest.raises(IndexError):
+            result.row_errors(1)
+
+    def test_quando_nao_ha_dados_retorna_bitmap_vazio(self, tabela) -> None:
+        result = tabela.validate_columns({})
+
+        assert result.qty_rows == 0
+        assert result.invalid_rows() == []
+
+
+class TestColumnValidateValues:
+    def test_quando_coluna_nullable_recebe_None_retorna_True(self) -> None:
+        assert Column(String(3), nullable=True).validate_values(['abc', None, 'abcd']) == [
+            True,
+            True,
+            False,
+        ]
+
+    def test_quando_coluna_not_null_recebe_None_em_array_retorna_False(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        result = Column(String(3)).validate_values(np.array(['abc', None], dtype=object))
+
+        assert result.tolist() == [True, False]
+
+    def test_quando_recebe_gerador_retorna_lista(self) -> None:
+        assert Column(Integer).validate_values(value for value in [1, None, 'a']) == [
+            True,
+            False,
+            False,
+        ]
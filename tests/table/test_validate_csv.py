@@ -0,0 +1,108 @@
+import gzip
+import io
+
+import pytest
+
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.base import CsvError
+from src.pysqlquery.table.exceptions.table import ColumnNotFound
+from src.pysqlquery.types import Bit, Boolean, Date, Decimal, Float, Integer, String
+
+CSV_TEXT = (
+    'id,name,price,birth,active\r\n'
+    '1,Ann,10.50,1990-05-17,t\r\n'
+    '2,Annabelle,10.555,,false\r\n'
+    ',Bob,abc,2001-02-29,yes\r\n'
+    '4,"Bo\nbby",-99.99,2001-02-28,1\r\n'
+    '5,Carl\r\n'
+    '\r\n'
+    '6,,1E+2,2001-02-28,0\r\n'
+)
+
+EXPECTED = [
+    CsvError(3, 'name', 'Annabelle'),
+    CsvError(3, 'price', '10.555'),
+    CsvError(4, 'id', ''),
+    CsvError(4, 'price', 'abc'),
+    CsvError(4, 'birth', '2001-02-29'),
+    CsvError(4, 'active', 'yes'),
+    CsvError(6, 'name', 'Bo\nbby'),
+    CsvError(7, None, None),
+]
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer, primary_key=True)
+        name = Column(String(5), nullable=True)
+        price = Column(Decimal(4, 2))
+        birth = Column(Date, nullable=True)
+        active = Column(Boolean)
+        flag = Column(Bit)
+
+    return Tabela(test=True)
+
+
+class TestValidateCsv:
+    def test_quando_valida_arquivo_retorna_os_campos_invalidos_com_a_linha(
+        self, tabela, tmp_path
+    ) -> None:
+        tempfile = tmp_path / 'data.csv'
+        tempfile.write_text(CSV_TEXT, newline='')
+
+        assert list(tabela.validate_csv(tempfile)) == EXPECTED
+
+    def test_quando_valida_arquivo_gz_retorna_os_campos_invalidos(self, tabela, tmp_path) -> None:
+        tempfile = tmp_path / 'data.csv.gz'
+
+        with gzip.open(tempfile, 'wt', encoding='UTF-8', newline='') as file:
+            file.write(CSV_TEXT)
+
+        assert list(tabela.validate_csv(str(tempfile), buffer_size=16)) == EXPECTED
+
+    def test_quando_valida_arquivo_binario_aberto_nao_fecha_o_arquivo(self, tabela) -> None:
+        entry = io.BytesIO(CSV_TEXT.encode('UTF-8'))
+
+        assert list(tabela.validate_csv(entry)) == EXPECTED
+        assert not entry.closed
+
+    def test_quando_valida_tsv_com_null_customizado_retorna_os_campos_invalidos(
+        self, tabela
+    ) -> None:
+        entry = io.StringIO('ID\tName\tFlag\n1\t\\N\t1\n\\N\tAnn\t2\n3\t\t0\n', newline='')
+
+        result = list(tabela.validate_csv(entry, delimiter='\t', null='\\N'))
+
+        assert result == [CsvError(3, 'id', '\\N'), CsvError(3, 'flag', '2')]
+
+    def test_quando_valida_floats_usa_o_texto_exato(self) -> None:
+        class Tabela(Table):
+            price = Column(Float(3, 2))
+
+        entry = io.StringIO('price\n1.10\n1.111\n0.30000000000000004\n')
+
+        assert [error.line for error in Tabela(test=True).validate_csv(entry)] == [3, 4]
+
+    def test_quando_arquivo_esta_vazio_nao_retorna_erros(self, tabela) -> None:
+        assert list(tabela.validate_csv(io.StringIO(''))) == []
+
+    def test_quando_cabecalho_tem_coluna_inexistente_lanca_ColumnNotFound(self, tabela) -> None:
+        with pytest.raises(ColumnNotFound):
+            list(tabela.validate_csv(io.StringIO('id,inexistente\n1,2\n')))
+
+
+class TestParseText:
+    def test_quando_converte_texto_retorna_o_valor_do_tipo(self) -> None:
+        assert Integer().parse_text('42') == 42
+        assert Boolean().parse_text(' TRUE ') is True
+        assert Bit().parse_text('0') is False
+        assert Decimal(4, 2).parse_text('10.50') == Decimal(4, 2).parse_text('10.5')
+        assert Date().parse_text('2024-01-31') == '2024-01-31'
+
+    @pytest.mark.parametrize(
+        'sql_type, text', [(Integer(), '1.5'), (Boolean(), 'yes'), (Decimal(), 'abc')]
+    )
+    def test_quando_texto_e_invalido_lanca_ValueError(self, sql_type, text) -> None:
+        with pytest.raises(ValueError):
+            sql_type.parse_text(text)
@@ -0,0 +1,242 @@
+import csv
+import io
+import re
+
+import pytest
+
+from src.pysqlquery.table import Column, Table
+from src.pysqlquery.table.base import COPY_FORMATS
+from src.pysqlquery.table.exceptions.table import (
+    InvalidCopyFormat,
+    InvalidRows,
+    UnnamedCopyFile,
+)
+from src.pysqlquery.types import Bit, Boolean, Decimal, Integer, String
+
+ROWS = [
+    (1, 'Ann', 10.5, True),
+    (2, None, None, False),
+    (3, 'tab\there', 0, None),
+    (4, 'line\nbreak\r', -1.25, True),
+    (5, 'back\\slash', None, None),
+    (6, '', 2, False),
+    (7, 'a,"quoted"', 3, True),
+    (8, '\\.', 4, True),
+    (9, '\\N', 5, False),
+]
+
+BACKSLASH_ESCAPES = {'\\\\': '\\', '\\t': '\t', '\\n': '\n', '\\r': '\r', '\\0': '\0'}
+
+
+class NamedBytesIO(io.BytesIO):
+    # Has the pseudo name of the standard output, like `sys.stdout`.
+    name = '<stdout>'
+
+
+@pytest.fixture
+def tabela():
+    class Tabela(Table):
+        id = Column(Integer, primary_key=True)
+        name = Column(String(20), nullable=True)
+        price = Column(Decimal(6, 2), nullable=True)
+        active = Column(Boolean, nullable=True)
+
+    return Tabela(test=True)
+
+
+def read_text_format(text: str) -> list[tuple]:
+    # Reads the fields like PostgreSQL's COPY and MySQL's LOAD DATA, as texts.
+    rows = []
+
+    for line in text.split('\n')[:-1]:
+        fields = [
+            None
+            if field == '\\N'
+            else re.sub(r'\\.', lambda match: BACKSLASH_ESCAPES[match.group()], field)
+            for field in line.split('\t')
+        ]
+        rows.append(tuple(fields))
+
+    return rows
+
+
+def as_text(rows: list[tuple], true: str, false: str) -> list[tuple]:
+    return [
+        tuple(
+            None
+            if value is None
+            else (true if value else false) if isinstance(value, bool) else str(value)
+            for value in row
+        )
+        for row in rows
+    ]
+
+
+class TestWriteCopy:
+    @pytest.mark.parametrize(
+        'format, true, false', [('pg_text', 't', 'f'), ('mysql_infile', '1', '0')]
+    )
+    def test_quando_escreve_formato_texto_os_campos_sao_lidos_como_os_valores(
+        self, tabela, tmp_path, format, true, false
+    ) -> None:
+        path = tmp_path / 'tabela.txt'
+
+        tabela.write_copy(iter(ROWS), path, format=format)
+
+        assert read_text_format(path.read_text()) == as_text(ROWS, true, false)
+
+    def test_quando_escreve_pg_csv_os_campos_sao_lidos_como_os_valores(
+        self, tabela, tmp_path
+    ) -> None:
+        path = tmp_path / 'tabela.csv'
+
+        tabela.write_copy(ROWS, path, format='pg_csv')
+
+        with open(path, newline='') as file:
+            fields = list(csv.reader(file))
+
+        assert fields == [
+            ['' if value is None else value for value in row]
+            for row in as_text(ROWS, 't', 'f')
+        ]
+
+    def test_quando_escreve_pg_csv_diferencia_NULL_de_texto_vazio(self, tabela) -> None:
+        file = io.StringIO()
+
+        tabela.write_copy([(1, '', None, None), (2, None, None, None)], file, format='pg_csv')
+
+        assert file.getvalue() == '1,"",,\n2,,,\n'
+
+    def test_quando_escreve_pg_csv_coloca_aspas_no_marcador_de_fim_dos_dados(self, tabela) -> None:
+        file = io.StringIO()
+
+        tabela.write_copy([(1, '\\.', None, None)], file, format='pg_csv')
+
+        assert file.getvalue() == '1,"\\.",,\n'
+
+    @pytest.mark.parametrize(
+        'format, expected',
+        [
+            (
+                'pg_text',
+                "COPY TABELA (id, name, price, active) FROM '{path}' "
+                "WITH (FORMAT text, ENCODING 'UTF-8')",
+            ),
+            (
+                'pg_csv',
+                "COPY TABELA (id, name, price, active) FROM '{path}' "
+                "WITH (FORMAT csv, ENCODING 'UTF-8')",
+            ),
+            (
+                'mysql_infile',
+                "LOAD DATA LOCAL INFILE '{path}' INTO TABLE TABELA CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n' "
+                '(id, name, price, active)',
+            ),
+        ],
+    )
+    def test_quando_escreve_arquivo_retorna_o_statement_que_o_carrega(
+        self, tabela, tmp_path, format, expected
+    ) -> None:
+        path = tmp_path / 'tabela.txt'
+
+        result = tabela.write_copy(ROWS, path, format=format)
+
+        assert result == expected.format(path=path)
+
+    def test_quando_arquivo_nao_tem_nome_o_statement_do_postgresql_usa_STDIN(
+        self, tabela
+    ) -> None:
+        result = tabela.write_copy(ROWS, io.StringIO())
+
+        assert result.startswith('COPY TABELA (id, name, price, active) FROM STDIN')
+
+    def test_quando_arquivo_nao_tem_nome_e_formato_e_mysql_lanca_UnnamedCopyFile(
+        self, tabela
+    ) -> None:
+        with pytest.raises(UnnamedCopyFile):
+            tabela.write_copy(ROWS, io.StringIO(), format='mysql_infile')
+
+    def test_quando_arquivo_aberto_tem_caminho_o_statement_usa_o_caminho(
+        self, tabela, tmp_path
+    ) -> None:
+        path = tmp_path / 'tabela.txt'
+
+        with open(path, 'w', newline='') as file:
+            result = tabela.write_copy(ROWS, file, format='mysql_infile')
+
+        assert result.startswith(f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE TABELA")
+
+    def test_quando_arquivo_e_pseudo_arquivo_o_statement_do_postgresql_usa_STDIN(
+        self, tabela
+    ) -> None:
+        stdout = io.TextIOWrapper(NamedBytesIO(), newline='')
+
+        result = tabela.write_copy(ROWS, stdout)
+
+        assert result.startswith('COPY TABELA (id, name, price, active) FROM STDIN')
+
+        with pytest.raises(UnnamedCopyFile):
+            tabela.write_copy(ROWS, stdout, format='mysql_infile')
+
+    def test_quando_escreve_arquivo_binario_nao_o_fecha(self, tabela) -> None:
+        file = io.BytesIO()
+
+        tabela.write_copy([(1, 'ção', None, None)], file, encoding='latin-1')
+
+        assert not file.closed
+        assert file.getvalue() == '1\tção\t\\N\t\\N\n'.encode('latin-1')
+
+    @pytest.mark.parametrize(
+        'format, expected',
+        [
+            ('pg_text', '1\t1\tt\n0\t0\tf\n1\t1\t\\N\n'),
+            ('pg_csv', '1,1,t\n0,0,f\n1,1,\n'),
+            ('mysql_infile', '1\t1\t1\n0\t0\t0\n1\t1\t\\N\n'),
+        ],
+    )
+    def test_quando_escreve_bools_usa_TRUE_e_FALSE_so_nas_colunas_Boolean(
+        self, tmp_path, format, expected
+    ) -> None:
+        class Tabela(Table):
+            flag = Column(Bit)
+            qty = Column(Integer)
+            active = Column(Boolean, nullable=True)
+
+        path = tmp_path / 'tabela.txt'
+
+        Tabela(test=True).write_copy(
+            [(True, True, True), (False, 0, False), (1, 1, None)], path, format=format
+        )
+
+        assert path.read_text() == expected
+
+    @pytest.mark.parametrize('row', [(2, 'b', None), (2, 'b', None, None, 3)])
+    def test_quando_validate_e_False_e_linha_tem_quantidade_errada_lanca_InvalidRows(
+        self, tabela, row
+    ) -> None:
+        file = io.StringIO()
+
+        with pytest.raises(InvalidRows, match=f'Row 1: {len(row)} values were passed'):
+            tabela.write_copy([(1, 'a', None, None), row], file, validate=False)
+
+        assert file.getvalue() == '1\ta\t\\N\t\\N\n'
+
+    def test_quando_linha_e_invalida_lanca_InvalidRows(self, tabela) -> None:
+        with pytest.raises(InvalidRows):
+            tabela.write_copy([(1, 'a', None, None), ('2', 'b', None, None)], io.StringIO())
+
+    @pytest.mark.parametrize('format', ['', 'PG_TEXT', 'copy', None])
+    def test_quando_formato_e_invalido_lanca_InvalidCopyFormat(self, tabela, format) -> None:
+        with pytest.raises(InvalidCopyFormat):
+            tabela.write_copy([], io.StringIO(), format=format)
+
+    def test_quando_caminho_tem_barra_invertida_o_statement_do_mysql_a_escapa(self) -> None:
+        result = COPY_FORMATS['mysql_infile'].render_statement(
+            'TABELA', ['id'], 'C:\\data\\tabela.txt', 'latin-1'
+        )
+
+        assert result.startswith(
+            "LOAD DATA LOCAL INFILE 'C:\\\\data\\\\tabela.txt' INTO TABLE TABELA "
+            'CHARACTER SET latin1'
+        )
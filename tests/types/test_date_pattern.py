@@ -0,0 +1,134 @@
+import random
+import re
+from datetime import datetime
+
+import pytest
+
+from src.pysqlquery.types import Date, DateTime, Time
+from src.pysqlquery.types.base.date_pattern import DatePattern, compile_date_pattern
+
+PATTERNS = [
+    '%Y-%m-%d',
+    '%Y-%m-%d %H:%M:%S',
+    '%H:%M:%S',
+    '%d/%m/%Y',
+    '%Y%m%d',
+    '%Y-%m-%dT%H:%M:%S',
+    '%m-%d',
+    '%Y %H',
+]
+
+FIELD_VALUES = [
+    '0', '00', '1', '01', '9', '09', '10', '12', '13', '23', '24', '28', '29', '30', '31',
+    '32', '59', '60', '61', '99', ' 5', '٢', '0000', '0001', '1900', '2000', '2004',
+    '2005', '2100', '9999', 'ab', '',
+]
+
+
+def strptime_matches(value: str, pattern: str) -> bool:
+    try:
+        datetime.strptime(value, pattern)
+    except (TypeError, ValueError):
+        return False
+
+    return True
+
+
+def generate_values(pattern: str, qty: int) -> list[str]:
+    rng = random.Random(pattern)
+    parts = re.split(r'(%.)', pattern)
+    values = []
+
+    for _ in range(qty):
+        if rng.random() < 0.5:
+            date = datetime(
+                rng.randint(1000, 9999),
+                rng.randint(1, 12),
+                rng.randint(1, 28),
+                rng.randint(0, 23),
+                rng.randint(0, 59),
+                rng.randint(0, 59),
+            )
+            value = date.strftime(pattern)
+
+            if value and rng.random() < 0.4:
+                position = rng.randrange(len(value))
+                value = value[:position] + rng.choice('0123456789 -:/Tt') + value[position + 1 :]
+
+            values.append(value)
+            continue
+
+        value = ''
+
+        for i, part in enumerate(parts):
+            if i % 2:
+                value += rng.choice(FIELD_VALUES)
+            elif part == ' ':
+                value += rng.choice([' ', ' ', '  ', '\t', ''])
+            elif part == 'T':
+                value += rng.choice(['T', 't', ' '])
+            else:
+                value += part if rng.random() < 0.95 else rng.choice(['.', '', part * 2])
+
+        if rng.random() < 0.05:
+            value += rng.choice(['0', ' ', 'x'])
+
+        values.append(value)
+
+    return values
+
+
+class TestDatePattern:
+    @pytest.mark.parametrize('pattern', PATTERNS)
+    def test_quando_valida_valores_retorna_mesmo_resultado_de_strptime(self, pattern) -> None:
+        date_pattern = DatePattern(pattern)
+
+        for entry in generate_values(pattern, 3000):
+            assert date_pattern.matches(entry) == strptime_matches(entry, pattern), entry
+
+    @pytest.mark.parametrize('pattern', PATTERNS)
+    def test_quando_valida_array_retorna_mesmo_resultado_de_strptime(self, pattern) -> None:
+        np = pytest.importorskip('numpy')
+        date_pattern = DatePattern(pattern)
+        values = generate_values(pattern, 3000)
+        values += [datetime(2004, 2, 29, 23, 59, 59).strftime(pattern)] * 10
+        entry = np.array(values)
+
+        expected = [strptime_matches(value, pattern) for value in values]
+        result = date_pattern.matches_array(entry)
+
+        assert result.tolist() == expected
+
+    def test_quando_valida_29_de_fevereiro_de_ano_nao_bissexto_retorna_False(self) -> None:
+        assert DatePattern('%Y-%m-%d').matches('2005-02-29') is False
+        assert DatePattern('%Y-%m-%d').matches('2004-02-29') is True
+
+    def test_quando_valida_valor_nao_str_retorna_False(self) -> None:
+        assert DatePattern('%Y-%m-%d').matches(20050227) is False
+
+    @pytest.mark.parametrize('pattern', ['%d %B %Y', '%Y-%m-%d %%', '%Y %Y', '%Y-%m-%d %'])
+    def test_quando_compila_padrao_nao_suportado_retorna_None(self, pattern) -> None:
+        assert compile_date_pattern(pattern) is None
+
+    def test_quando_novo_tipo_usa_padrao_nao_suportado_valida_com_strptime(self) -> None:
+        class MonthName(Date):
+            def __init__(self) -> None:
+                super(Date, self).__init__('MONTHNAME', '%d %B %Y')
+
+        entry = MonthName()
+
+        assert entry.validate_value('27 February 2005') is True
+        assert entry.validate_value('2005-02-27') is False
+
+    def test_quando_tipos_de_data_validam_arrays_retorna_mascara(self) -> None:
+        np = pytest.importorskip('numpy')
+
+        assert Date().validate_values(np.array(['2005-02-27', '2005-02-30'])).tolist() == [
+            True,
+            False,
+        ]
+        assert DateTime().validate_values(np.array(['2005-02-27 12:52:10'])).tolist() == [True]
+        assert Time().validate_values(np.array(['12:45:31', 65], dtype=object)).tolist() == [
+            True,
+            False,
+        ]
@@ -0,0 +1,122 @@
+import decimal
+import math
+import random
+
+import pytest
+
+from src.pysqlquery.types import Decimal, Double, Float, Real
+
+TYPES_WITH_PRECISION = [
+    (precision, scale)
+    for precision in (1, 2, 3, 4, 6, 10, 15, 17, 20, 25)
+    for scale in (None, 1, 2, precision - 1)
+    if scale is None or 0 < scale < precision
+]
+
+
+def reference_is_valid(value: float, precision: int, scale: int | None) -> bool:
+    # Counts the digits on the shortest representation of the float, in fixed notation.
+    if not math.isfinite(value):
+        return False
+
+    shortest = decimal.Decimal(repr(abs(value)))
+
+    if not shortest:
+        return True
+
+    qty_integer_digits = max(shortest.adjusted() + 1, 0)
+    qty_decimal_digits = max(-shortest.normalize().as_tuple().exponent, 0)
+
+    return qty_integer_digits + qty_decimal_digits <= precision and (
+        not scale or qty_decimal_digits <= scale
+    )
+
+
+def generate_floats(qty: int) -> list[float]:
+    rng = random.Random(13)
+    values = [
+        0.0, -0.0, 1e-07, -1e-07, 0.1, 0.5, 1.005, 5e-324, 1.7e308, 1e16, 1e22, 1e23,
+        9.999999999999999e22, 123456789012345.67, 0.30000000000000004, math.nan, math.inf,
+        -math.inf,
+    ]
+
+    for _ in range(qty):
+        exponent = rng.randint(-8, 25)
+        value = rng.uniform(-(10.0**exponent), 10.0**exponent)
+        values.append(round(value, rng.randint(0, 12)) if rng.random() < 0.8 else value)
+
+    return values
+
+
+class TestDecimalPrecision:
+    def test_quando_valida_numero_negativo_nao_conta_sinal(self) -> None:
+        assert Decimal(2).validate_value(-99) is True
+        assert Decimal(3, 1).validate_value(-10.5) is True
+        assert Decimal(2).validate_value(-100) is False
+
+    def test_quando_valida_notacao_cientifica_conta_casas_decimais(self) -> None:
+        assert Decimal(8, 7).validate_value(1e-07) is True
+        assert Decimal(7, 6).validate_value(1e-07) is False
+        assert Decimal(17).validate_value(1e16) is True
+        assert Decimal(16).validate_value(1e16) is False
+
+    def test_quando_valida_zero_a_esquerda_nao_conta_digito(self) -> None:
+        assert Double(2, 1).validate_value(0.25) is False
+        assert Double(3, 2).validate_value(0.25) is True
+        assert Double(1).validate_value(0.5) is True
+
+    def test_quando_valida_nan_e_inf_com_precisao_retorna_False(self) -> None:
+        assert Float(10).validate_value(math.nan) is False
+        assert Float(10).validate_value(math.inf) is False
+        assert Float().validate_value(math.inf) is True
+
+    def test_quando_valida_decimal_Decimal_retorna_valor_exato(self) -> None:
+        real_type = Real(4, 2)
+
+        assert real_type.validate_value(decimal.Decimal('12.34')) is True
+        assert real_type.validate_value(decimal.Decimal('-12.34')) is True
+        assert real_type.validate_value(decimal.Decimal('12.340000')) is True
+        assert real_type.validate_value(decimal.Decimal('1.234')) is False
+        assert real_type.validate_value(decimal.Decimal('123.45')) is False
+        assert real_type.validate_value(decimal.Decimal('0.000')) is True
+        assert real_type.validate_value(decimal.Decimal('1E+3')) is True
+        assert real_type.validate_value(decimal.Decimal('1E+4')) is False
+        assert real_type.validate_value(decimal.Decimal('NaN')) is False
+        assert Real().validate_value(decimal.Decimal('NaN')) is True
+
+    @pytest.mark.parametrize('precision, scale', TYPES_WITH_PRECISION)
+    def test_quando_valida_floats_retorna_resultado_da_representacao_mais_curta(
+        self, precision, scale
+    ) -> None:
+        decimal_type = Decimal(precision, scale)
+
+        for entry in generate_floats(2000):
+            expected = reference_is_valid(entry, precision, scale)
+
+            assert decimal_type.validate_value(entry) == expected, entry
+
+    @pytest.mark.parametrize('precision, scale', TYPES_WITH_PRECISION)
+    def test_quando_valida_array_de_floats_retorna_mesmo_resultado_de_validate_value(
+        self, precision, scale
+    ) -> None:
+        np = pytest.importorskip('numpy')
+        decimal_type = Decimal(precision, scale)
+        values = generate_floats(2000)
+
+        expected = [decimal_type.validate_value(value) for value in values]
+        result = decimal_type.validate_values(np.array(values))
+
+        assert result.tolist() == expected
+
+    @pytest.mark.parametrize('precision, scale', TYPES_WITH_PRECISION)
+    def test_quando_valida_array_de_inteiros_retorna_mesmo_resultado_de_validate_value(
+        self, precision, scale
+    ) -> None:
+        np = pytest.importorskip('numpy')
+        decimal_type = Decimal(precision, scale)
+        entry = np.array([0, 9, -9, 10, -99, 100, 10**precision - 1, -(10**18), 2**63 - 1])
+
+        expected = [decimal_type.validate_value(value) for value in entry.tolist()]
+        result = decimal_type.validate_values(entry)
+
+        assert result.tolist() == expected
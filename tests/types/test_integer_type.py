@@ -77,3 +77,19 @@ class TestInteger:
         result = int_type.validate_value(entry)
 
         assert result == expected
+
+    def test_quando_recebe_2_e_valida_menos_99_int_retorna_True(self) -> None:
+        entry = -99
+        int_type = Integer(2)
+        expected = True
+        result = int_type.validate_value(entry)
+
+        assert result == expected
+
+    def test_quando_recebe_2_e_valida_menos_100_int_retorna_False(self) -> None:
+        entry = -100
+        int_type = Integer(2)
+        expected = False
+        result = int_type.validate_value(entry)
+
+        assert result == expected
@@ -0,0 +1,150 @@
+import datetime
+import decimal
+import sqlite3
+
+import pytest
+
+from src.pysqlquery.types import (
+    Bit,
+    Boolean,
+    Char,
+    Date,
+    DateTime,
+    Decimal,
+    Double,
+    Float,
+    Integer,
+    Real,
+    String,
+    Time,
+)
+from src.pysqlquery.types.exceptions.sql_type import InvalidDialect, NonFiniteLiteral
+
+
+class TestRenderLiteral:
+    @pytest.mark.parametrize(
+        'sql_type, entry, expected',
+        [
+            (Integer(), 42, '42'),
+            (Integer(), -7, '-7'),
+            (Integer(), True, '1'),
+            (Decimal(5, 2), decimal.Decimal('10.50'), '10.50'),
+            (Decimal(5, 2), 10.5, '10.5'),
+            (Double(), 12, '12'),
+            (Float(7, 2), 1212.78, '1212.78'),
+            (Real(), False, '0'),
+            (String(), "O'Hara", "'O''Hara'"),
+            (String(), 'C:\\dir', "'C:\\dir'"),
+            (Char(2), '', "''"),
+            (Boolean(), True, 'TRUE'),
+            (Boolean(), False, 'FALSE'),
+            (Bit(), 1, "B'1'"),
+            (Bit(), False, "B'0'"),
+            (Date(), '2024-01-31', "'2024-01-31'"),
+            (Date(), datetime.date(2024, 1, 31), "'2024-01-31'"),
+            (DateTime(), datetime.datetime(2024, 1, 31, 8, 5, 3, 99), "'2024-01-31 08:05:03'"),
+            (Time(), datetime.time(8, 5), "'08:05:00'"),
+        ],
+    )
+    def test_quando_renderiza_valor_retorna_literal_sql(self, sql_type, entry, expected) -> None:
+        result = sql_type.render_literal(entry)
+
+        assert result == expected
+
+    @pytest.mark.parametrize('sql_type', [Integer(), String(), Boolean(), Date()], ids=str)
+    def test_quando_renderiza_None_retorna_NULL(self, sql_type) -> None:
+        assert sql_type.render_literal(None) == 'NULL'
+
+    @pytest.mark.parametrize(
+        'dialect, expected',
+        [
+            ('ansi', 'TRUE'),
+            ('postgresql', 'TRUE'),
+            ('mysql', 'TRUE'),
+            ('sqlite', '1'),
+            ('sqlserver', '1'),
+            ('oracle', '1'),
+        ],
+    )
+    def test_quando_renderiza_booleano_usa_literal_do_dialeto(self, dialect, expected) -> None:
+        assert Boolean().render_literal(True, dialect) == expected
+
+    def test_quando_dialeto_e_mysql_duplica_as_barras_invertidas(self) -> None:
+        assert String().render_literal("C:\\O'Hara", 'mysql') == "'C:\\\\O''Hara'"
+
+    def test_quando_renderiza_varios_valores_retorna_os_literais_na_ordem(self) -> None:
+        entry = ['a', None, "it's"]
+        expected = ["'a'", 'NULL', "'it''s'"]
+        result = String().render_literals(iter(entry))
+
+        assert result == expected
+
+    @pytest.mark.parametrize('dialect', ['', 'ANSI', 'postgres', None, []])
+    def test_quando_dialeto_e_invalido_lanca_InvalidDialect(self, dialect) -> None:
+        with pytest.raises(InvalidDialect):
+            Integer().render_literal(1, dialect)
+
+        with pytest.raises(InvalidDialect):
+            Integer().render_literals([1], dialect)
+
+    @pytest.mark.parametrize(
+        'dialect, entry, expected',
+        [
+            ('postgresql', float('nan'), "'NaN'::float8"),
+            ('postgresql', float('inf'), "'Infinity'::float8"),
+            ('postgresql', decimal.Decimal('-Infinity'), "'-Infinity'::float8"),
+            ('oracle', float('nan'), 'BINARY_DOUBLE_NAN'),
+            ('oracle', float('-inf'), '-BINARY_DOUBLE_INFINITY'),
+            ('sqlite', float('inf'), '9e999'),
+        ],
+    )
+    def test_quando_numero_nao_e_finito_usa_literal_do_dialeto(
+        self, dialect, entry, expected
+    ) -> None:
+        assert Float().render_literal(entry, dialect) == expected
+
+    @pytest.mark.parametrize(
+        'dialect, entry',
+        [
+            ('ansi', float('inf')),
+            ('mysql', float('nan')),
+            ('sqlserver', float('-inf')),
+            ('sqlite', float('nan')),
+            ('ansi', decimal.Decimal('NaN')),
+        ],
+    )
+    def test_quando_dialeto_nao_tem_literal_do_numero_lanca_NonFiniteLiteral(
+        self, dialect, entry
+    ) -> None:
+        with pytest.raises(NonFiniteLiteral):
+            Float().render_literal(entry, dialect)
+
+        with pytest.raises(NonFiniteLiteral):
+            Decimal().render_literals([1.5, entry], dialect)
+
+    def test_quando_literal_infinito_e_executado_no_sqlite_retorna_infinito(self) -> None:
+        connection = sqlite3.connect(':memory:')
+
+        result = connection.execute(
+            f'SELECT {Float().render_literal(float("-inf"), "sqlite")}'
+        ).fetchone()[0]
+
+        assert result == float('-inf')
+
+    @pytest.mark.parametrize(
+        'sql_type, entry',
+        [
+            (Integer(), -12),
+            (Float(7, 2), 1212.78),
+            (String(), "it's a 'quoted' \\ text"),
+            (Date(), '2024-01-31'),
+            (Boolean(), True),
+        ],
+        ids=str,
+    )
+    def test_quando_literal_e_executado_no_sqlite_retorna_o_valor(self, sql_type, entry) -> None:
+        connection = sqlite3.connect(':memory:')
+
+        result = connection.execute(f'SELECT {sql_type.render_literal(entry, "sqlite")}')
+
+        assert result.fetchone()[0] == entry
@@ -0,0 +1,83 @@
+import pytest
+
+from src.pysqlquery.table import Column
+from src.pysqlquery.types import Char, Date, Decimal, Integer, String
+from src.pysqlquery.types.base import SQLTextType
+from src.pysqlquery.types.exceptions.sql_text_type import InvalidTypeLength
+
+
+class TestSQLTypeMeta:
+    def test_quando_instancia_String_255_duas_vezes_retorna_mesma_instancia(self) -> None:
+        assert String(255) is String(255)
+
+    def test_quando_instancia_Decimal_10_2_duas_vezes_retorna_mesma_instancia(self) -> None:
+        assert Decimal(10, 2) is Decimal(10, 2)
+
+    def test_quando_instancia_Date_duas_vezes_retorna_mesma_instancia(self) -> None:
+        assert Date() is Date()
+
+    def test_quando_Column_recebe_classe_Integer_retorna_instancia_compartilhada(self) -> None:
+        assert Column(Integer).data_type is Integer()
+
+    def test_quando_instancia_com_argumentos_diferentes_retorna_instancias_diferentes(self) -> None:
+        assert String(255) is not String(100)
+
+    def test_quando_instancia_com_True_e_1_retorna_instancias_diferentes(self) -> None:
+        assert Integer(True) is not Integer(1)
+        assert str(Integer(True)) == 'INTEGER(True)'
+        assert str(Integer(1)) == 'INTEGER(1)'
+
+    def test_quando_instancia_com_argumento_nomeado_retorna_tipo_igual(self) -> None:
+        assert String(length=255) == String(255)
+
+    def test_quando_compara_tipos_com_atributos_diferentes_retorna_False(self) -> None:
+        assert Decimal(10, 2) != Decimal(10, 3)
+        assert String(5) != Char(5)
+
+    def test_quando_compara_tipo_com_str_retorna_False(self) -> None:
+        assert String(255) != 'VARCHAR(255)'
+
+    def test_quando_tipos_iguais_retorna_hash_igual(self) -> None:
+        assert hash(String(length=255)) == hash(String(255))
+
+    def test_quando_usa_tipos_como_chave_de_dict_retorna_valor(self) -> None:
+        entry = {String(255): 'text', Decimal(10, 2): 'money'}
+
+        assert entry[String(length=255)] == 'text'
+        assert entry[Decimal(10, 2)] == 'money'
+
+    def test_quando_renderiza_duas_vezes_retorna_mesma_str(self) -> None:
+        entry = Decimal(12, 4)
+
+        assert str(entry) is str(entry)
+
+    def test_quando_instancia_com_argumento_invalido_lanca_excecao_nas_duas_vezes(self) -> None:
+        with pytest.raises(InvalidTypeLength):
+            String(-1)
+
+        with pytest.raises(InvalidTypeLength):
+            String(-1)
+
+    def test_quando_subclasse_chama_super_str_retorna_sua_propria_str(self) -> None:
+        class MyString(String):
+            def __str__(self) -> str:
+                return f'{super().__str__()} BINARY'
+
+        entry = MyString(10)
+
+        assert str(entry) == 'VARCHAR(10) BINARY'
+        assert str(entry) == 'VARCHAR(10) BINARY'
+
+    def test_quando_novo_tipo_recebe_argumento_nao_hashable_retorna_instancias_diferentes(self) -> None:
+        class MyTextualType(SQLTextType):
+            def __init__(self, length: int | None = None, options: list | None = None) -> None:
+                super().__init__('NEWTEXTTYPE', length)
+
+            def __str__(self) -> str:
+                return super().name
+
+            def validate_value(self, value: str) -> bool:
+                return isinstance(value, str)
+
+        assert MyTextualType(10, []) is not MyTextualType(10, [])
+        assert MyTextualType(10, []) == MyTextualType(10, [])
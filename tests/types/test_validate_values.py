@@ -0,0 +1,115 @@
+import array
+import math
+
+import pytest
+
+from src.pysqlquery.types import (
+    Bit,
+    Boolean,
+    Char,
+    Date,
+    Decimal,
+    Double,
+    Float,
+    Integer,
+    Real,
+    String,
+)
+
+SQL_TYPES = [
+    Bit(),
+    Boolean(),
+    Char(),
+    Char(3),
+    String(),
+    String(3),
+    Integer(),
+    Integer(2),
+    Integer(20),
+    Decimal(),
+    Decimal(3),
+    Decimal(3, 1),
+    Double(5, 2),
+    Float(4),
+    Real(10, 3),
+    Date(),
+]
+
+
+class TestValidateValues:
+    def test_quando_valida_lista_de_strings_retorna_lista_de_bool(self) -> None:
+        entry = ['abc', 'abcd', 10]
+        expected = [True, False, False]
+        result = String(3).validate_values(entry)
+
+        assert result == expected
+
+    def test_quando_valida_gerador_retorna_lista_de_bool(self) -> None:
+        entry = (value for value in (10, 100, -99, 1.5))
+        expected = [True, False, True, False]
+        result = Integer(2).validate_values(entry)
+
+        assert result == expected
+
+    def test_quando_valida_memoryview_retorna_mascara(self) -> None:
+        entry = memoryview(array.array('i', [0, 1, 2, -1]))
+        expected = [True, True, False, False]
+        result = Bit().validate_values(entry)
+
+        assert list(result) == expected
+
+    def test_quando_valida_lista_vazia_retorna_lista_vazia(self) -> None:
+        assert Decimal(3, 1).validate_values([]) == []
+
+
+class TestValidateValuesNumPy:
+    @pytest.fixture
+    def np(self):
+        return pytest.importorskip('numpy')
+
+    @pytest.fixture
+    def arrays(self, np):
+        return [
+            np.array([-1000, -100, -99, -10, 0, 1, 9, 10, 99, 100, 12345, 2**40]),
+            np.array([-(2**63), 2**63 - 1], dtype=np.int64),
+            np.array([0, 1, 2, 255], dtype=np.uint8),
+            np.array([-128, -1, 0, 1, 127], dtype=np.int8),
+            np.array([True, False]),
+            np.array(
+                [0.0, -0.0, 1.5, 1.55, 10.25, 99.9, 100.0, 1e16, 1e-5, math.nan, math.inf, -math.inf]
+            ),
+            np.array([1.5, 0.1, 123.456], dtype=np.float32),
+            np.array(['', 'a', 'ab', 'abc', 'abcd', 'a' * 300, '2005-02-27']),
+            np.array([b'a', b'abc']),
+            np.array([1, 'a', 2.5, None, True, '2005-02-27'], dtype=object),
+            np.array(['2005-02-27', '2005-02-28'], dtype='datetime64[D]'),
+            np.array([[0, 1, 100], [-5, 2, 1000]]),
+            np.array([1 + 2j]),
+        ]
+
+    @pytest.mark.parametrize('sql_type', SQL_TYPES, ids=str)
+    def test_quando_valida_array_retorna_mesmo_resultado_de_validate_value(
+        self, sql_type, arrays
+    ) -> None:
+        for entry in arrays:
+            expected = [sql_type.validate_value(value) for value in entry.ravel().tolist()]
+            result = sql_type.validate_values(entry)
+
+            assert result.dtype == bool
+            assert result.shape == entry.shape
+            assert result.ravel().tolist() == expected
+
+    def test_quando_valida_array_de_strings_retorna_array_de_bool(self, np) -> None:
+        entry = np.array(['abc', 'abcd'])
+        expected = [True, False]
+        result = String(3).validate_values(entry)
+
+        assert result.tolist() == expected
+
+    def test_quando_valida_memoryview_retorna_array_numpy(self, np) -> None:
+        entry = memoryview(array.array('d', [1.5, 1.55]))
+        expected = [True, False]
+        result = Decimal(3, 1).validate_values(entry)
+
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == expected
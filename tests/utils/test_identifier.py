@@ -0,0 +1,45 @@
+from src.pysqlquery.utils.identifier import is_valid_identifier
+
+
+class TestIdentifier:
+    def test_quando_valida_created_at_retorna_True(self) -> None:
+        entry = 'created_at'
+        expected = True
+        result = is_valid_identifier(entry)
+
+        assert result == expected
+
+    def test_quando_valida_2created_at_retorna_False(self) -> None:
+        entry = '2created_at'
+        expected = False
+        result = is_valid_identifier(entry)
+
+        assert result == expected
+
+    def test_quando_valida__created_at_retorna_False(self) -> None:
+        entry = '_created_at'
+        expected = False
+        result = is_valid_identifier(entry)
+
+        assert result == expected
+
+    def test_quando_valida__created_at_permitindo_underscore_inicial_retorna_True(self) -> None:
+        entry = '_created_at'
+        expected = True
+        result = is_valid_identifier(entry, allow_leading_underscore=True)
+
+        assert result == expected
+
+    def test_quando_valida_123_int_retorna_False(self) -> None:
+        entry = 123
+        expected = False
+        result = is_valid_identifier(entry)
+
+        assert result == expected
+
+    def test_quando_valida_lista_retorna_False(self) -> None:
+        entry = ['created_at']
+        expected = False
+        result = is_valid_identifier(entry)
+
+        assert result == expected
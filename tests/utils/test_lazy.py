@@ -0,0 +1,90 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import src.pysqlquery as pysqlquery
+from src.pysqlquery import constraints, table, types
+from src.pysqlquery.types.integer import Integer
+
+SRC_PATH = Path(__file__).resolve().parents[2] / 'src'
+
+
+def get_loaded_modules(statement: str) -> set[str]:
+    code = (
+        f'import sys; sys.path.insert(0, {str(SRC_PATH)!r}); {statement}; '
+        'print(*sys.modules)'
+    )
+    process = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+
+    return set(process.stdout.split())
+
+
+class TestLazy:
+    def test_quando_importa_pysqlquery_nao_carrega_subpacotes(self) -> None:
+        result = get_loaded_modules('import pysqlquery')
+
+        assert 'pysqlquery' in result
+        assert 'pysqlquery.table' not in result
+        assert 'pysqlquery.types' not in result
+        assert 'pysqlquery.constraints' not in result
+
+    def test_quando_importa_Integer_nao_carrega_outros_tipos_nem_tabela(self) -> None:
+        result = get_loaded_modules('from pysqlquery import Integer')
+
+        assert 'pysqlquery.types.integer' in result
+        assert 'pysqlquery.types.string' not in result
+        assert 'pysqlquery.table' not in result
+
+    def test_quando_importa_Table_nao_carrega_multiprocessing(self) -> None:
+        result = get_loaded_modules('from pysqlquery import Table')
+
+        assert 'pysqlquery.table.table' in result
+        assert 'multiprocessing' not in result
+        assert 'concurrent.futures' not in result
+
+    def test_quando_acessa_Integer_retorna_classe_do_modulo(self) -> None:
+        assert pysqlquery.Integer is Integer
+        assert types.Integer is Integer
+
+    def test_quando_acessa_subpacote_como_atributo_retorna_o_subpacote(self) -> None:
+        code = (
+            f'import sys; sys.path.insert(0, {str(SRC_PATH)!r}); import pysqlquery; '
+            'print(pysqlquery.types.Integer.__module__, pysqlquery.table.Table.__name__, '
+            'pysqlquery.constraints.ForeignKey.__name__, pysqlquery.utils.__name__)'
+        )
+
+        process = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True
+        )
+
+        assert process.stdout.split() == [
+            'pysqlquery.types.integer',
+            'Table',
+            'ForeignKey',
+            'pysqlquery.utils',
+        ]
+
+    def test_quando_acessa_modulo_do_pacote_como_atributo_retorna_o_modulo(self) -> None:
+        assert types.integer.Integer is Integer
+        assert table.table.Table is table.Table
+
+    def test_quando_acessa_nome_inexistente_lanca_AttributeError(self) -> None:
+        with pytest.raises(AttributeError):
+            types.NotAType
+
+        with pytest.raises(AttributeError):
+            pysqlquery.not_a_module
+
+    def test_quando_chama_dir_retorna_nomes_publicos(self) -> None:
+        assert set(pysqlquery.__all__) <= set(dir(pysqlquery))
+        assert set(table.__all__) <= set(dir(table))
+        assert {'ForeignKey', 'UniqueConstraint'} <= set(dir(constraints))
+
+    @pytest.mark.parametrize('package', [pysqlquery, constraints, table, types])
+    def test_quando_acessa_todos_os_nomes_publicos_retorna_objetos(self, package) -> None:
+        for name in package.__all__:
+            assert getattr(package, name).__name__ == name